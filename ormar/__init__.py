@@ -73,8 +73,22 @@ from ormar.fields import (
 )
 
 # noqa: I100
-from ormar.models import ExcludableItems, Extra, Model, OrmarConfig
-from ormar.queryset import OrderAction, QuerySet, and_, or_
+from ormar.models import (
+    BatchLoader,
+    ExcludableItems,
+    Extra,
+    Model,
+    OrmarConfig,
+    Session,
+)
+from ormar.queryset import (
+    ExportFormat,
+    OrderAction,
+    QuerySet,
+    ReplicaPolicy,
+    and_,
+    or_,
+)
 from ormar.relations import RelationType
 from ormar.signals import Signal
 
@@ -109,6 +123,10 @@ __all__ = [
     "ForeignKey",
     "QuerySet",
     "RelationType",
+    "ReplicaPolicy",
+    "ExportFormat",
+    "Session",
+    "BatchLoader",
     "Undefined",
     "UUID",
     "UniqueColumns",
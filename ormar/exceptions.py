@@ -87,3 +87,21 @@ class ModelListEmptyError(AsyncOrmException):
     """
 
     pass
+
+
+class NPlusOneError(AsyncOrmException):
+    """
+    Raised by NPlusOneDetector when repeated similar queries are detected
+    and raise_error flag is set.
+    """
+
+    pass
+
+
+class DatabasesVersionError(AsyncOrmException):
+    """
+    Raised when installed version of databases does not provide the internals
+    of connections and transactions used by ormar.
+    """
+
+    pass
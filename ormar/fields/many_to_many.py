@@ -329,6 +329,8 @@ class ManyToManyField(  # type: ignore
             tablename=table_name,
             database=self.owner.ormar_config.database,
             metadata=self.owner.ormar_config.metadata,
+            read_replicas=self.owner.ormar_config.read_replicas,
+            replica_policy=self.owner.ormar_config.replica_policy,
         )
         through_model = type(
             class_name,
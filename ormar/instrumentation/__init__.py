@@ -0,0 +1,28 @@
+"""
+Instrumentation of queries issued by QuerySet, Model and prefetch queries.
+Registered instruments receive an event with timing breakdown of each operation.
+"""
+
+from ormar.instrumentation.event import QueryEvent
+from ormar.instrumentation.nplusone import NPlusOneDetector
+from ormar.instrumentation.operation import (
+    Instrument,
+    Operation,
+    add_instrument,
+    operation,
+    phase,
+    remove_instrument,
+    track,
+)
+
+__all__ = [
+    "Instrument",
+    "NPlusOneDetector",
+    "Operation",
+    "QueryEvent",
+    "add_instrument",
+    "operation",
+    "phase",
+    "remove_instrument",
+    "track",
+]
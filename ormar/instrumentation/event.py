@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+
+
+class QueryEvent:
+    """
+    Describes one finished operation of QuerySet, Model or prefetch query,
+    passed to registered instruments.
+
+    Durations are in seconds, `phases` holds time spent in each of the phases
+    of the operation:
+
+    * build - building the sql expression
+    * execute - waiting for the database
+    * hydrate - constructing models from the rows
+    * merge - merging models constructed from rows of the same main model
+    * prefetch - running prefetch queries for prefetch_related
+
+    If the operation was issued through relation of a model (i.e. `author.posts.all()`)
+    `relation` holds the path of the relation (i.e. `Author.posts`).
+    """
+
+    def __init__(
+        self,
+        model: Type["Model"],
+        operation: str,
+        expressions: List[Any],
+        rows: Optional[int],
+        duration: float,
+        phases: Dict[str, float],
+        error: Optional[BaseException] = None,
+        relation: Optional[str] = None,
+    ) -> None:
+        self.model = model
+        self.operation = operation
+        self.expressions = expressions
+        self.rows = rows
+        self.duration = duration
+        self.phases = phases
+        self.error = error
+        self.relation = relation
+
+    @property
+    def statements(self) -> List[str]:
+        """
+        Sql statements issued by the operation, compiled for the dialect
+        of the model database (with placeholders for parameters).
+
+        :return: sql statements
+        :rtype: List[str]
+        """
+        dialect = self.model.ormar_config.database._backend._dialect
+        return [str(expr.compile(dialect=dialect)) for expr in self.expressions]
+
+    @property
+    def sql(self) -> str:
+        """
+        Sql text of all statements issued by the operation.
+
+        :return: sql statements separated with semicolons
+        :rtype: str
+        """
+        return ";\n".join(self.statements)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"QueryEvent(model={self.model.__name__}, operation={self.operation}, "
+            f"rows={self.rows}, duration={self.duration:.6f}, phases={self.phases})"
+        )
@@ -0,0 +1,122 @@
+import warnings
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Tuple
+
+from ormar.exceptions import NPlusOneError
+from ormar.instrumentation.event import QueryEvent
+from ormar.instrumentation.operation import add_instrument, remove_instrument
+from ormar.warnings import NPlusOneWarning
+
+READ_OPERATIONS = {
+    "all",
+    "avg",
+    "count",
+    "dump",
+    "exists",
+    "first",
+    "get",
+    "load",
+    "max",
+    "min",
+    "sum",
+    "values",
+}
+
+_current_detector: ContextVar[Optional["NPlusOneDetector"]] = ContextVar(
+    "ormar_nplusone_detector", default=None
+)
+
+
+class NPlusOneDetector:
+    """
+    Instrument detecting N+1 query patterns - the same read query issued
+    over and over, differing only in parameters (i.e. foreign key values),
+    which happens when relations of many models are loaded one by one.
+
+    Detector is active inside `with NPlusOneDetector():` block, it's kept in a
+    context variable so only queries of the current task (and tasks created in it)
+    are counted.
+
+    When the same query is repeated `threshold` times, a NPlusOneWarning is issued
+    (or NPlusOneError raised if `raise_error` is set) with the relation path and
+    a suggestion how to load the models in one query.
+    """
+
+    def __init__(self, threshold: int = 3, raise_error: bool = False) -> None:
+        self.threshold = threshold
+        self.raise_error = raise_error
+        self.counts: Dict[Tuple, int] = {}
+        self.reports: List[str] = []
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "NPlusOneDetector":
+        if not self._tokens:
+            add_instrument(self)
+        self._tokens.append(_current_detector.set(self))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        _current_detector.reset(self._tokens.pop())
+        if not self._tokens:
+            remove_instrument(self)
+
+    def __call__(self, event: QueryEvent) -> None:
+        """
+        Counts read queries issued in the context of the detector.
+
+        :param event: event of finished operation
+        :type event: QueryEvent
+        :raises NPlusOneError: if repeated query is detected and raise_error is set
+        """
+        if (
+            _current_detector.get() is not self
+            or event.operation not in READ_OPERATIONS
+            or event.error is not None
+        ):
+            return
+        key = (event.model, event.operation, event.relation, event.sql)
+        count = self.counts.get(key, 0) + 1
+        self.counts[key] = count
+        if count != self.threshold:
+            return
+        message = self._describe(event)
+        self.reports.append(message)
+        if self.raise_error:
+            raise NPlusOneError(message)
+        warnings.warn(message, NPlusOneWarning, stacklevel=2)
+
+    def _describe(self, event: QueryEvent) -> str:
+        """
+        Builds the message describing repeated query with a suggestion
+        how to avoid it.
+
+        :param event: event of repeated operation
+        :type event: QueryEvent
+        :return: message
+        :rtype: str
+        """
+        model_name = event.model.__name__
+        if event.relation:
+            owner, relation_name = event.relation.split(".", 1)
+            return (
+                f"Possible N+1 queries: {model_name} models are loaded through "
+                f"{event.relation} relation one parent at a time "
+                f"({self.threshold} similar queries). Load the relation together "
+                f"with {owner} models with "
+                f'prefetch_related("{relation_name}") or '
+                f'select_related("{relation_name}").'
+            )
+        if event.operation == "load":
+            return (
+                f"Possible N+1 queries: {model_name} models are loaded one by one "
+                f"with load() ({self.threshold} similar queries). Load them together "
+                f"with the models referring to them with select_related or "
+                f"prefetch_related of the relation leading to {model_name}."
+            )
+        return (
+            f"Possible N+1 queries: {self.threshold} similar {event.operation} "
+            f"queries of {model_name} models differing only in parameters. "
+            f"Load the models with one query (i.e. filter with __in) or with "
+            f"select_related or prefetch_related of the relation leading to "
+            f"{model_name}."
+        )
@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import time
+from contextvars import ContextVar, Token
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from ormar.exceptions import NPlusOneError
+from ormar.instrumentation.event import QueryEvent
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+
+Instrument = Callable[[QueryEvent], Any]
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+_instruments: List[Instrument] = []
+_current_operation: ContextVar[Optional["Operation"]] = ContextVar(
+    "ormar_operation", default=None
+)
+
+
+def add_instrument(instrument: Instrument) -> None:
+    """
+    Registers instrument called with events of operations of all models.
+
+    :param instrument: callable receiving QueryEvent
+    :type instrument: Callable[[QueryEvent], Any]
+    """
+    if instrument not in _instruments:
+        _instruments.append(instrument)
+
+
+def remove_instrument(instrument: Instrument) -> None:
+    """
+    Removes globally registered instrument.
+
+    :param instrument: previously registered instrument
+    :type instrument: Callable[[QueryEvent], Any]
+    """
+    if instrument in _instruments:
+        _instruments.remove(instrument)
+
+
+class Phase:
+    """
+    Measures time spent in one phase of the operation, adds it to the
+    already measured time of the phase with the same name.
+    """
+
+    __slots__ = ("phases", "name", "start", "paused")
+
+    def __init__(self, phases: Dict[str, float], name: str) -> None:
+        self.phases = phases
+        self.name = name
+        self.start = 0.0
+        self.paused = 0.0
+
+    def __enter__(self) -> "Phase":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        duration = time.perf_counter() - self.start - self.paused
+        self.phases[self.name] = self.phases.get(self.name, 0.0) + duration
+
+    async def yield_to_loop(self) -> None:
+        """
+        Lets other tasks run in the middle of the phase,
+        time spent waiting for the event loop is not counted in the phase.
+        """
+        start = time.perf_counter()
+        await asyncio.sleep(0)
+        self.paused += time.perf_counter() - start
+
+
+class NullContext:
+    """
+    Context manager doing nothing, used when no instrument is registered.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "NullContext":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    async def yield_to_loop(self) -> None:
+        """
+        Lets other tasks run.
+        """
+        await asyncio.sleep(0)
+
+
+NULL_CONTEXT = NullContext()
+
+
+class Operation:
+    """
+    Collects statements, number of rows and durations of phases of one operation
+    and emits QueryEvent to instruments when the operation finishes.
+
+    Active operation is kept in a context variable, so code called inside the
+    operation records phases and statements with `phase()` and `track()` functions,
+    without passing the operation around.
+    """
+
+    def __init__(
+        self,
+        model: Type["Model"],
+        name: str,
+        instruments: List[Instrument],
+        relation: Optional[str] = None,
+    ) -> None:
+        self.model = model
+        self.name = name
+        self.relation = relation
+        self.instruments = instruments
+        self.expressions: List[Any] = []
+        self.rows: Optional[int] = None
+        self.phases: Dict[str, float] = {}
+        self._start = 0.0
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> "Operation":
+        self._token = _current_operation.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self, exc_type: Any, exc: Optional[BaseException], traceback: Any
+    ) -> None:
+        duration = time.perf_counter() - self._start
+        _current_operation.reset(self._token)  # type: ignore
+        event = QueryEvent(
+            model=self.model,
+            operation=self.name,
+            expressions=self.expressions,
+            rows=self.rows,
+            duration=duration,
+            phases=self.phases,
+            error=exc,
+            relation=self.relation,
+        )
+        self._emit(event)
+
+    def _emit(self, event: QueryEvent) -> None:
+        """
+        Calls all instruments with the event. Exceptions raised by instruments
+        are logged and do not stop other instruments nor fail the operation,
+        apart from NPlusOneError raised on purpose by NPlusOneDetector,
+        which is raised after all instruments are called.
+
+        :param event: event of finished operation
+        :type event: QueryEvent
+        :raises NPlusOneError: if raised by one of the instruments
+        """
+        detected: Optional[NPlusOneError] = None
+        for instrument in self.instruments:
+            try:
+                instrument(event)
+            except NPlusOneError as e:
+                detected = detected or e
+            except Exception:
+                logger.exception(
+                    "Instrument %r failed on %s of %s",
+                    instrument,
+                    self.name,
+                    self.model.get_name(),
+                )
+        if detected is not None:
+            raise detected
+
+    def record(self, expression: Any, rows: Optional[int]) -> None:
+        """
+        Registers statement issued by the operation.
+
+        :param expression: issued sqlalchemy expression
+        :type expression: Any
+        :param rows: number of returned rows, None if the statement returns no rows
+        :type rows: Optional[int]
+        """
+        self.expressions.append(expression)
+        if rows is not None:
+            self.rows = (self.rows or 0) + rows
+
+
+def operation(
+    model: Type["Model"], name: str, relation: Optional[str] = None
+) -> Union[Operation, NullContext]:
+    """
+    Returns context manager instrumenting the operation on given model.
+
+    If no instrument is registered (globally or in OrmarConfig of the model),
+    or the same operation is already running (i.e. get calling filter().get()),
+    a context doing nothing is returned.
+
+    :param model: model class the operation runs on
+    :type model: Type[Model]
+    :param name: name of the operation
+    :type name: str
+    :param relation: path of the relation the operation was issued through
+    :type relation: Optional[str]
+    :return: operation context manager
+    :rtype: Union[Operation, NullContext]
+    """
+    current = _current_operation.get()
+    if current is not None and current.model is model and current.name == name:
+        return NULL_CONTEXT
+    instruments = model.ormar_config.instruments
+    if _instruments:
+        instruments = [*_instruments, *instruments]
+    if not instruments:
+        return NULL_CONTEXT
+    return Operation(model=model, name=name, instruments=instruments, relation=relation)
+
+
+def phase(name: str) -> Union[Phase, NullContext]:
+    """
+    Returns context manager measuring the phase of currently running operation.
+
+    :param name: name of the phase
+    :type name: str
+    :return: phase context manager
+    :rtype: Union[Phase, NullContext]
+    """
+    current = _current_operation.get()
+    if current is None:
+        return NULL_CONTEXT
+    return Phase(phases=current.phases, name=name)
+
+
+async def track(awaitable: Awaitable[R], expression: Any) -> R:
+    """
+    Awaits the database call as execute phase of currently running operation
+    and records the issued statement with number of returned rows.
+
+    :param awaitable: database call
+    :type awaitable: Awaitable
+    :param expression: issued sqlalchemy expression
+    :type expression: Any
+    :return: result of the database call
+    :rtype: Any
+    """
+    current = _current_operation.get()
+    if current is None:
+        return await awaitable
+    with Phase(phases=current.phases, name="execute"):
+        result = await awaitable
+    current.record(
+        expression=expression, rows=len(result) if isinstance(result, list) else None
+    )
+    return result
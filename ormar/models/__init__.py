@@ -10,6 +10,8 @@ from ormar.models.model import Model, T  # noqa I100
 from ormar.models.excludable import ExcludableItems  # noqa I100
 from ormar.models.utils import Extra  # noqa I100
 from ormar.models.ormar_config import OrmarConfig  # noqa I100
+from ormar.models.session import Session  # noqa I100
+from ormar.models.batch_loader import BatchLoader  # noqa I100
 
 __all__ = [
     "NewBaseModel",
@@ -19,4 +21,6 @@ __all__ = [
     "T",
     "Extra",
     "OrmarConfig",
+    "Session",
+    "BatchLoader",
 ]
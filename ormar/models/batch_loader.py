@@ -0,0 +1,307 @@
+import asyncio
+from contextvars import ContextVar, Token
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
+
+import ormar  # noqa: I100
+from ormar.instrumentation import operation, phase, track
+from ormar.queryset.utils import get_bulk_batch_size
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import ManyToManyField, Model
+    from ormar.relations.querysetproxy import QuerysetProxy
+
+    BatchFunction = Callable[[List[Any]], Awaitable[List[Any]]]
+
+_current_loader: ContextVar[Optional["BatchLoader"]] = ContextVar(
+    "ormar_batch_loader", default=None
+)
+
+
+class BatchLoader:
+    """
+    Coalesces lazy loads issued concurrently (i.e. with `asyncio.gather`)
+    in one iteration of the event loop into single queries, similar to DataLoader.
+
+    BatchLoader is active inside `with BatchLoader():` block, it's kept in a
+    context variable so it's scoped to the current task (and tasks created in it).
+
+    While loader is active:
+
+    * `Model.load()` calls for models of the same class are loaded with one
+      `pk IN (...)` query
+    * `all()` calls without filters on the same reverse foreign key or
+      many to many relation of models of the same class are loaded with one
+      `IN (...)` query and distributed to the parent models
+    """
+
+    def __init__(self) -> None:
+        self._batches: Dict[Tuple, List[Tuple[Any, asyncio.Future]]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "BatchLoader":
+        self._tokens.append(_current_loader.set(self))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        _current_loader.reset(self._tokens.pop())
+
+    @staticmethod
+    def current() -> Optional["BatchLoader"]:
+        """
+        Returns the batch loader active in current context.
+
+        :return: active loader if any
+        :rtype: Optional[BatchLoader]
+        """
+        return _current_loader.get()
+
+    async def load_row(self, instance: "Model") -> Optional[Any]:
+        """
+        Returns the row of the model from the database, loaded together
+        with rows of other models of the same class requested in the same
+        iteration of the event loop.
+
+        :param instance: model to load
+        :type instance: Model
+        :return: row of the model or None if it does not exist
+        :rtype: Optional[Row]
+        """
+        return await self._enqueue(
+            key=("load", instance.__class__),
+            item=instance,
+            batch_function=self._fetch_rows,
+        )
+
+    async def load_relation(self, proxy: "QuerysetProxy") -> List["Model"]:
+        """
+        Returns the models related to the owner of the proxy, loaded together
+        with models of the same relation of other owners requested
+        in the same iteration of the event loop.
+
+        :param proxy: queryset proxy of the relation
+        :type proxy: QuerysetProxy
+        :return: related models
+        :rtype: List[Model]
+        """
+        return await self._enqueue(
+            key=("relation", proxy._owner.__class__, proxy.relation.field_name),
+            item=proxy,
+            batch_function=self._fetch_related,
+        )
+
+    async def _enqueue(
+        self, key: Tuple, item: Any, batch_function: "BatchFunction"
+    ) -> Any:
+        """
+        Adds the item to the batch with given key and waits for its result.
+
+        First item of the batch schedules its dispatch, so the batch collects items
+        added until all already scheduled callbacks of event loop are run.
+
+        :param key: key of the batch
+        :type key: Tuple
+        :param item: item to load
+        :type item: Any
+        :param batch_function: function loading results for list of items
+        :type batch_function: BatchFunction
+        :return: result for the item
+        :rtype: Any
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = []
+            loop.call_soon(self._dispatch, key, batch_function)
+        future = loop.create_future()
+        batch.append((item, future))
+        return await future
+
+    def _dispatch(self, key: Tuple, batch_function: "BatchFunction") -> None:
+        """
+        Starts loading of the batch with given key.
+
+        :param key: key of the batch
+        :type key: Tuple
+        :param batch_function: function loading results for list of items
+        :type batch_function: BatchFunction
+        """
+        batch = self._batches.pop(key)
+        task = asyncio.ensure_future(self._run(batch, batch_function))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run(
+        batch: List[Tuple[Any, asyncio.Future]], batch_function: "BatchFunction"
+    ) -> None:
+        """
+        Loads results for all items of the batch and sets them on waiting futures.
+
+        :param batch: items with futures waiting for results
+        :type batch: List[Tuple[Any, asyncio.Future]]
+        :param batch_function: function loading results for list of items
+        :type batch_function: BatchFunction
+        """
+        try:
+            results = await batch_function([item for item, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    async def _fetch_rows(instances: List["Model"]) -> List[Optional[Any]]:
+        """
+        Fetches rows of the models by primary keys.
+
+        :param instances: models of one class to load
+        :type instances: List[Model]
+        :return: rows in order of the passed models
+        :rtype: List[Optional[Row]]
+        """
+        model_cls = instances[0].__class__
+        database = model_cls.ormar_config.database
+        pk_column = instances[0].pk_column
+        pks = list({instance.pk for instance in instances})
+        batch_size = get_bulk_batch_size(database=database, params_per_row=1)
+        rows: Dict[Any, Any] = {}
+        with operation(model_cls, "load"):
+            for start in range(0, len(pks), batch_size):
+                with phase("build"):
+                    expr = model_cls.ormar_config.table.select().where(
+                        pk_column.in_(pks[start : start + batch_size])
+                    )
+                for row in await track(database.fetch_all(expr), expr):
+                    rows[row[pk_column.name]] = row
+        return [rows.get(instance.pk) for instance in instances]
+
+    async def _fetch_related(
+        self, proxies: List["QuerysetProxy"]
+    ) -> List[List["Model"]]:
+        """
+        Fetches models related to owners of the proxies through one relation.
+
+        :param proxies: queryset proxies of the same relation of different owners
+        :type proxies: List[QuerysetProxy]
+        :return: related models in order of the passed proxies
+        :rtype: List[List[Model]]
+        """
+        proxy = proxies[0]
+        pks = list({item._owner.pk for item in proxies})
+        batch_size = get_bulk_batch_size(
+            database=proxy.to.ormar_config.database, params_per_row=1
+        )
+        related: Dict[Any, List["Model"]] = {}
+        is_multiple = proxy.type_ == ormar.RelationType.MULTIPLE
+        # queries of the batch are reported as one operation of the queried model
+        # (through model for many to many relations) with the path of the relation
+        model_cls = proxy.relation.through if is_multiple else proxy.to
+        relation = f"{proxy._owner.__class__.__name__}.{proxy.relation.field_name}"
+        with operation(model_cls, "all", relation=relation):
+            for start in range(0, len(pks), batch_size):
+                batch = pks[start : start + batch_size]
+                if is_multiple:
+                    await self._fetch_many_to_many(
+                        proxy=proxy, pks=batch, related=related
+                    )
+                else:
+                    await self._fetch_reverse(proxy=proxy, pks=batch, related=related)
+        return [list(related.get(item._owner.pk, [])) for item in proxies]
+
+    @staticmethod
+    async def _fetch_reverse(
+        proxy: "QuerysetProxy", pks: List[Any], related: Dict[Any, List["Model"]]
+    ) -> None:
+        """
+        Fetches models related through reverse foreign key to models with given pks
+        and groups them by the pk of the owner model.
+
+        :param proxy: queryset proxy of the relation
+        :type proxy: QuerysetProxy
+        :param pks: primary keys of owner models
+        :type pks: List[Any]
+        :param related: dictionary of related models by owner pk to fill
+        :type related: Dict[Any, List[Model]]
+        """
+        owner_cls = cast(Type["Model"], proxy._owner.__class__)
+        pkname = owner_cls.get_column_alias(owner_cls.ormar_config.pkname)
+        filters: Dict[str, Any] = {f"{proxy.related_field_name}__{pkname}__in": pks}
+        children = await (
+            ormar.QuerySet(
+                model_cls=proxy.to,
+                proxy_source_model=owner_cls,
+                proxy_relation_name=proxy.relation.field_name,
+            )
+            .select_related(proxy.related_field_name)
+            .filter(**filters)
+            .all()
+        )
+        for child in children:
+            owner = getattr(child, proxy.related_field_name)
+            related.setdefault(owner.pk, []).append(child)
+
+    @staticmethod
+    async def _fetch_many_to_many(
+        proxy: "QuerysetProxy", pks: List[Any], related: Dict[Any, List["Model"]]
+    ) -> None:
+        """
+        Fetches models related through many to many relation to models with given
+        pks and groups them by the pk of the owner model.
+
+        Query is issued on the through model, so each related model gets the
+        through model instance of the link with its owner.
+
+        :param proxy: queryset proxy of the relation
+        :type proxy: QuerysetProxy
+        :param pks: primary keys of owner models
+        :type pks: List[Any]
+        :param related: dictionary of related models by owner pk to fill
+        :type related: Dict[Any, List[Model]]
+        """
+        through_model: Type["Model"] = proxy.relation.through
+        related_field = cast("ManyToManyField", proxy.related_field)
+        owner_column = related_field.default_target_field_name()
+        child_column = related_field.default_source_field_name()
+        owner_cls = cast(Type["Model"], proxy._owner.__class__)
+        pkname = owner_cls.get_column_alias(owner_cls.ormar_config.pkname)
+        order_bys = [
+            (
+                f"-{child_column}__{order_by[1:]}"
+                if order_by.startswith("-")
+                else f"{child_column}__{order_by}"
+            )
+            for order_by in proxy.to.ormar_config.orders_by
+        ]
+        filters: Dict[str, Any] = {f"{owner_column}__{pkname}__in": pks}
+        links = await (
+            ormar.QuerySet(model_cls=through_model)
+            .select_related(child_column)
+            .filter(**filters)
+            .order_by(order_bys)
+            .all()
+        )
+        for link in links:
+            child = getattr(link, child_column)
+            through = through_model(
+                **link.model_dump(exclude=link.extract_related_names())
+            )
+            setattr(child, proxy.through_model_name, through)
+            child.set_save_status(True)
+            related.setdefault(getattr(link, owner_column).pk, []).append(child)
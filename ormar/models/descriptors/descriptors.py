@@ -21,7 +21,7 @@ class PydanticDescriptor:
 
     def __set__(self, instance: "Model", value: Any) -> None:
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance.mark_field_changed(self.name)
 
 
 class JsonDescriptor:
@@ -39,7 +39,7 @@ class JsonDescriptor:
     def __set__(self, instance: "Model", value: Any) -> None:
         value = encode_json(value)
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance.mark_field_changed(self.name)
 
 
 class BytesDescriptor:
@@ -69,7 +69,7 @@ class BytesDescriptor:
                 value=value, represent_as_string=field.represent_as_base64_str
             )
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance.mark_field_changed(self.name)
 
 
 class PkDescriptor:
@@ -87,7 +87,7 @@ class PkDescriptor:
 
     def __set__(self, instance: "Model", value: Any) -> None:
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance.mark_field_changed(self.name)
 
 
 class RelationDescriptor:
@@ -111,4 +111,4 @@ class RelationDescriptor:
         )
 
         if not isinstance(instance.__dict__.get(self.name), list):
-            instance.set_save_status(False)
+            instance.mark_field_changed(self.name)
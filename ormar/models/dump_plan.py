@@ -0,0 +1,317 @@
+import copy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import ormar  # noqa: I100
+from ormar.queryset.utils import translate_list_to_dict
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Converts nested include/exclude/relation map structure into hashable one,
+    that keeps the distinction between sets and dictionaries.
+
+    :param value: include, exclude or relation map value
+    :type value: Any
+    :return: hashable representation of the value
+    :rtype: Any
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return set, frozenset(value)
+    if isinstance(value, (list, tuple)):
+        return list, tuple(_freeze(item) for item in value)
+    return value
+
+
+def _convert_all(items: Union[Set, Dict, None]) -> Union[Set, Dict, None]:
+    """
+    Helper to convert __all__ pydantic special index to ormar which does not
+    support index based exclusions.
+
+    :param items: current include/exclude value
+    :type items: Union[Set, Dict, None]
+    :return: value of __all__ key if present, else items
+    :rtype: Union[Set, Dict, None]
+    """
+    if isinstance(items, dict) and "__all__" in items:
+        return items.get("__all__")
+    return items
+
+
+class ModelDumpPlan:
+    """
+    Precomputed instructions how to dump a model to dictionary in model_dump().
+
+    Resolved once for a model class and combination of include, exclude,
+    relation map and flags (fields excluded from pydantic dump, base64 fields,
+    not excluded relations with include/exclude of nested models) and later
+    applied to each dumped instance.
+
+    Plans of nested models are resolved lazily and kept on the relations,
+    so dumping a list of models resolves the whole tree only once.
+    """
+
+    # shared cache of resolved plans keyed by model and dump params
+    plans: Dict[Tuple, "ModelDumpPlan"] = dict()
+    max_plans: int = 512
+
+    __slots__ = (
+        "include",
+        "pydantic_exclude",
+        "base64_fields",
+        "relations",
+        "through_fields",
+        "exclude_list",
+        "custom_dump",
+    )
+
+    def __init__(  # noqa: CFQ002
+        self,
+        model_cls: Type["Model"],
+        include: Union[Set, Dict, None],
+        exclude: Union[Set, Dict, None],
+        relation_map: Optional[Dict],
+        exclude_primary_keys: bool,
+        exclude_through_models: bool,
+        exclude_list: bool,
+    ) -> None:
+        model_fields = model_cls.ormar_config.model_fields
+        self.include = include
+        self.pydantic_exclude = model_cls._update_excluded_with_pks_and_through(
+            exclude=model_cls._update_excluded_with_related(exclude),
+            exclude_primary_keys=exclude_primary_keys,
+            exclude_through_models=exclude_through_models,
+        )
+        self.base64_fields = [
+            name
+            for name in model_cls._bytes_fields
+            if model_fields[name].represent_as_base64_str
+        ]
+        self.exclude_list = exclude_list
+        # models overriding model_dump() have to be dumped with their own method
+        self.custom_dump = model_cls.model_dump is not ormar.Model.model_dump
+
+        include_dict = (
+            translate_list_to_dict(include) if isinstance(include, Set) else include
+        )
+        exclude_dict = (
+            translate_list_to_dict(exclude) if isinstance(exclude, Set) else exclude
+        )
+        relation_map = (
+            relation_map
+            if relation_map is not None
+            else translate_list_to_dict(model_cls._iterate_related_models())
+        )
+
+        self.relations: List[RelationDumpPlan] = []
+        if relation_map:
+            for name in model_cls._get_not_excluded_fields(
+                fields=model_cls.extract_related_names(),
+                include=include_dict,
+                exclude=exclude_dict,
+            ):
+                if name not in relation_map:
+                    continue
+                self.relations.append(
+                    RelationDumpPlan(
+                        name=name,
+                        include=_convert_all(
+                            model_cls._skip_ellipsis(include_dict, name)
+                        ),
+                        exclude=_convert_all(
+                            model_cls._skip_ellipsis(exclude_dict, name)
+                        ),
+                        relation_map=cast(
+                            Dict,
+                            model_cls._skip_ellipsis(
+                                relation_map, name, default_return=dict()
+                            ),
+                        ),
+                        exclude_primary_keys=exclude_primary_keys,
+                        exclude_through_models=exclude_through_models,
+                    )
+                )
+
+        # through models populated on the model when it's dumped as nested one
+        self.through_fields = [
+            name
+            for name in model_cls._get_not_excluded_fields(
+                fields=model_cls.extract_through_names(),
+                include=include_dict,
+                exclude=exclude_dict,
+            )
+            if model_fields[name].related_name not in relation_map
+        ]
+
+    @classmethod
+    def get(  # noqa: CFQ002
+        cls,
+        model_cls: Type["Model"],
+        include: Union[Set, Dict, None],
+        exclude: Union[Set, Dict, None],
+        relation_map: Optional[Dict],
+        exclude_primary_keys: bool,
+        exclude_through_models: bool,
+        exclude_list: bool,
+    ) -> "ModelDumpPlan":
+        """
+        Returns cached plan for given params or resolves and caches a new one,
+        evicting the oldest entry if cache is full.
+
+        Params that cannot be hashed (i.e. with custom objects inside) are
+        resolved each time and not cached.
+
+        :param model_cls: dumped model class
+        :type model_cls: Type[Model]
+        :param include: fields to include
+        :type include: Union[Set, Dict, None]
+        :param exclude: fields to exclude
+        :type exclude: Union[Set, Dict, None]
+        :param relation_map: map of the relations to follow to avoid circular deps
+        :type relation_map: Optional[Dict]
+        :param exclude_primary_keys: flag to exclude primary keys from dict
+        :type exclude_primary_keys: bool
+        :param exclude_through_models: flag to exclude through models from dict
+        :type exclude_through_models: bool
+        :param exclude_list: flag to exclude lists of nested values models from dict
+        :type exclude_list: bool
+        :return: plan of dumping the model
+        :rtype: ModelDumpPlan
+        """
+        key: Optional[Tuple] = (
+            model_cls,
+            _freeze(include),
+            _freeze(exclude),
+            _freeze(relation_map),
+            exclude_primary_keys,
+            exclude_through_models,
+            exclude_list,
+        )
+        try:
+            plan = cls.plans.get(cast(Tuple, key))
+        except TypeError:  # pragma no cover
+            key, plan = None, None
+        if plan is None:
+            # copies, as passed dictionaries can be modified after the call
+            plan = cls(
+                model_cls=model_cls,
+                include=copy.deepcopy(include),
+                exclude=copy.deepcopy(exclude),
+                relation_map=copy.deepcopy(relation_map),
+                exclude_primary_keys=exclude_primary_keys,
+                exclude_through_models=exclude_through_models,
+                exclude_list=exclude_list,
+            )
+            if key is not None:
+                if len(cls.plans) >= cls.max_plans:
+                    cls.plans.pop(next(iter(cls.plans)))
+                cls.plans[key] = plan
+        return plan
+
+    @classmethod
+    def clear_plans(cls) -> None:
+        """
+        Removes all cached plans, used when model relations change
+        (i.e. after ForwardRefs are updated).
+        """
+        cls.plans.clear()
+
+
+class RelationDumpPlan:
+    """
+    Instructions how to dump one relation of the model, with include, exclude
+    and relation map of the nested models already extracted.
+    """
+
+    __slots__ = (
+        "name",
+        "include",
+        "exclude",
+        "relation_map",
+        "exclude_primary_keys",
+        "exclude_through_models",
+        "plans",
+    )
+
+    def __init__(  # noqa: CFQ002
+        self,
+        name: str,
+        include: Union[Set, Dict, None],
+        exclude: Union[Set, Dict, None],
+        relation_map: Dict,
+        exclude_primary_keys: bool,
+        exclude_through_models: bool,
+    ) -> None:
+        self.name = name
+        self.include = include
+        self.exclude = exclude
+        self.relation_map = relation_map
+        self.exclude_primary_keys = exclude_primary_keys
+        self.exclude_through_models = exclude_through_models
+        self.plans: Dict[Type["Model"], ModelDumpPlan] = dict()
+
+    def plan_for(self, model_cls: Type["Model"]) -> ModelDumpPlan:
+        """
+        Returns plan of dumping nested model of given class, resolved on first use.
+
+        :param model_cls: class of the nested model
+        :type model_cls: Type[Model]
+        :return: plan of dumping the nested model
+        :rtype: ModelDumpPlan
+        """
+        plan = self.plans.get(model_cls)
+        if plan is None:
+            plan = ModelDumpPlan(
+                model_cls=model_cls,
+                include=self.include,
+                exclude=self.exclude,
+                relation_map=self.relation_map,
+                exclude_primary_keys=self.exclude_primary_keys,
+                exclude_through_models=self.exclude_through_models,
+                exclude_list=False,
+            )
+            self.plans[model_cls] = plan
+        return plan
+
+    def dump(self, model: "Model") -> Dict[str, Any]:
+        """
+        Dumps the nested model, together with its through model
+        if through models are not excluded.
+
+        :param model: nested model (or proxy to it)
+        :type model: Model
+        :return: dictionary of the nested model
+        :rtype: Dict[str, Any]
+        """
+        plan = self.plan_for(model.__class__)
+        if plan.custom_dump:
+            model_dict = model.model_dump(
+                relation_map=self.relation_map,
+                include=self.include,
+                exclude=self.exclude,
+                exclude_primary_keys=self.exclude_primary_keys,
+                exclude_through_models=self.exclude_through_models,
+            )
+        else:
+            model_dict = model._dump_with_plan(plan=plan)
+        if not self.exclude_through_models:
+            for name in plan.through_fields:
+                through_instance = getattr(model, name)
+                if through_instance:
+                    model_dict[name] = through_instance.model_dump()
+        return model_dict
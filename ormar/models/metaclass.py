@@ -296,6 +296,12 @@ def copy_and_replace_m2m_through_model(  # noqa: CFQ002
         exclude_parent_fields=through_class.ormar_config.exclude_parent_fields,
         queryset_class=through_class.ormar_config.queryset_class,
         extra=through_class.ormar_config.extra,
+        trusted_load=through_class.ormar_config.trusted_load,
+        prefetch_concurrency=through_class.ormar_config.prefetch_concurrency,
+        prefetch_chunk_size=through_class.ormar_config.prefetch_chunk_size,
+        instruments=through_class.ormar_config.instruments,
+        read_replicas=through_class.ormar_config.read_replicas,
+        replica_policy=through_class.ormar_config.replica_policy,
         constraints=through_class.ormar_config.constraints,
         order_by=through_class.ormar_config.orders_by,
     )
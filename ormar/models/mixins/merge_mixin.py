@@ -16,31 +16,6 @@ class MergeModelMixin:
     in the end all parent (main) models should be unique.
     """
 
-    @classmethod
-    def _recursive_add(cls, model_group: List["Model"]) -> List["Model"]:
-        """
-        Instead of accumulating the model additions one by one, this recursively adds
-        the models. E.G.
-        [1, 2, 3, 4].accumulate_add() would give [3, 3, 4], then [6, 4], then [10]
-        where this method looks like
-        [1, 2, 3, 4].recursive_add() gives [[3], [7]], [10]
-        It's the same number of adds, but it gives better O(N) performance on sublists
-        """
-        if len(model_group) <= 1:
-            return model_group
-
-        added_values = []
-        iterable_group = iter(model_group)
-        for model in iterable_group:
-            next_model = next(iterable_group, None)
-            if next_model is not None:
-                combined = cls.merge_two_instances(next_model, model)
-            else:
-                combined = model
-            added_values.append(combined)
-
-        return cls._recursive_add(added_values)
-
     @classmethod
     def merge_instances_list(cls, result_rows: List["Model"]) -> List["Model"]:
         """
@@ -49,23 +24,89 @@ class MergeModelMixin:
         Models can duplicate during joins when parent model has multiple child rows,
         in the end all parent (main) models should be unique.
 
+        Instances are grouped by primary key and each group is merged in one pass,
+        grouping nested models in the same way along the relation map.
+
         :param result_rows: list of already initialized Models with child models
         populated, each instance is one row in db and some models can duplicate
         :type result_rows: List["Model"]
         :return: list of merged models where each main model is unique
         :rtype: List["Model"]
         """
-        merged_rows: List["Model"] = []
-        grouped_instances: Dict = {}
+        if not result_rows:
+            return result_rows
 
+        grouped_instances: Dict = {}
         for model in result_rows:
             grouped_instances.setdefault(model.pk, []).append(model)
 
-        for group in grouped_instances.values():
-            model = cls._recursive_add(group)[0]
-            merged_rows.append(model)
+        relation_map = translate_list_to_dict(result_rows[0]._iterate_related_models())
+        return [
+            cls._merge_instances_group(group=group, relation_map=relation_map)
+            for group in grouped_instances.values()
+        ]
 
-        return merged_rows
+    @classmethod
+    def _merge_instances_group(
+        cls, group: List["Model"], relation_map: Dict
+    ) -> "Model":
+        """
+        Merges all instances of the same model (the same primary key) into the first
+        one, combining their nested models according to the relation map.
+
+        Nested models of list relations are grouped in dicts, so each child
+        is merged once regardless of the number of rows it appeared in.
+
+        :param group: list of instances of the same model
+        :type group: List[Model]
+        :param relation_map: map of models relations to follow
+        :type relation_map: Dict
+        :return: first instance of the group with data merged from the rest
+        :rtype: Model
+        """
+        # with active session the same instance is returned for each of the rows
+        group = list({id(model): model for model in group}.values())
+        target = group[0]
+        if len(group) == 1:
+            return target
+
+        for field_name in relation_map:
+            current_field = getattr(target, field_name)
+            nested_map = cast(
+                Dict,
+                target._skip_ellipsis(relation_map, field_name, default_return=dict()),
+            )
+            if isinstance(current_field, list):
+                children: Dict["Model", List["Model"]] = {}
+                for model in group:
+                    for child in getattr(model, field_name, []):
+                        children.setdefault(child, []).append(child)
+                setattr(
+                    target,
+                    field_name,
+                    [
+                        cls._merge_instances_group(
+                            group=child_group, relation_map=nested_map
+                        )
+                        for child_group in children.values()
+                    ],
+                )
+            elif isinstance(current_field, ormar.Model):
+                same_instances = [
+                    value
+                    for value in (getattr(model, field_name, None) for model in group)
+                    if isinstance(value, ormar.Model) and value.pk == current_field.pk
+                ]
+                if len(same_instances) > 1:
+                    setattr(
+                        target,
+                        field_name,
+                        cls._merge_instances_group(
+                            group=same_instances, relation_map=nested_map
+                        ),
+                    )
+        target.set_save_status(True)
+        return target
 
     @classmethod
     def merge_two_instances(
@@ -75,7 +116,7 @@ class MergeModelMixin:
         Merges current (other) Model and previous one (one) and returns the current
         Model instance with data merged from previous one.
 
-        If needed it's calling itself recurrently and merges also children models.
+        Children models are merged as well, following the relation map.
 
         :param relation_map: map of models relations to follow
         :type relation_map: Dict
@@ -91,76 +132,4 @@ class MergeModelMixin:
             if relation_map is not None
             else translate_list_to_dict(one._iterate_related_models())
         )
-        for field_name in relation_map:
-            current_field = getattr(one, field_name)
-            other_value = getattr(other, field_name, [])
-            if isinstance(current_field, list):
-                value_to_set = cls._merge_items_lists(
-                    field_name=field_name,
-                    current_field=current_field,
-                    other_value=other_value,
-                    relation_map=relation_map,
-                )
-                setattr(other, field_name, value_to_set)
-            elif (
-                isinstance(current_field, ormar.Model)
-                and isinstance(other_value, ormar.Model)
-                and current_field.pk == other_value.pk
-            ):
-                setattr(
-                    other,
-                    field_name,
-                    cls.merge_two_instances(
-                        current_field,
-                        other_value,
-                        relation_map=one._skip_ellipsis(  # type: ignore
-                            relation_map, field_name, default_return=dict()
-                        ),
-                    ),
-                )
-        other.set_save_status(True)
-        return other
-
-    @classmethod
-    def _merge_items_lists(
-        cls,
-        field_name: str,
-        current_field: List,
-        other_value: List,
-        relation_map: Optional[Dict],
-    ) -> List:
-        """
-        Takes two list of nested models and process them going deeper
-        according with the map.
-
-        If model from one's list is in other -> they are merged with relations
-        to follow passed from map.
-
-        If one's model is not in other it's simply appended to the list.
-
-        :param field_name: name of the current relation field
-        :type field_name: str
-        :param current_field: list of nested models from one model
-        :type current_field: List[Model]
-        :param other_value: list of nested models from other model
-        :type other_value: List[Model]
-        :param relation_map: map of relations to follow
-        :type relation_map: Dict
-        :return: merged list of models
-        :rtype: List[Model]
-        """
-        value_to_set = [x for x in other_value]
-        for cur_field in current_field:
-            if cur_field in other_value:
-                old_value = next((x for x in other_value if x == cur_field), None)
-                new_val = cls.merge_two_instances(
-                    cur_field,
-                    cast("Model", old_value),
-                    relation_map=cur_field._skip_ellipsis(  # type: ignore
-                        relation_map, field_name, default_return=dict()
-                    ),
-                )
-                value_to_set = [x for x in value_to_set if x != cur_field] + [new_val]
-            else:
-                value_to_set.append(cur_field)
-        return value_to_set
+        return cls._merge_instances_group(group=[other, one], relation_map=relation_map)
@@ -1,17 +1,7 @@
 import base64
 import uuid
 from enum import Enum
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    Callable,
-    Collection,
-    Dict,
-    List,
-    Optional,
-    Set,
-    cast,
-)
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 from pydantic.plugin._schema_validator import create_schema_validator
 from pydantic_core import CoreSchema, SchemaValidator
@@ -22,9 +12,6 @@ from ormar.fields.parsers import encode_json
 from ormar.models.mixins import AliasMixin
 from ormar.models.mixins.relation_mixin import RelationMixin
 
-if TYPE_CHECKING:  # pragma: no cover
-    from ormar import ForeignKeyField, Model
-
 
 class SavePrepareMixin(RelationMixin, AliasMixin):
     """
@@ -289,129 +276,6 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
                 )["schema"]["fields"]
             return main_schema["schema"]["fields"]
 
-    @staticmethod
-    async def _upsert_model(
-        instance: "Model",
-        save_all: bool,
-        previous_model: Optional["Model"],
-        relation_field: Optional["ForeignKeyField"],
-        update_count: int,
-    ) -> int:
-        """
-        Method updates given instance if:
-
-        * instance is not saved or
-        * instance have no pk or
-        * save_all=True flag is set
-
-        and instance is not __pk_only__.
-
-        If relation leading to instance is a ManyToMany also the through model is saved
-
-        :param instance: current model to upsert
-        :type instance: Model
-        :param save_all: flag if all models should be saved or only not saved ones
-        :type save_all: bool
-        :param relation_field: field with relation
-        :type relation_field: Optional[ForeignKeyField]
-        :param previous_model: previous model from which method came
-        :type previous_model: Model
-        :param update_count: no of updated models
-        :type update_count: int
-        :return: no of updated models
-        :rtype: int
-        """
-        if (
-            save_all or not instance.pk or not instance.saved
-        ) and not instance.__pk_only__:
-            await instance.upsert(__force_save__=True)
-            if relation_field and relation_field.is_multi:
-                await instance._upsert_through_model(
-                    instance=instance,
-                    relation_field=relation_field,
-                    previous_model=cast("Model", previous_model),
-                )
-            update_count += 1
-        return update_count
-
-    @staticmethod
-    async def _upsert_through_model(
-        instance: "Model", previous_model: "Model", relation_field: "ForeignKeyField"
-    ) -> None:
-        """
-        Upsert through model for m2m relation.
-
-        :param instance: current model to upsert
-        :type instance: Model
-        :param relation_field: field with relation
-        :type relation_field: Optional[ForeignKeyField]
-        :param previous_model: previous model from which method came
-        :type previous_model: Model
-        """
-        through_name = previous_model.ormar_config.model_fields[
-            relation_field.name
-        ].through.get_name()
-        through = getattr(instance, through_name)
-        if through:
-            through_dict = through.model_dump(exclude=through.extract_related_names())
-        else:
-            through_dict = {}
-        await getattr(
-            previous_model, relation_field.name
-        ).queryset_proxy.upsert_through_instance(instance, **through_dict)
-
-    async def _update_relation_list(
-        self,
-        fields_list: Collection["ForeignKeyField"],
-        follow: bool,
-        save_all: bool,
-        relation_map: Dict,
-        update_count: int,
-    ) -> int:
-        """
-        Internal method used in save_related to follow deeper from
-        related models and update numbers of updated related instances.
-
-        :type save_all: flag if all models should be saved
-        :type save_all: bool
-        :param fields_list: list of ormar fields to follow and save
-        :type fields_list: Collection["ForeignKeyField"]
-        :param relation_map: map of relations to follow
-        :type relation_map: Dict
-        :param follow: flag to trigger deep save -
-        by default only directly related models are saved
-        with follow=True also related models of related models are saved
-        :type follow: bool
-        :param update_count: internal parameter for recursive calls -
-        number of updated instances
-        :type update_count: int
-        :return: tuple of update count and visited
-        :rtype: int
-        """
-        for field in fields_list:
-            values = self._get_field_values(name=field.name)
-            for value in values:
-                if follow:
-                    update_count = await value.save_related(
-                        follow=follow,
-                        save_all=save_all,
-                        relation_map=self._skip_ellipsis(  # type: ignore
-                            relation_map, field.name, default_return={}
-                        ),
-                        update_count=update_count,
-                        previous_model=self,
-                        relation_field=field,
-                    )
-                else:
-                    update_count = await value._upsert_model(
-                        instance=value,
-                        save_all=save_all,
-                        previous_model=self,
-                        relation_field=field,
-                        update_count=update_count,
-                    )
-        return update_count
-
     def _get_field_values(self, name: str) -> List:
         """
         Extract field values and ensures it is a list.
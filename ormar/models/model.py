@@ -2,8 +2,12 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, TypeVar, Union
 
 import ormar.queryset  # noqa I100
 from ormar.exceptions import ModelPersistenceError, NoMatch
+from ormar.instrumentation import operation, phase, track
 from ormar.models import NewBaseModel  # noqa I100
 from ormar.models.model_row import ModelRow
+from ormar.models.save_planner import SavePlanner
+from ormar.queryset.cache import invalidate_tables
+from ormar.queryset.replicas import mark_written
 from ormar.queryset.utils import subtract_dict, translate_list_to_dict
 
 T = TypeVar("T", bound="Model")
@@ -74,27 +78,18 @@ class Model(ModelRow):
         :rtype: Model
         """
         await self.signals.pre_save.send(sender=self.__class__, instance=self)
-        self_fields = self._extract_model_db_fields()
-
-        if (
-            not self.pk
-            and self.ormar_config.model_fields[self.ormar_config.pkname].autoincrement
-        ):
-            self_fields.pop(self.ormar_config.pkname, None)
-        self_fields = self.populate_default_values(self_fields)
-        self.update_from_dict(
-            {
-                k: v
-                for k, v in self_fields.items()
-                if k not in self.extract_related_names()
-            }
-        )
+        self_fields = self._populate_fields_to_save()
 
         self_fields = self.translate_columns_to_aliases(self_fields)
-        expr = self.ormar_config.table.insert()
-        expr = expr.values(**self_fields)
-
-        pk = await self.ormar_config.database.execute(expr)
+        mark_written(self.ormar_config.database)
+        with operation(self.__class__, "save"):
+            with phase("build"):
+                expr = self.ormar_config.table.insert()
+                expr = expr.values(**self_fields)
+            pk = await track(self.ormar_config.database.execute(expr), expr)
+        invalidate_tables(
+            [self.ormar_config.tablename], database=self.ormar_config.database
+        )
         if pk and isinstance(pk, self.pk_type()):
             setattr(self, self.ormar_config.pkname, pk)
 
@@ -107,10 +102,42 @@ class Model(ModelRow):
         ):
             await self.load()
 
+        session = ormar.Session.current()
+        if session:
+            session.add(self)
+
         await self.signals.post_save.send(sender=self.__class__, instance=self)
         return self
 
-    async def save_related(  # noqa: CCR001, CFQ002
+    def _populate_fields_to_save(self) -> Dict:
+        """
+        Extracts the values of the fields stored in model table and populates
+        the default values of not set fields, both in extracted values and
+        in the model itself.
+
+        Primary key is skipped if it's not set and autoincrement.
+
+        :return: dictionary of fields names and values
+        :rtype: Dict
+        """
+        self_fields = self._extract_model_db_fields()
+
+        if (
+            not self.pk
+            and self.ormar_config.model_fields[self.ormar_config.pkname].autoincrement
+        ):
+            self_fields.pop(self.ormar_config.pkname, None)
+        self_fields = self.populate_default_values(self_fields)
+        self.update_from_dict(
+            {
+                k: v
+                for k, v in self_fields.items()
+                if k not in self.extract_related_names()
+            }
+        )
+        return self_fields
+
+    async def save_related(  # noqa: CFQ002
         self,
         follow: bool = False,
         save_all: bool = False,
@@ -135,6 +162,11 @@ class Model(ModelRow):
         Model A but will never follow into Model C.
         Nested relations of those kind need to be persisted manually.
 
+        Collected models are saved grouped by model class, in order of foreign key
+        dependencies, with one bulk insert/update per class (and one bulk insert
+        of missing links per many to many relation), all in one transaction.
+        Signals are still sent for each of the saved models.
+
         :param relation_field: field with relation leading to this model
         :type relation_field: Optional[ForeignKeyField]
         :param previous_model: previous model from which method came
@@ -164,54 +196,14 @@ class Model(ModelRow):
             exclude = translate_list_to_dict(exclude)
         relation_map = subtract_dict(relation_map, exclude or {})
 
-        if relation_map:
-            fields_to_visit = {
-                field
-                for field in self.extract_related_fields()
-                if field.name in relation_map
-            }
-            pre_save = {
-                field
-                for field in fields_to_visit
-                if not field.virtual and not field.is_multi
-            }
-
-            update_count = await self._update_relation_list(
-                fields_list=pre_save,
-                follow=follow,
-                save_all=save_all,
-                relation_map=relation_map,
-                update_count=update_count,
-            )
-
-            update_count = await self._upsert_model(
-                instance=self,
-                save_all=save_all,
-                previous_model=previous_model,
-                relation_field=relation_field,
-                update_count=update_count,
-            )
-
-            post_save = fields_to_visit - pre_save
-
-            update_count = await self._update_relation_list(
-                fields_list=post_save,
-                follow=follow,
-                save_all=save_all,
-                relation_map=relation_map,
-                update_count=update_count,
-            )
-
-        else:
-            update_count = await self._upsert_model(
-                instance=self,
-                save_all=save_all,
-                previous_model=previous_model,
-                relation_field=relation_field,
-                update_count=update_count,
-            )
-
-        return update_count
+        planner = SavePlanner(follow=follow, save_all=save_all)
+        planner.collect(
+            instance=self,
+            relation_map=relation_map,
+            previous_model=previous_model,
+            relation_field=relation_field,
+        )
+        return update_count + await planner.save()
 
     async def update(self: T, _columns: Optional[List[str]] = None, **kwargs: Any) -> T:
         """
@@ -222,7 +214,10 @@ class Model(ModelRow):
 
         Sets model save status to True.
 
-        :param _columns: list of columns to update, if None all are updated
+        If the model was loaded from the database (or saved) only the fields changed
+        since then are updated, if nothing changed no query is issued.
+
+        :param _columns: list of columns to update, if None changed ones are updated
         :type _columns: List
         :raises ModelPersistenceError: If the pk column is not set
 
@@ -246,12 +241,23 @@ class Model(ModelRow):
         self_fields.pop(self.get_column_name_from_alias(self.ormar_config.pkname))
         if _columns:
             self_fields = {k: v for k, v in self_fields.items() if k in _columns}
+        elif self._orm_changed is not None:
+            # in place changes of mutable json values are not tracked
+            changed = self._orm_changed | self._json_fields
+            self_fields = {k: v for k, v in self_fields.items() if k in changed}
         if self_fields:
             self_fields = self.translate_columns_to_aliases(self_fields)
-            expr = self.ormar_config.table.update().values(**self_fields)
-            expr = expr.where(self.pk_column == getattr(self, self.ormar_config.pkname))
-
-            await self.ormar_config.database.execute(expr)
+            mark_written(self.ormar_config.database)
+            with operation(self.__class__, "update"):
+                with phase("build"):
+                    expr = self.ormar_config.table.update().values(**self_fields)
+                    expr = expr.where(
+                        self.pk_column == getattr(self, self.ormar_config.pkname)
+                    )
+                await track(self.ormar_config.database.execute(expr), expr)
+            invalidate_tables(
+                [self.ormar_config.tablename], database=self.ormar_config.database
+            )
         self.set_save_status(True)
         await self.signals.post_update.send(sender=self.__class__, instance=self)
         return self
@@ -272,10 +278,21 @@ class Model(ModelRow):
         :rtype: int
         """
         await self.signals.pre_delete.send(sender=self.__class__, instance=self)
-        expr = self.ormar_config.table.delete()
-        expr = expr.where(self.pk_column == (getattr(self, self.ormar_config.pkname)))
-        result = await self.ormar_config.database.execute(expr)
+        mark_written(self.ormar_config.database)
+        with operation(self.__class__, "delete"):
+            with phase("build"):
+                expr = self.ormar_config.table.delete()
+                expr = expr.where(
+                    self.pk_column == (getattr(self, self.ormar_config.pkname))
+                )
+            result = await track(self.ormar_config.database.execute(expr), expr)
+        invalidate_tables(
+            [self.ormar_config.tablename], database=self.ormar_config.database
+        )
         self.set_save_status(False)
+        session = ormar.Session.current()
+        if session:
+            session.expunge(self)
         await self.signals.post_delete.send(sender=self.__class__, instance=self)
         return result
 
@@ -285,13 +302,24 @@ class Model(ModelRow):
         Be careful as the related models can be overwritten by pk_only models in load.
         Does NOT refresh the related models fields if they were loaded before.
 
+        If BatchLoader is active, concurrent loads of models of the same class
+        are issued as one query.
+
         :raises NoMatch: If given pk is not found in database.
 
         :return: reloaded Model
         :rtype: Model
         """
-        expr = self.ormar_config.table.select().where(self.pk_column == self.pk)
-        row = await self.ormar_config.database.fetch_one(expr)
+        loader = ormar.BatchLoader.current()
+        if loader:
+            row = await loader.load_row(self)
+        else:
+            with operation(self.__class__, "load"):
+                with phase("build"):
+                    expr = self.ormar_config.table.select().where(
+                        self.pk_column == self.pk
+                    )
+                row = await track(self.ormar_config.database.fetch_one(expr), expr)
         if not row:  # pragma nocover
             raise NoMatch("Instance was deleted from database and cannot be refreshed")
         kwargs = dict(row)
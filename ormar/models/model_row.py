@@ -1,4 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union, cast
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 try:
     from sqlalchemy.engine.result import ResultProxy  # type: ignore
@@ -9,12 +21,44 @@ except ImportError:  # pragma: no cover
 from ormar.models import NewBaseModel  # noqa: I202
 from ormar.models.excludable import ExcludableItems
 from ormar.models.helpers.models import group_related_list
+from ormar.models.session import Session
 
 if TYPE_CHECKING:  # pragma: no cover
     from ormar.fields import ForeignKeyField
     from ormar.models import Model
 
 
+@dataclass
+class RowPlan:
+    """
+    Precomputed instructions how to construct a model from a database row.
+
+    Resolved once per query (table prefixes, selected columns, excluded fields and
+    nested relations) and later applied to each of the returned rows.
+
+    If trusted is set models are constructed without pydantic validation.
+    """
+
+    model_cls: Type["Model"]
+    columns: List[Tuple[str, str]] = field(default_factory=list)
+    excluded: Set[str] = field(default_factory=set)
+    trusted: bool = False
+    children: List["RelationRowPlan"] = field(default_factory=list)
+
+
+@dataclass
+class RelationRowPlan:
+    """
+    Instructions how to populate one nested relation of a RowPlan,
+    including the through model for many to many relations.
+    """
+
+    item_key: str
+    plan: RowPlan
+    through_name: str = ""
+    through_plan: Optional[RowPlan] = None
+
+
 class ModelRow(NewBaseModel):
     @classmethod
     def from_row(  # noqa: CFQ002
@@ -33,7 +77,6 @@ class ModelRow(NewBaseModel):
         Model method to convert raw sql row from database into ormar.Model instance.
         Traverses nested models if they were specified in select_related for query.
 
-        Called recurrently and returns model instance if it's present in the row.
         Note that it's processing one row at a time, so if there are duplicates of
         parent row that needs to be joined/combined
         (like parent row in sql join with 2+ child rows)
@@ -42,6 +85,9 @@ class ModelRow(NewBaseModel):
         where rows are populated in a different way as they do not have
         nested models in result.
 
+        To process multiple rows of the same query build the plan once with
+        build_row_plan() and use from_row_plan() for each row instead.
+
         :param used_prefixes: list of already extracted prefixes
         :type used_prefixes: List[str]
         :param proxy_source_model: source model from which querysetproxy is constructed
@@ -63,7 +109,169 @@ class ModelRow(NewBaseModel):
         :return: returns model if model is populated from database
         :rtype: Optional[Model]
         """
+        plan = cls.build_row_plan(
+            source_model=source_model,
+            select_related=select_related,
+            related_models=related_models,
+            related_field=related_field,
+            excludable=excludable,
+            current_relation_str=current_relation_str,
+            used_prefixes=used_prefixes,
+        )
+        return cls.from_row_plan(
+            row=row, plan=plan, proxy_source_model=proxy_source_model
+        )
+
+    @classmethod
+    def from_row_plan(
+        cls,
+        row: ResultProxy,
+        plan: RowPlan,
+        proxy_source_model: Optional[Type["Model"]] = None,
+    ) -> Optional["Model"]:
+        """
+        Converts raw sql row from database into ormar.Model instance following
+        the already resolved plan. Called recurrently for nested models.
+
+        :param row: raw result row from the database
+        :type row: ResultProxy
+        :param plan: precomputed plan for the query returning the row
+        :type plan: RowPlan
+        :param proxy_source_model: source model from which querysetproxy is constructed
+        :type proxy_source_model: Optional[Type["ModelRow"]]
+        :return: returns model if model is populated from database
+        :rtype: Optional[Model]
+        """
         item: Dict[str, Any] = {}
+        for relation_plan in plan.children:
+            child_plan = relation_plan.plan
+            child = child_plan.model_cls.from_row_plan(
+                row=row, plan=child_plan, proxy_source_model=proxy_source_model
+            )
+            item[relation_plan.item_key] = child
+            if child and relation_plan.through_plan:
+                through_child = relation_plan.through_plan.model_cls(
+                    **cls._extract_planned_columns(
+                        row=row, plan=relation_plan.through_plan
+                    )
+                )
+                if child.__class__ != proxy_source_model:
+                    setattr(child, relation_plan.through_name, through_child)
+                else:
+                    item[relation_plan.through_name] = through_child
+                child.set_save_status(True)
+
+        for field_name, column_name in plan.columns:
+            if field_name not in item:
+                item[field_name] = row[column_name]
+
+        instance: Optional["Model"] = None
+        pk = item.get(cls.ormar_config.pkname, None)
+        if pk is not None:
+            session = Session.current()
+            existing = session.get(cls, pk) if session else None  # type: ignore
+            if session and existing is not None:
+                session.fill_unloaded(
+                    instance=existing,
+                    values={name: item[name] for name, _ in plan.columns},
+                )
+                return cls._attach_loaded_relations(
+                    instance=existing, item=item, plan=plan
+                )
+            item["__excluded__"] = plan.excluded
+            item["__trusted__"] = plan.trusted
+            instance = cast("Model", cls(**item))
+            instance.set_save_status(True)
+            if session:
+                session.add(instance, unloaded=plan.excluded)
+        return instance
+
+    @staticmethod
+    def _attach_loaded_relations(
+        instance: "Model", item: Dict, plan: RowPlan
+    ) -> "Model":
+        """
+        Registers related models loaded from the row on already existing instance
+        of the model (from the identity map of the session), instead of
+        constructing the model again. Save status and changed fields
+        of the instance are kept.
+
+        :param instance: existing instance of the model
+        :type instance: Model
+        :param item: values extracted from the row
+        :type item: Dict
+        :param plan: plan of the model
+        :type plan: RowPlan
+        :return: existing instance
+        :rtype: Model
+        """
+        saved, changed = instance.saved, instance.changed_fields
+        for relation_plan in plan.children:
+            for key in (relation_plan.item_key, relation_plan.through_name):
+                if key and item.get(key) is not None:
+                    setattr(instance, key, item[key])
+        instance.set_save_status(saved or changed is not None)
+        for name in changed or ():
+            instance.mark_field_changed(name)
+        return instance
+
+    @staticmethod
+    def _extract_planned_columns(row: ResultProxy, plan: RowPlan) -> Dict:
+        """
+        Extracts own columns of the planned model from the row.
+
+        :param row: raw result row from the database
+        :type row: ResultProxy
+        :param plan: plan of the model
+        :type plan: RowPlan
+        :return: dictionary of field names and values
+        :rtype: Dict
+        """
+        item = {field_name: row[column] for field_name, column in plan.columns}
+        item["__excluded__"] = plan.excluded
+        item["__trusted__"] = plan.trusted
+        return item
+
+    @classmethod
+    def build_row_plan(  # noqa: CFQ002
+        cls,
+        source_model: Type["Model"],
+        select_related: Optional[List] = None,
+        related_models: Any = None,
+        related_field: Optional["ForeignKeyField"] = None,
+        excludable: Optional[ExcludableItems] = None,
+        current_relation_str: str = "",
+        used_prefixes: Optional[List[str]] = None,
+        trusted_load: bool = False,
+    ) -> RowPlan:
+        """
+        Resolves how to construct the model and its nested models from rows
+        returned by the query, so that this work is done once per query and not
+        for each of the rows.
+
+        Resolves table prefixes of joined tables, selected columns with their
+        prefixed names in the row and fields that should be excluded.
+        Traverses nested models if they were specified in select_related for query.
+
+        :param source_model: model on which relation was defined
+        :type source_model: Type[Model]
+        :param select_related: list of names of related models fetched from database
+        :type select_related: List
+        :param related_models: list or dict of related models
+        :type related_models: Union[List, Dict]
+        :param related_field: field with relation declaration
+        :type related_field: ForeignKeyField
+        :param excludable: structure of fields to include and exclude
+        :type excludable: ExcludableItems
+        :param current_relation_str: name of the relation field
+        :type current_relation_str: str
+        :param used_prefixes: list of already extracted prefixes
+        :type used_prefixes: List[str]
+        :param trusted_load: flag if models should be constructed without validation
+        :type trusted_load: bool
+        :return: plan of constructing model from the row
+        :rtype: RowPlan
+        """
         select_related = select_related or []
         related_models = related_models or []
         table_prefix = ""
@@ -81,29 +289,28 @@ class ModelRow(NewBaseModel):
                 used_prefixes=used_prefixes,
             )
 
-        item = cls._populate_nested_models_from_row(
-            item=item,
-            row=row,
+        plan = RowPlan(model_cls=cast(Type["Model"], cls), trusted=trusted_load)
+        plan.children = cls._plan_nested_models(
             related_models=related_models,
             excludable=excludable,
             current_relation_str=current_relation_str,
-            source_model=source_model,  # type: ignore
-            proxy_source_model=proxy_source_model,  # type: ignore
+            source_model=source_model,
             table_prefix=table_prefix,
             used_prefixes=used_prefixes,
+            trusted_load=trusted_load,
         )
-        item = cls.extract_prefixed_table_columns(
-            item=item, row=row, table_prefix=table_prefix, excludable=excludable
-        )
-
-        instance: Optional["Model"] = None
-        if item.get(cls.ormar_config.pkname, None) is not None:
-            item["__excluded__"] = cls.get_names_to_exclude(
-                excludable=excludable, alias=table_prefix
+        populated_keys = {relation_plan.item_key for relation_plan in plan.children}
+        plan.columns = [
+            (field_name, column_name)
+            for field_name, column_name in cls._plan_prefixed_table_columns(
+                table_prefix=table_prefix, excludable=excludable
             )
-            instance = cast("Model", cls(**item))
-            instance.set_save_status(True)
-        return instance
+            if field_name not in populated_keys
+        ]
+        plan.excluded = cls.get_names_to_exclude(
+            excludable=excludable, alias=table_prefix
+        )
+        return plan
 
     @classmethod
     def _process_table_prefix(
@@ -144,47 +351,43 @@ class ModelRow(NewBaseModel):
         return table_prefix
 
     @classmethod
-    def _populate_nested_models_from_row(  # noqa: CFQ002
+    def _plan_nested_models(  # noqa: CFQ002
         cls,
-        item: dict,
-        row: ResultProxy,
         source_model: Type["Model"],
         related_models: Any,
         excludable: ExcludableItems,
         table_prefix: str,
         used_prefixes: List[str],
         current_relation_str: Optional[str] = None,
-        proxy_source_model: Optional[Type["Model"]] = None,
-    ) -> dict:
+        trusted_load: bool = False,
+    ) -> List[RelationRowPlan]:
         """
-        Traverses structure of related models and populates the nested models
-        from the database row.
+        Traverses structure of related models and resolves plans for the nested
+        models that are populated from the database row.
         Related models can be a list if only directly related models are to be
         populated, converted to dict if related models also have their own related
         models to be populated.
 
-        Recurrently calls from_row method on nested instances and create nested
-        instances. In the end those instances are added to the final model dictionary.
+        Recurrently calls build_row_plan method on nested models.
 
-        :param proxy_source_model: source model from which querysetproxy is constructed
-        :type proxy_source_model: Optional[Type["ModelRow"]]
-        :param excludable: structure of fields to include and exclude
-        :type excludable: ExcludableItems
         :param source_model: source model from which relation started
         :type source_model: Type[Model]
-        :param current_relation_str: joined related parts into one string
-        :type current_relation_str: str
-        :param item: dictionary of already populated nested models, otherwise empty dict
-        :type item: Dict
-        :param row: raw result row from the database
-        :type row: ResultProxy
         :param related_models: list or dict of related models
         :type related_models: Union[Dict, List]
-        :return: dictionary with keys corresponding to model fields names
-        and values are database values
-        :rtype: Dict
+        :param excludable: structure of fields to include and exclude
+        :type excludable: ExcludableItems
+        :param table_prefix: prefix of the current table
+        :type table_prefix: str
+        :param used_prefixes: list of already extracted prefixes
+        :type used_prefixes: List[str]
+        :param current_relation_str: joined related parts into one string
+        :type current_relation_str: str
+        :param trusted_load: flag if models should be constructed without validation
+        :type trusted_load: bool
+        :return: list of plans of nested relations
+        :rtype: List[RelationRowPlan]
         """
-
+        children = []
         for related in related_models:
             field = cls.ormar_config.model_fields[related]
             field = cast("ForeignKeyField", field)
@@ -200,32 +403,31 @@ class ModelRow(NewBaseModel):
                 current_relation_str=current_relation_str,
                 related=related,
             )
-            child = model_cls.from_row(
-                row,
-                related_models=remainder,
-                related_field=field,
-                excludable=excludable,
-                current_relation_str=relation_str,
-                source_model=source_model,
-                proxy_source_model=proxy_source_model,
-                used_prefixes=used_prefixes,
+            relation_plan = RelationRowPlan(
+                item_key=model_cls.get_column_name_from_alias(related),
+                plan=model_cls.build_row_plan(
+                    related_models=remainder,
+                    related_field=field,
+                    excludable=excludable,
+                    current_relation_str=relation_str,
+                    source_model=source_model,
+                    used_prefixes=used_prefixes,
+                    trusted_load=trusted_load,
+                ),
             )
-            item[model_cls.get_column_name_from_alias(related)] = child
-            if (
-                field.is_multi
-                and child
-                and not model_excludable.is_excluded(field.through.get_name())
+            if field.is_multi and not model_excludable.is_excluded(
+                field.through.get_name()
             ):
-                cls._populate_through_instance(
-                    row=row,
-                    item=item,
+                relation_plan.through_name = field.through.get_name()
+                relation_plan.through_plan = cls._plan_through_instance(
+                    through_name=relation_plan.through_name,
                     related=related,
                     excludable=excludable,
-                    child=child,
-                    proxy_source_model=proxy_source_model,
+                    trusted_load=trusted_load,
                 )
+            children.append(relation_plan)
 
-        return item
+        return children
 
     @staticmethod
     def _process_remainder_and_relation_string(
@@ -255,65 +457,28 @@ class ModelRow(NewBaseModel):
         return relation_str, remainder
 
     @classmethod
-    def _populate_through_instance(  # noqa: CFQ002
+    def _plan_through_instance(
         cls,
-        row: ResultProxy,
-        item: Dict,
-        related: str,
-        excludable: ExcludableItems,
-        child: "Model",
-        proxy_source_model: Optional[Type["Model"]],
-    ) -> None:
-        """
-        Populates the through model on reverse side of current query.
-        Normally it's child class, unless the query is from queryset.
-
-        :param row: row from db result
-        :type row: ResultProxy
-        :param item: parent item dict
-        :type item: Dict
-        :param related: current relation name
-        :type related: str
-        :param excludable: structure of fields to include and exclude
-        :type excludable: ExcludableItems
-        :param child: child item of parent
-        :type child: "Model"
-        :param proxy_source_model: source model from which querysetproxy is constructed
-        :type proxy_source_model: Type["Model"]
-        """
-        through_name = cls.ormar_config.model_fields[related].through.get_name()
-        through_child = cls._create_through_instance(
-            row=row, related=related, through_name=through_name, excludable=excludable
-        )
-
-        if child.__class__ != proxy_source_model:
-            setattr(child, through_name, through_child)
-        else:
-            item[through_name] = through_child
-        child.set_save_status(True)
-
-    @classmethod
-    def _create_through_instance(
-        cls,
-        row: ResultProxy,
         through_name: str,
         related: str,
         excludable: ExcludableItems,
-    ) -> "ModelRow":
+        trusted_load: bool = False,
+    ) -> RowPlan:
         """
-        Initialize the through model from db row.
-        Excluded all relation fields and other exclude/include set in excludable.
+        Resolves plan of the through model populated on reverse side of current
+        query. Excluded all relation fields and other exclude/include set
+        in excludable.
 
-        :param row: loaded row from database
-        :type row: sqlalchemy.engine.ResultProxy
         :param through_name: name of the through field
         :type through_name: str
         :param related: name of the relation
         :type related: str
         :param excludable: structure of fields to include and exclude
         :type excludable: ExcludableItems
-        :return: initialized through model without relation
-        :rtype: "ModelRow"
+        :param trusted_load: flag if models should be constructed without validation
+        :type trusted_load: bool
+        :return: plan of the through model without relations
+        :rtype: RowPlan
         """
         model_cls = cls.ormar_config.model_fields[through_name].to
         table_prefix = cls.ormar_config.alias_manager.resolve_relation_alias(
@@ -324,14 +489,42 @@ class ModelRow(NewBaseModel):
         model_excludable.set_values(
             value=model_cls.extract_related_names(), is_exclude=True
         )
-        child_dict = model_cls.extract_prefixed_table_columns(
-            item={}, row=row, excludable=excludable, table_prefix=table_prefix
+        return RowPlan(
+            model_cls=model_cls,
+            columns=model_cls._plan_prefixed_table_columns(
+                table_prefix=table_prefix, excludable=excludable
+            ),
+            excluded=model_cls.get_names_to_exclude(
+                excludable=excludable, alias=table_prefix
+            ),
+            trusted=trusted_load,
         )
-        child_dict["__excluded__"] = model_cls.get_names_to_exclude(
-            excludable=excludable, alias=table_prefix
+
+    @classmethod
+    def _plan_prefixed_table_columns(
+        cls, table_prefix: str, excludable: ExcludableItems
+    ) -> List[Tuple[str, str]]:
+        """
+        Resolves which own columns are selected and under which (prefixed)
+        names they are present in the raw sql result.
+
+        :param table_prefix: prefix of the table from AliasManager
+        :type table_prefix: str
+        :param excludable: structure of fields to include and exclude
+        :type excludable: ExcludableItems
+        :return: list of field names and names of columns in the row
+        :rtype: List[Tuple[str, str]]
+        """
+        selected_columns = cls.own_table_columns(
+            model=cls, excludable=excludable, alias=table_prefix, use_alias=False
         )
-        child = model_cls(**child_dict)  # type: ignore
-        return child
+        column_prefix = table_prefix + "_" if table_prefix else ""
+        columns = []
+        for column in cls.ormar_config.table.columns:
+            alias = cls.get_column_name_from_alias(column.name)
+            if alias in selected_columns:
+                columns.append((alias, f"{column_prefix}{column.name}"))
+        return columns
 
     @classmethod
     def extract_prefixed_table_columns(
@@ -367,15 +560,10 @@ class ModelRow(NewBaseModel):
         and values are database values
         :rtype: Dict
         """
-        selected_columns = cls.own_table_columns(
-            model=cls, excludable=excludable, alias=table_prefix, use_alias=False
-        )
-
-        column_prefix = table_prefix + "_" if table_prefix else ""
-        for column in cls.ormar_config.table.columns:
-            alias = cls.get_column_name_from_alias(column.name)
-            if alias not in item and alias in selected_columns:
-                prefixed_name = f"{column_prefix}{column.name}"
+        for alias, prefixed_name in cls._plan_prefixed_table_columns(
+            table_prefix=table_prefix, excludable=excludable
+        ):
+            if alias not in item:
                 item[alias] = row[prefixed_name]
 
         return item
@@ -27,6 +27,7 @@ import ormar  # noqa I100
 from ormar.exceptions import ModelError, ModelPersistenceError
 from ormar.fields.foreign_key import ForeignKeyField
 from ormar.fields.parsers import decode_bytes, encode_json
+from ormar.models.dump_plan import ModelDumpPlan
 from ormar.models.helpers import register_relation_in_alias_manager
 from ormar.models.helpers.relations import expand_reverse_relationship
 from ormar.models.helpers.sqlalchemy import (
@@ -36,6 +37,7 @@ from ormar.models.helpers.sqlalchemy import (
 from ormar.models.metaclass import ModelMetaclass
 from ormar.models.modelproxy import ModelTableProxy
 from ormar.models.utils import Extra
+from ormar.queryset.queries.query import Query
 from ormar.queryset.utils import translate_list_to_dict
 from ormar.relations.alias_manager import AliasManager
 from ormar.relations.relation import Relation
@@ -68,6 +70,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
     __slots__ = (
         "_orm_id",
         "_orm_saved",
+        "_orm_changed",
         "_orm",
         "_pk_column",
         "__pk_only__",
@@ -84,6 +87,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         _orm: RelationsManager
         _orm_id: int
         _orm_saved: bool
+        _orm_changed: Optional[Set[str]]
         _related_names: Optional[Set]
         _through_names: Optional[Set]
         _related_names_hash: str
@@ -115,6 +119,11 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         Model), that causes skipping the validation, that's the only case when the
         validation can be skipped.
 
+        Accepts also special __trusted__ flag that indicates that values come
+        directly from the database (already of the proper python types), that causes
+        skipping the validation and only fills defaults of missing fields
+        and registers relations.
+
         Accepts also special __excluded__ parameter that contains a set of fields that
         should be explicitly set to None, as otherwise pydantic will try to populate
         them with their default values if default is set.
@@ -132,9 +141,15 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         pk_only = kwargs.pop("__pk_only__", False)
         object.__setattr__(self, "__pk_only__", pk_only)
 
-        new_kwargs, through_tmp_dict = self._process_kwargs(kwargs)
+        trusted = kwargs.pop("__trusted__", False)
+        if trusted:
+            new_kwargs, through_tmp_dict = self._process_trusted_kwargs(kwargs)
+        else:
+            new_kwargs, through_tmp_dict = self._process_kwargs(kwargs)
 
-        if not pk_only:
+        if trusted:
+            self._construct_trusted(new_kwargs)
+        elif not pk_only:
             self.__pydantic_validator__.validate_python(
                 new_kwargs, self_instance=self  # type: ignore
             )
@@ -333,6 +348,61 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
 
         return new_kwargs, through_tmp_dict
 
+    def _process_trusted_kwargs(self, kwargs: Dict) -> Tuple[Dict, Dict]:
+        """
+        Lightweight counterpart of _process_kwargs used for trusted values
+        loaded from the database.
+
+        Expands relations and nullifies fields that should be excluded, but skips
+        removal of property fields, extra fields and json/bytes conversions
+        as values are already in their final form.
+
+        Extracts through models from kwargs into temporary dict.
+
+        :param kwargs: passed to init keyword arguments
+        :type kwargs: Dict
+        :return: modified kwargs
+        :rtype: Tuple[Dict, Dict]
+        """
+        excluded: Set[str] = kwargs.pop("__excluded__", set())
+        if "pk" in kwargs:
+            kwargs[self.ormar_config.pkname] = kwargs.pop("pk")
+
+        through_tmp_dict = dict()
+        for field_name in self.extract_through_names():
+            through_tmp_dict[field_name] = kwargs.pop(field_name, None)
+
+        model_fields = self.ormar_config.model_fields
+        for related in self.extract_related_names():
+            if related in kwargs:
+                kwargs[related] = model_fields[related].expand_relationship(
+                    kwargs[related], self, to_register=False
+                )
+
+        for field_to_nullify in excluded:
+            kwargs[field_to_nullify] = None
+
+        return kwargs, through_tmp_dict
+
+    def _construct_trusted(self, values: Dict) -> None:
+        """
+        Populates the instance with trusted values without pydantic validation,
+        similar to pydantic model_construct.
+        Fields missing in values are populated with their defaults.
+
+        :param values: values of fields
+        :type values: Dict
+        """
+        fields_values: Dict[str, Any] = {}
+        for name, field in self.__class__.model_fields.items():
+            if name in values:
+                fields_values[name] = values[name]
+            elif not field.is_required():
+                fields_values[name] = field.get_default(call_default_factory=True)
+        object.__setattr__(self, "__dict__", fields_values)
+        object.__setattr__(self, "__pydantic_fields_set__", set(values.keys()))
+        self._pydantic_model_construct_finalizer(model=self, extra_allowed=False)
+
     def _remove_extra_parameters_if_they_should_be_ignored(
         self, kwargs: Dict, model_fields: Dict, pydantic_fields: Set
     ) -> Dict:
@@ -363,6 +433,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         """
         # object.__setattr__(self, "_orm_id", uuid.uuid4().hex)
         object.__setattr__(self, "_orm_saved", False)
+        object.__setattr__(self, "_orm_changed", None)
         object.__setattr__(self, "_pk_column", None)
         object.__setattr__(
             self,
@@ -457,6 +528,20 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         """Saved status of the model. Changed by setattr and loading from db"""
         return self._orm_saved
 
+    @property
+    def changed_fields(self) -> Optional[Set[str]]:
+        """
+        Names of the fields changed since the model was loaded or saved.
+
+        None if the model was not loaded from the database nor saved yet
+        (or it was deleted), in that case all fields are treated as changed.
+
+        :return: names of changed fields
+        :rtype: Optional[Set[str]]
+        """
+        changed = self._orm_changed
+        return set(changed) if changed is not None else None
+
     @property
     def signals(self) -> "SignalEmitter":
         """Exposes signals from model OrmarConfig"""
@@ -478,8 +563,27 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         self._orm.remove_parent(self, parent, name)
 
     def set_save_status(self, status: bool) -> None:
-        """Sets value of the save status"""
+        """
+        Sets value of the save status.
+
+        Setting status to True resets the changed fields (model is in sync with
+        the database), setting it to False drops tracking of changes, so that
+        all fields are treated as changed.
+        """
         object.__setattr__(self, "_orm_saved", status)
+        object.__setattr__(self, "_orm_changed", set() if status else None)
+
+    def mark_field_changed(self, name: str) -> None:
+        """
+        Marks the field as changed since model was loaded or saved
+        and sets the save status to False.
+
+        :param name: name of the changed field
+        :type name: str
+        """
+        object.__setattr__(self, "_orm_saved", False)
+        if self._orm_changed is not None:
+            self._orm_changed.add(name)
 
     @classmethod
     def update_forward_refs(cls, **localns: Any) -> None:
@@ -519,6 +623,8 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         # super().update_forward_refs(**localns)
         cls.model_rebuild(force=True)
         cls.ormar_config.requires_ref_update = False
+        Query.clear_join_plans()
+        ModelDumpPlan.clear_plans()
 
     @staticmethod
     def _get_not_excluded_fields(
@@ -549,50 +655,6 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
             ]
         return fields
 
-    @staticmethod
-    def _extract_nested_models_from_list(
-        relation_map: Dict,
-        models: MutableSequence,
-        include: Union[Set, Dict, None],
-        exclude: Union[Set, Dict, None],
-        exclude_primary_keys: bool,
-        exclude_through_models: bool,
-    ) -> List:
-        """
-        Converts list of models into list of dictionaries.
-
-        :param models: List of models
-        :type models: List
-        :param include: fields to include
-        :type include: Union[Set, Dict, None]
-        :param exclude: fields to exclude
-        :type exclude: Union[Set, Dict, None]
-        :return: list of models converted to dictionaries
-        :rtype: List[Dict]
-        """
-        result = []
-        for model in models:
-            try:
-                model_dict = model.model_dump(
-                    relation_map=relation_map,
-                    include=include,
-                    exclude=exclude,
-                    exclude_primary_keys=exclude_primary_keys,
-                    exclude_through_models=exclude_through_models,
-                )
-                if not exclude_through_models:
-                    model.populate_through_models(
-                        model=model,
-                        model_dict=model_dict,
-                        include=include,
-                        exclude=exclude,
-                        relation_map=relation_map,
-                    )
-                result.append(model_dict)
-            except ReferenceError:  # pragma no cover
-                continue
-        return result
-
     @staticmethod
     def populate_through_models(
         model: "Model",
@@ -663,98 +725,88 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         result = cls.get_child(items, key)
         return result if result is not Ellipsis else default_return
 
-    @staticmethod
-    def _convert_all(items: Union[Set, Dict, None]) -> Union[Set, Dict, None]:
-        """
-        Helper to convert __all__ pydantic special index to ormar which does not
-        support index based exclusions.
-
-        :param items: current include/exclude value
-        :type items: Union[Set, Dict, None]
+    def _extract_nested_models(self, plan: ModelDumpPlan, dict_instance: Dict) -> Dict:
         """
-        if isinstance(items, dict) and "__all__" in items:
-            return items.get("__all__")
-        return items
+        Traverse nested models and converts them into dictionaries,
+        following the relations resolved in the dump plan.
 
-    def _extract_nested_models(  # noqa: CCR001, CFQ002
-        self,
-        relation_map: Dict,
-        dict_instance: Dict,
-        include: Optional[Dict],
-        exclude: Optional[Dict],
-        exclude_primary_keys: bool,
-        exclude_through_models: bool,
-        exclude_list: bool,
-    ) -> Dict:
-        """
-        Traverse nested models and converts them into dictionaries.
-        Calls itself recursively if needed.
-
-        :param nested: flag if current instance is nested
-        :type nested: bool
+        :param plan: resolved plan of dumping current model
+        :type plan: ModelDumpPlan
         :param dict_instance: current instance dict
         :type dict_instance: Dict
-        :param include: fields to include
-        :type include: Optional[Dict]
-        :param exclude: fields to exclude
-        :type exclude: Optional[Dict]
-        :param exclude: whether to exclude lists
-        :type exclude: bool
         :return: current model dict with child models converted to dictionaries
         :rtype: Dict
         """
-        fields = self._get_not_excluded_fields(
-            fields=self.extract_related_names(), include=include, exclude=exclude
-        )
-
-        for field in fields:
-            if not relation_map or field not in relation_map:
-                continue
+        for relation in plan.relations:
             try:
-                nested_model = getattr(self, field)
+                nested_model = getattr(self, relation.name)
                 if isinstance(nested_model, MutableSequence):
-                    if exclude_list:
+                    if plan.exclude_list:
                         continue
-
-                    dict_instance[field] = self._extract_nested_models_from_list(
-                        relation_map=self._skip_ellipsis(  # type: ignore
-                            relation_map, field, default_return=dict()
-                        ),
-                        models=nested_model,
-                        include=self._convert_all(self._skip_ellipsis(include, field)),
-                        exclude=self._convert_all(self._skip_ellipsis(exclude, field)),
-                        exclude_primary_keys=exclude_primary_keys,
-                        exclude_through_models=exclude_through_models,
-                    )
+                    models = []
+                    for model in nested_model:
+                        try:
+                            models.append(relation.dump(model))
+                        except ReferenceError:  # pragma no cover
+                            continue
+                    dict_instance[relation.name] = models
                 elif nested_model is not None:
-                    model_dict = nested_model.model_dump(
-                        relation_map=self._skip_ellipsis(
-                            relation_map, field, default_return=dict()
-                        ),
-                        include=self._convert_all(self._skip_ellipsis(include, field)),
-                        exclude=self._convert_all(self._skip_ellipsis(exclude, field)),
-                        exclude_primary_keys=exclude_primary_keys,
-                        exclude_through_models=exclude_through_models,
-                    )
-                    if not exclude_through_models:
-                        nested_model.populate_through_models(
-                            model=nested_model,
-                            model_dict=model_dict,
-                            include=self._convert_all(
-                                self._skip_ellipsis(include, field)
-                            ),
-                            exclude=self._convert_all(
-                                self._skip_ellipsis(exclude, field)
-                            ),
-                            relation_map=self._skip_ellipsis(
-                                relation_map, field, default_return=dict()
-                            ),
-                        )
-                    dict_instance[field] = model_dict
+                    dict_instance[relation.name] = relation.dump(nested_model)
                 else:
-                    dict_instance[field] = None
+                    dict_instance[relation.name] = None
             except ReferenceError:  # pragma: no cover
-                dict_instance[field] = None
+                dict_instance[relation.name] = None
+        return dict_instance
+
+    def _dump_with_plan(
+        self,
+        plan: ModelDumpPlan,
+        mode: Union[Literal["json", "python"], str] = "python",
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+    ) -> "DictStrAny":
+        """
+        Dumps the model to dictionary with already resolved dump plan.
+        Own fields are dumped by pydantic, nested models by their own plans.
+
+        :param plan: resolved plan of dumping the model
+        :type plan: ModelDumpPlan
+        :param mode: The mode in which `to_python` should run.
+        :type mode: str
+        :param by_alias: flag to get values by alias - passed to pydantic
+        :type by_alias: bool
+        :param exclude_unset: flag to exclude not set values - passed to pydantic
+        :type exclude_unset: bool
+        :param exclude_defaults: flag to exclude default values - passed to pydantic
+        :type exclude_defaults: bool
+        :param exclude_none: flag to exclude None values - passed to pydantic
+        :type exclude_none: bool
+        :param round_trip: flag to enable serialization round-trip support
+        :type round_trip: bool
+        :return: dictionary of the model
+        :rtype: Dict
+        """
+        dict_instance = super().model_dump(
+            mode=mode,
+            include=plan.include,
+            exclude=plan.pydantic_exclude,
+            by_alias=by_alias,
+            exclude_defaults=exclude_defaults,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=False,
+        )
+        for name in plan.base64_fields:
+            value = dict_instance.get(name)
+            if value is not None and not isinstance(value, str):
+                dict_instance[name] = base64.b64encode(value).decode()
+
+        if plan.relations and not getattr(self, "__pk_only__", False):
+            self._extract_nested_models(plan=plan, dict_instance=dict_instance)
         return dict_instance
 
     @typing_extensions.deprecated(
@@ -849,55 +901,25 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         :return:
         :rtype:
         """
-        pydantic_exclude = self._update_excluded_with_related(exclude)
-        pydantic_exclude = self._update_excluded_with_pks_and_through(
-            exclude=pydantic_exclude,
+        plan = ModelDumpPlan.get(
+            model_cls=cast(Type["Model"], self.__class__),
+            include=include,
+            exclude=exclude,
+            relation_map=relation_map,
             exclude_primary_keys=exclude_primary_keys,
             exclude_through_models=exclude_through_models,
+            exclude_list=exclude_list,
         )
-        dict_instance = super().model_dump(
+        return self._dump_with_plan(
+            plan=plan,
             mode=mode,
-            include=include,
-            exclude=pydantic_exclude,
             by_alias=by_alias,
-            exclude_defaults=exclude_defaults,
             exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
             exclude_none=exclude_none,
             round_trip=round_trip,
-            warnings=False,
         )
 
-        dict_instance = {
-            k: self._convert_bytes_to_str(column_name=k, value=v)
-            for k, v in dict_instance.items()
-        }
-
-        include_dict = (
-            translate_list_to_dict(include) if isinstance(include, Set) else include
-        )
-        exclude_dict = (
-            translate_list_to_dict(exclude) if isinstance(exclude, Set) else exclude
-        )
-
-        relation_map = (
-            relation_map
-            if relation_map is not None
-            else translate_list_to_dict(self._iterate_related_models())
-        )
-        pk_only = getattr(self, "__pk_only__", False)
-        if relation_map and not pk_only:
-            dict_instance = self._extract_nested_models(
-                relation_map=relation_map,
-                dict_instance=dict_instance,
-                include=include_dict,
-                exclude=exclude_dict,
-                exclude_primary_keys=exclude_primary_keys,
-                exclude_through_models=exclude_through_models,
-                exclude_list=exclude_list,
-            )
-
-        return dict_instance
-
     @typing_extensions.deprecated(
         "The `json` method is deprecated; use `model_dump_json` instead.",
         category=OrmarDeprecatedSince020,
@@ -1090,28 +1112,6 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
             )
         return value
 
-    def _convert_bytes_to_str(self, column_name: str, value: Any) -> Union[str, Dict]:
-        """
-        Converts value to str from bytes for represent_as_base64_str columns.
-
-        :param column_name: name of the field
-        :type column_name: str
-        :param value: value fo the field
-        :type value: Any
-        :return: converted value if needed, else original value
-        :rtype: Any
-        """
-        if column_name not in self._bytes_fields:
-            return value
-        field = self.ormar_config.model_fields[column_name]
-        if (
-            value is not None
-            and not isinstance(value, str)
-            and field.represent_as_base64_str
-        ):
-            return base64.b64encode(value).decode()
-        return value
-
     def _convert_json(self, column_name: str, value: Any) -> Union[str, Dict, None]:
         """
         Converts value to/from json if needed (for Json columns).
@@ -5,9 +5,11 @@ import sqlalchemy
 from sqlalchemy.sql.schema import ColumnCollectionConstraint
 
 from ormar.fields import BaseField, ForeignKeyField, ManyToManyField
+from ormar.instrumentation import Instrument
 from ormar.models.helpers import alias_manager
 from ormar.models.utils import Extra
 from ormar.queryset.queryset import QuerySet
+from ormar.queryset.replicas import ReplicaPolicy, ReplicaRouter
 from ormar.relations import AliasManager
 from ormar.signals import SignalEmitter
 
@@ -23,6 +25,12 @@ class OrmarConfig:
         abstract: bool
         exclude_parent_fields: List[str]
         constraints: List[ColumnCollectionConstraint]
+        trusted_load: bool
+        prefetch_concurrency: int
+        prefetch_chunk_size: Optional[int]
+        instruments: List[Instrument]
+        read_replicas: List[databases.Database]
+        replica_policy: ReplicaPolicy
 
     def __init__(
         self,
@@ -36,6 +44,12 @@ class OrmarConfig:
         queryset_class: Type[QuerySet] = QuerySet,
         extra: Extra = Extra.forbid,
         constraints: Optional[List[ColumnCollectionConstraint]] = None,
+        trusted_load: bool = False,
+        prefetch_concurrency: int = 1,
+        prefetch_chunk_size: Optional[int] = None,
+        instruments: Optional[List[Instrument]] = None,
+        read_replicas: Optional[List[databases.Database]] = None,
+        replica_policy: ReplicaPolicy = ReplicaPolicy.round_robin,
     ) -> None:
         self.pkname = None  # type: ignore
         self.metadata = metadata
@@ -56,6 +70,17 @@ class OrmarConfig:
         self.exclude_parent_fields = exclude_parent_fields or []
         self.extra = extra
         self.queryset_class = queryset_class
+        self.trusted_load = trusted_load
+        self.prefetch_concurrency = prefetch_concurrency
+        self.prefetch_chunk_size = prefetch_chunk_size
+        self.instruments = list(instruments or [])
+        self.read_replicas = list(read_replicas or [])
+        self.replica_policy = ReplicaPolicy(replica_policy)
+        self.replica_router: Optional[ReplicaRouter] = (
+            ReplicaRouter(replicas=self.read_replicas, policy=self.replica_policy)
+            if self.read_replicas
+            else None
+        )
         self.table: sqlalchemy.Table = None
 
     def copy(
@@ -70,8 +95,14 @@ class OrmarConfig:
         queryset_class: Optional[Type[QuerySet]] = None,
         extra: Optional[Extra] = None,
         constraints: Optional[List[ColumnCollectionConstraint]] = None,
+        trusted_load: Optional[bool] = None,
+        prefetch_concurrency: Optional[int] = None,
+        prefetch_chunk_size: Optional[int] = None,
+        instruments: Optional[List[Instrument]] = None,
+        read_replicas: Optional[List[databases.Database]] = None,
+        replica_policy: Optional[ReplicaPolicy] = None,
     ) -> "OrmarConfig":
-        return OrmarConfig(
+        new_config = OrmarConfig(
             metadata=metadata or self.metadata,
             database=database or self.database,
             engine=engine or self.engine,
@@ -82,4 +113,16 @@ class OrmarConfig:
             queryset_class=queryset_class or self.queryset_class,
             extra=extra or self.extra,
             constraints=constraints,
+            trusted_load=(
+                trusted_load if trusted_load is not None else self.trusted_load
+            ),
+            prefetch_concurrency=prefetch_concurrency or self.prefetch_concurrency,
+            prefetch_chunk_size=prefetch_chunk_size or self.prefetch_chunk_size,
+            instruments=(instruments if instruments is not None else self.instruments),
+            read_replicas=read_replicas or self.read_replicas,
+            replica_policy=replica_policy or self.replica_policy,
         )
+        if read_replicas is None and replica_policy is None:
+            # share the router (and measured latencies) with the copied config
+            new_config.replica_router = self.replica_router
+        return new_config
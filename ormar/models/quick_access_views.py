@@ -22,10 +22,10 @@ quick_access_set = {
     "__same__",
     "_calculate_keys",
     "_convert_json",
+    "_dump_with_plan",
     "_extract_db_related_names",
     "_extract_model_db_fields",
     "_extract_nested_models",
-    "_extract_nested_models_from_list",
     "_extract_own_model_fields",
     "_extract_related_model_instead_of_field",
     "_get_not_excluded_fields",
@@ -35,6 +35,7 @@ quick_access_set = {
     "_iter",
     "_iterate_related_models",
     "_orm",
+    "_orm_changed",
     "_orm_id",
     "_orm_saved",
     "_related_names",
@@ -42,6 +43,7 @@ quick_access_set = {
     "_update_and_follow",
     "_update_excluded_with_related_not_required",
     "_verify_model_can_be_initialized",
+    "changed_fields",
     "copy",
     "delete",
     "dict",
@@ -61,6 +63,7 @@ quick_access_set = {
     "keys",
     "load",
     "load_all",
+    "mark_field_changed",
     "pk_column",
     "pk_type",
     "populate_default_values",
@@ -0,0 +1,395 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+import sqlalchemy
+
+from ormar.exceptions import ModelPersistenceError
+from ormar.queryset.utils import get_bulk_batch_size
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import ForeignKeyField, Model
+
+
+def _unwrap(instance: "Model") -> "Model":
+    """
+    Returns the model instance also if passed instance is a weakref proxy
+    (one side of each relation is kept as a proxy).
+
+    :param instance: model or proxy to model
+    :type instance: Model
+    :return: model instance
+    :rtype: Model
+    """
+    return instance.__repr__.__self__  # type: ignore
+
+
+class SavePlanner:
+    """
+    Collects models reachable through relations from the saved model and saves
+    them grouped by model class, in order of foreign key dependencies.
+
+    Models of each class are saved with bulk inserts and updates, and links of
+    many to many relations with bulk inserts to through models tables, so the
+    number of queries does not grow with the number of saved models.
+    """
+
+    def __init__(self, follow: bool, save_all: bool) -> None:
+        self.follow = follow
+        self.save_all = save_all
+        self.instances: Dict[int, "Model"] = {}
+        self.links: Dict[Tuple[int, str, int], Tuple["Model", "ForeignKeyField"]] = {}
+
+    def collect(
+        self,
+        instance: "Model",
+        relation_map: Dict,
+        previous_model: Optional["Model"] = None,
+        relation_field: Optional["ForeignKeyField"] = None,
+    ) -> None:
+        """
+        Walks the relations of the instance included in relation map and collects
+        models to save, following into related models of related models if
+        follow flag is set.
+
+        :param instance: current model
+        :type instance: Model
+        :param relation_map: map of relations to follow
+        :type relation_map: Dict
+        :param previous_model: previous model from which walk came
+        :type previous_model: Optional[Model]
+        :param relation_field: field with relation leading to this model
+        :type relation_field: Optional[ForeignKeyField]
+        """
+        if not relation_map:
+            self._add(instance, previous_model, relation_field)
+            return
+
+        fields_to_visit = {
+            field
+            for field in instance.extract_related_fields()
+            if field.name in relation_map
+        }
+        pre_save = {
+            field
+            for field in fields_to_visit
+            if not field.virtual and not field.is_multi
+        }
+        self._collect_related(instance, pre_save, relation_map)
+        self._add(instance, previous_model, relation_field)
+        self._collect_related(instance, fields_to_visit - pre_save, relation_map)
+
+    def _collect_related(
+        self, instance: "Model", fields: Set["ForeignKeyField"], relation_map: Dict
+    ) -> None:
+        """
+        Collects the models related to instance by given fields.
+
+        :param instance: current model
+        :type instance: Model
+        :param fields: relation fields to follow
+        :type fields: Set[ForeignKeyField]
+        :param relation_map: map of relations to follow
+        :type relation_map: Dict
+        """
+        for field in fields:
+            for value in instance._get_field_values(name=field.name):
+                if self.follow:
+                    self.collect(
+                        instance=value,
+                        relation_map=instance._skip_ellipsis(  # type: ignore
+                            relation_map, field.name, default_return={}
+                        ),
+                        previous_model=instance,
+                        relation_field=field,
+                    )
+                else:
+                    self._add(value, instance, field)
+
+    def _add(
+        self,
+        instance: "Model",
+        previous_model: Optional["Model"],
+        relation_field: Optional["ForeignKeyField"],
+    ) -> None:
+        """
+        Registers instance to save if:
+
+        * instance is not saved or
+        * instance have no pk or
+        * save_all=True flag is set
+
+        and instance is not __pk_only__.
+
+        If relation leading to instance is a ManyToMany also the link
+        in through model is registered.
+
+        :param instance: model to save
+        :type instance: Model
+        :param previous_model: previous model from which walk came
+        :type previous_model: Optional[Model]
+        :param relation_field: field with relation leading to this model
+        :type relation_field: Optional[ForeignKeyField]
+        """
+        instance = _unwrap(instance)
+        if instance.__pk_only__ or not (
+            self.save_all or not instance.pk or not instance.saved
+        ):
+            return
+        self.instances.setdefault(id(instance), instance)
+        if previous_model is not None and relation_field and relation_field.is_multi:
+            previous_model = _unwrap(previous_model)
+            key = (id(previous_model), relation_field.name, id(instance))
+            self.links[key] = (previous_model, relation_field)
+
+    async def save(self) -> int:
+        """
+        Saves collected models and links in many to many relations
+        in one transaction.
+
+        :return: number of saved models
+        :rtype: int
+        """
+        if not self.instances:
+            return 0
+        database = next(iter(self.instances.values())).ormar_config.database
+        async with database.transaction():
+            for model_cls, instances in self._group_instances():
+                await self._save_group(model_cls=model_cls, instances=instances)
+            await self._save_links()
+        return len(self.instances)
+
+    def _group_instances(self) -> List[Tuple[Type["Model"], List["Model"]]]:
+        """
+        Groups collected models by class and the depth of foreign key dependencies
+        on other collected models, so that each model is saved after
+        the models it refers to.
+
+        :return: list of model classes with models to save, in order of saving
+        :rtype: List[Tuple[Type[Model], List[Model]]]
+        """
+        levels: Dict[int, int] = {}
+        groups: Dict[Tuple[int, Type["Model"]], List["Model"]] = {}
+        for instance in self.instances.values():
+            level = self._get_level(instance=instance, levels=levels, visiting=set())
+            groups.setdefault((level, instance.__class__), []).append(instance)
+        return [
+            (model_cls, instances)
+            for (_, model_cls), instances in sorted(
+                groups.items(), key=lambda item: item[0][0]
+            )
+        ]
+
+    def _get_level(
+        self, instance: "Model", levels: Dict[int, int], visiting: Set[int]
+    ) -> int:
+        """
+        Returns the length of the longest chain of collected models
+        the instance depends on through foreign keys.
+
+        :param instance: model to check
+        :type instance: Model
+        :param levels: already calculated levels by id of the model
+        :type levels: Dict[int, int]
+        :param visiting: ids of models in current chain, used to break cycles
+        :type visiting: Set[int]
+        :return: level of the model
+        :rtype: int
+        """
+        key = id(instance)
+        if key not in levels:
+            if key in visiting:
+                return -1
+            visiting.add(key)
+            levels[key] = max(
+                (
+                    self._get_level(instance=target, levels=levels, visiting=visiting)
+                    + 1
+                    for target in self._get_dependencies(instance)
+                ),
+                default=0,
+            )
+            visiting.discard(key)
+        return levels[key]
+
+    def _get_dependencies(self, instance: "Model") -> Iterator["Model"]:
+        """
+        Yields collected models to which instance refers through foreign keys.
+
+        :param instance: model to check
+        :type instance: Model
+        :return: models which have to be saved before the instance
+        :rtype: Iterator[Model]
+        """
+        for name in instance._extract_db_related_names():
+            target = getattr(instance, name)
+            if target is not None and id(_unwrap(target)) in self.instances:
+                yield _unwrap(target)
+
+    async def _save_group(
+        self, model_cls: Type["Model"], instances: List["Model"]
+    ) -> None:
+        """
+        Inserts models not existing in the database and updates the existing ones.
+
+        Signals are sent for each of the models as in save and update methods.
+        If database does not support returning generated primary keys from bulk
+        inserts, new models are saved one by one.
+
+        :param model_cls: class of saved models
+        :type model_cls: Type[Model]
+        :param instances: models to save
+        :type instances: List[Model]
+        """
+        existing = await self._get_existing_pks(
+            model_cls=model_cls,
+            pks=[instance.pk for instance in instances if instance.pk is not None],
+        )
+        to_update = [instance for instance in instances if instance.pk in existing]
+        to_insert = [instance for instance in instances if instance.pk not in existing]
+        queryset = model_cls.objects
+
+        if to_insert and not queryset._returning_supported():
+            for instance in to_insert:
+                await instance.save()
+        elif to_insert:
+            for instance in to_insert:
+                await instance.signals.pre_save.send(
+                    sender=model_cls, instance=instance
+                )
+                instance._populate_fields_to_save()
+            await queryset.bulk_create(to_insert)
+            for instance in to_insert:
+                await instance.signals.post_save.send(
+                    sender=model_cls, instance=instance
+                )
+
+        if to_update:
+            for instance in to_update:
+                await instance.signals.pre_update.send(
+                    sender=model_cls, instance=instance, passed_args={}
+                )
+            await queryset._bulk_update(to_update)
+            for instance in to_update:
+                await instance.signals.post_update.send(
+                    sender=model_cls, instance=instance
+                )
+
+    @staticmethod
+    async def _get_existing_pks(model_cls: Type["Model"], pks: List[Any]) -> Set:
+        """
+        Returns primary keys, from the passed ones, that exist in the database.
+
+        :param model_cls: class of the model
+        :type model_cls: Type[Model]
+        :param pks: primary keys to check
+        :type pks: List[Any]
+        :return: existing primary keys
+        :rtype: Set
+        """
+        existing: Set = set()
+        if not pks:
+            return existing
+        database = model_cls.ormar_config.database
+        pk_column = model_cls.ormar_config.table.c[
+            model_cls.get_column_alias(model_cls.ormar_config.pkname)
+        ]
+        batch_size = get_bulk_batch_size(database=database, params_per_row=1)
+        for start in range(0, len(pks), batch_size):
+            expr = sqlalchemy.select([pk_column]).where(
+                pk_column.in_(pks[start : start + batch_size])
+            )
+            rows = await database.fetch_all(expr)
+            existing.update(row[0] for row in rows)
+        return existing
+
+    async def _save_links(self) -> None:
+        """
+        Saves links of many to many relations leading to collected models.
+
+        Links missing in the database are inserted in bulk per through model,
+        existing ones are updated if child model has through model fields set.
+        """
+        groups: Dict[Tuple[Type["Model"], str, str], Dict[Tuple, Dict]] = {}
+        for (_, _, child_id), (parent, field) in self.links.items():
+            child = self.instances[child_id]
+            if child.pk is None:  # pragma: no cover
+                raise ModelPersistenceError(
+                    f"You cannot save {child.get_name()} "
+                    f"model without primary key set! \n"
+                    f"Save the child model first."
+                )
+            queryset_proxy = getattr(parent, field.name).queryset_proxy
+            through_model = queryset_proxy.relation.through
+            owner_column = queryset_proxy.related_field.default_target_field_name()
+            child_column = queryset_proxy.related_field.default_source_field_name()
+            through = getattr(child, field.through.get_name())
+            through_dict = (
+                through.model_dump(exclude=through.extract_related_names())
+                if through
+                else {}
+            )
+            through_dict.pop(through_model.ormar_config.pkname, None)
+            groups.setdefault((through_model, owner_column, child_column), {})[
+                (parent.pk, child.pk)
+            ] = through_dict
+
+        for (through_model, owner_column, child_column), links in groups.items():
+            existing = await self._get_existing_links(
+                through_model=through_model,
+                owner_column=owner_column,
+                child_column=child_column,
+                links=list(links),
+            )
+            new_links = [
+                through_model(
+                    **{owner_column: owner_pk, child_column: child_pk, **through_dict}
+                )
+                for (owner_pk, child_pk), through_dict in links.items()
+                if (owner_pk, child_pk) not in existing
+            ]
+            if new_links:
+                await through_model.objects.bulk_create(new_links)
+            for (owner_pk, child_pk), through_dict in links.items():
+                if (owner_pk, child_pk) in existing and through_dict:
+                    await through_model.objects.filter(
+                        **{owner_column: owner_pk, child_column: child_pk}
+                    ).update(**through_dict)
+
+    @staticmethod
+    async def _get_existing_links(
+        through_model: Type["Model"],
+        owner_column: str,
+        child_column: str,
+        links: List[Tuple],
+    ) -> Set[Tuple]:
+        """
+        Returns pairs of owner and child primary keys, from the passed ones,
+        that are already linked in through model table.
+
+        :param through_model: through model of the relation
+        :type through_model: Type[Model]
+        :param owner_column: name of the field leading to owner model
+        :type owner_column: str
+        :param child_column: name of the field leading to child model
+        :type child_column: str
+        :param links: pairs of owner and child primary keys
+        :type links: List[Tuple]
+        :return: existing pairs of primary keys
+        :rtype: Set[Tuple]
+        """
+        database = through_model.ormar_config.database
+        table = through_model.ormar_config.table
+        owner_col = table.c[through_model.get_column_alias(owner_column)]
+        child_col = table.c[through_model.get_column_alias(child_column)]
+        batch_size = get_bulk_batch_size(database=database, params_per_row=2)
+        existing: Set[Tuple] = set()
+        for start in range(0, len(links), batch_size):
+            batch = links[start : start + batch_size]
+            expr = sqlalchemy.select([owner_col, child_col]).where(
+                sqlalchemy.and_(
+                    owner_col.in_({owner_pk for owner_pk, _ in batch}),
+                    child_col.in_({child_pk for _, child_pk in batch}),
+                )
+            )
+            rows = await database.fetch_all(expr)
+            existing.update((row[0], row[1]) for row in rows)
+        return existing.intersection(links)
@@ -0,0 +1,179 @@
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type
+
+from ormar.models.save_planner import SavePlanner
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+
+_current_session: ContextVar[Optional["Session"]] = ContextVar(
+    "ormar_session", default=None
+)
+
+
+class Session:
+    """
+    Identity map of models loaded from the database in the scope of the session,
+    keeping one instance per model class and primary key, together with
+    a unit of work that saves all modified instances at once.
+
+    Session is active inside `with Session():` block, it's kept in a context
+    variable so it's scoped to the current task (i.e. one request).
+
+    While session is active, rows of already known models (in queries,
+    select_related and prefetch_related) are not hydrated again - the existing
+    instances are returned, with newly loaded relations attached. Fields that
+    were excluded when the instance was loaded are filled when they are loaded
+    by the later queries.
+    """
+
+    def __init__(self) -> None:
+        self.identity_map: Dict[Tuple[Type["Model"], Any], "Model"] = {}
+        # names of the fields not loaded from the database for registered instances
+        self.unloaded: Dict[Tuple[Type["Model"], Any], Set[str]] = {}
+        self.new: List["Model"] = []
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "Session":
+        self._tokens.append(_current_session.set(self))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        _current_session.reset(self._tokens.pop())
+
+    @staticmethod
+    def current() -> Optional["Session"]:
+        """
+        Returns the session active in current context.
+
+        :return: active session if any
+        :rtype: Optional[Session]
+        """
+        return _current_session.get()
+
+    def get(self, model_cls: Type["Model"], pk: Any) -> Optional["Model"]:
+        """
+        Returns instance of the model with given primary key if it's known
+        to the session.
+
+        :param model_cls: class of the model
+        :type model_cls: Type[Model]
+        :param pk: primary key value
+        :type pk: Any
+        :return: instance of the model if exists in identity map
+        :rtype: Optional[Model]
+        """
+        return self.identity_map.get((model_cls, pk))
+
+    def add(self, instance: "Model", unloaded: Optional[Set[str]] = None) -> "Model":
+        """
+        Registers instance in the session, instances without primary key
+        are registered in identity map after they are saved in flush().
+
+        :param instance: model to register
+        :type instance: Model
+        :param unloaded: names of the fields excluded when instance was loaded
+        :type unloaded: Optional[Set[str]]
+        :return: registered model
+        :rtype: Model
+        """
+        if instance.pk is None:
+            if all(instance is not new for new in self.new):
+                self.new.append(instance)
+            return instance
+        key = (instance.__class__, instance.pk)
+        if self.identity_map.get(key) is not instance:
+            self.unloaded.pop(key, None)
+        self.identity_map[key] = instance
+        if unloaded:
+            self.unloaded[key] = set(unloaded)
+        return instance
+
+    def fill_unloaded(self, instance: "Model", values: Dict[str, Any]) -> None:
+        """
+        Sets values of the fields that were not loaded with the registered
+        instance, if they are loaded now (present in values).
+        Fields changed on the instance in the meantime are not overwritten,
+        save status and changed fields of the instance are kept.
+
+        Instances without tracked changes (i.e. marked as not saved with
+        `set_save_status(False)`) are not filled at all, as any of their fields
+        could have been set after loading.
+
+        :param instance: instance registered in the session
+        :type instance: Model
+        :param values: values of the fields loaded from the database
+        :type values: Dict[str, Any]
+        """
+        key = (instance.__class__, instance.pk)
+        unloaded = self.unloaded.get(key)
+        changed = instance.changed_fields
+        if not unloaded or changed is None:
+            return
+        loaded = unloaded.intersection(values)
+        if not loaded:
+            return
+        for name in loaded - changed:
+            setattr(instance, name, values[name])
+        instance.set_save_status(True)
+        for name in changed:
+            instance.mark_field_changed(name)
+        unloaded -= loaded
+        if not unloaded:
+            del self.unloaded[key]
+
+    def expunge(self, instance: "Model") -> None:
+        """
+        Removes instance from the session.
+
+        :param instance: model to remove
+        :type instance: Model
+        """
+        self.new = [new for new in self.new if new is not instance]
+        key = (instance.__class__, instance.pk)
+        if self.identity_map.get(key) is instance:
+            del self.identity_map[key]
+            self.unloaded.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all instances from the session.
+        """
+        self.identity_map.clear()
+        self.unloaded.clear()
+        self.new.clear()
+
+    @property
+    def dirty(self) -> List["Model"]:
+        """
+        Returns the instances registered in the session that are new
+        or were modified after loading from the database.
+
+        :return: list of modified models
+        :rtype: List[Model]
+        """
+        return [
+            instance
+            for instance in [*self.identity_map.values(), *self.new]
+            if not instance.saved and not instance.__pk_only__
+        ]
+
+    async def flush(self) -> int:
+        """
+        Saves all new and modified instances registered in the session.
+
+        Instances are saved grouped by model class in order of foreign key
+        dependencies, with bulk inserts and updates (as in `save_related`),
+        all in one transaction.
+
+        :return: number of saved models
+        :rtype: int
+        """
+        planner = SavePlanner(follow=False, save_all=False)
+        for instance in self.dirty:
+            planner.collect(instance=instance, relation_map={})
+        count = await planner.save()
+        new, self.new = self.new, []
+        for instance in new:
+            self.add(instance)
+        return count
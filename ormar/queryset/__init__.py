@@ -3,10 +3,13 @@ Contains QuerySet and different Query classes to allow for constructing of sql q
 """
 
 from ormar.queryset.actions import FilterAction, OrderAction, SelectAction
+from ormar.queryset.cache import CacheStore, LRUCacheStore
 from ormar.queryset.clause import and_, or_
+from ormar.queryset.export import ExportFormat
 from ormar.queryset.field_accessor import FieldAccessor
 from ormar.queryset.queries import FilterQuery, LimitQuery, OffsetQuery, OrderQuery
 from ormar.queryset.queryset import QuerySet
+from ormar.queryset.replicas import ReplicaPolicy
 
 __all__ = [
     "QuerySet",
@@ -20,4 +23,8 @@ __all__ = [
     "and_",
     "or_",
     "FieldAccessor",
+    "ReplicaPolicy",
+    "CacheStore",
+    "LRUCacheStore",
+    "ExportFormat",
 ]
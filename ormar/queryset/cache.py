@@ -0,0 +1,322 @@
+import abc
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Set
+from weakref import WeakKeyDictionary, WeakSet, finalize
+
+import databases
+import sqlalchemy
+from sqlalchemy.sql import visitors
+
+from ormar.queryset.utils import get_transaction_stack, is_transaction_active
+
+DEFAULT_CACHE_SIZE = 1024
+
+_stores: "WeakSet[CacheStore]" = WeakSet()
+_invalidations = 0
+# tables written in not yet finished transactions, by the root transaction,
+# invalidated at the latest when the finished transaction is garbage collected
+_pending: "WeakKeyDictionary[databases.core.Transaction, Set[str]]" = (
+    WeakKeyDictionary()
+)
+
+
+class CacheEntry:
+    """
+    Cached result of one query with the names of the tables it was read from.
+    """
+
+    __slots__ = ("value", "tables", "expires_at")
+
+    def __init__(
+        self, value: Any, tables: FrozenSet[str], expires_at: Optional[float]
+    ) -> None:
+        self.value = value
+        self.tables = tables
+        self.expires_at = expires_at
+
+    @property
+    def expired(self) -> bool:
+        """
+        Flag if time to live of the entry has passed.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+
+class CacheStore(abc.ABC):
+    """
+    Base class of the stores of cached query results.
+
+    All created stores are notified when tables are written to,
+    so subclasses overriding `__init__` have to call `super().__init__()`.
+    """
+
+    def __init__(self) -> None:
+        _stores.add(self)
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:  # pragma: no cover
+        """
+        Returns cached entry for the key or None if there is no such entry.
+
+        :param key: key of the query
+        :type key: str
+        :return: cached entry
+        :rtype: Optional[CacheEntry]
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:  # pragma: no cover
+        """
+        Stores the entry under the key.
+
+        :param key: key of the query
+        :type key: str
+        :param entry: entry to store
+        :type entry: CacheEntry
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, tables: Iterable[str]) -> None:  # pragma: no cover
+        """
+        Removes entries read from any of the tables.
+
+        :param tables: names of the tables written to
+        :type tables: Iterable[str]
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:  # pragma: no cover
+        """
+        Removes all entries.
+        """
+
+
+class LRUCacheStore(CacheStore):
+    """
+    In-process store keeping at most `maxsize` entries,
+    least recently used entries are removed first.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._keys_by_table: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expired:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        for table in entry.tables:
+            self._keys_by_table.setdefault(table, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            for key in self._keys_by_table.pop(table, set()):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_table.clear()
+
+    def _remove(self, key: str) -> None:
+        """
+        Removes the entry and its key from the index of tables.
+
+        :param key: key of the entry
+        :type key: str
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for table in entry.tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+
+
+default_store: CacheStore = LRUCacheStore()
+
+
+def set_default_store(store: CacheStore) -> None:
+    """
+    Replaces the store used by `QuerySet.cache()` if no store is passed.
+
+    :param store: new default store
+    :type store: CacheStore
+    """
+    global default_store
+    default_store = store
+
+
+def invalidate_tables(
+    tables: Iterable[str], database: Optional[databases.Database] = None
+) -> None:
+    """
+    Removes cached results of queries reading from any of the tables from all stores.
+
+    Called by ormar on each write, call it yourself after modifying the tables
+    outside of ormar (i.e. with raw sql).
+
+    If the database is passed and the write runs in a transaction, the tables
+    are invalidated again after the transaction finishes, as the results read
+    by other connections before the commit could be cached in the meantime.
+
+    :param tables: names of the tables written to
+    :type tables: Iterable[str]
+    :param database: database the tables were written to
+    :type database: Optional[databases.Database]
+    """
+    global _invalidations
+    _invalidations += 1
+    tables = list(tables)
+    for store in list(_stores):
+        store.invalidate(tables)
+    if database is not None:
+        transactions = get_transaction_stack(database.connection())
+        if transactions:
+            _record_pending(transaction=transactions[0], tables=tables)
+
+
+def _record_pending(
+    transaction: databases.core.Transaction, tables: Iterable[str]
+) -> None:
+    """
+    Remembers the tables written in the transaction to invalidate them
+    again after it finishes.
+
+    The entry is kept only as long as the transaction itself, when it's
+    garbage collected the tables are invalidated and the entry is dropped,
+    so transactions without cached queries in between do not pile up.
+
+    :param transaction: root transaction the write runs in
+    :type transaction: databases.core.Transaction
+    :param tables: names of the tables written to
+    :type tables: Iterable[str]
+    """
+    pending = _pending.get(transaction)
+    if pending is None:
+        pending = _pending[transaction] = set()
+        finalize(transaction, _invalidate_pending, pending)
+    pending.update(tables)
+
+
+def _invalidate_pending(tables: Set[str]) -> None:
+    """
+    Invalidates the tables of a finished transaction once.
+
+    :param tables: names of the tables written in the transaction
+    :type tables: Set[str]
+    """
+    if tables:
+        invalidate_tables(list(tables))
+        tables.clear()
+
+
+def invalidate_finished_transactions() -> None:
+    """
+    Invalidates again the tables written in transactions that already finished
+    (committed or rolled back) but are still referenced.
+    """
+    finished = [
+        transaction
+        for transaction in list(_pending.keys())
+        if not is_transaction_active(transaction)
+    ]
+    for transaction in finished:
+        _invalidate_pending(_pending.pop(transaction))
+
+
+class QueryCache:
+    """
+    Caches results of the queries of the queryset in the store for `ttl` seconds
+    (or until the tables the query reads from are written to if ttl is None).
+    """
+
+    __slots__ = ("store", "ttl")
+
+    def __init__(self, store: CacheStore, ttl: Optional[float]) -> None:
+        self.store = store
+        self.ttl = ttl
+
+    async def fetch(
+        self,
+        database: databases.Database,
+        method: str,
+        expression: Any,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Returns the cached result of the query or loads and caches it.
+
+        Result loaded while any table was written to is not stored,
+        as it might have been read before the write. Tables written in
+        transactions finished since the last lookup are invalidated first.
+
+        :param database: primary database of the queried model
+        :type database: databases.Database
+        :param method: name of the database method used to fetch the result
+        :type method: str
+        :param expression: query to run
+        :type expression: Any
+        :param load: callable running the query
+        :type load: Callable[[], Awaitable[Any]]
+        :return: result of the query
+        :rtype: Any
+        """
+        if _pending:
+            invalidate_finished_transactions()
+        key = self._build_key(database=database, method=method, expression=expression)
+        entry = self.store.get(key)
+        if entry is not None and not entry.expired:
+            return entry.value
+        invalidations = _invalidations
+        value = await load()
+        if invalidations == _invalidations:
+            tables = frozenset(
+                element.name
+                for element in visitors.iterate(expression)
+                if isinstance(element, sqlalchemy.Table)
+            )
+            expires_at = time.time() + self.ttl if self.ttl is not None else None
+            self.store.set(
+                key, CacheEntry(value=value, tables=tables, expires_at=expires_at)
+            )
+        return value
+
+    @staticmethod
+    def _build_key(database: databases.Database, method: str, expression: Any) -> str:
+        """
+        Builds the key of the query from compiled statement and its parameters.
+
+        :param database: primary database of the queried model
+        :type database: databases.Database
+        :param method: name of the database method used to fetch the result
+        :type method: str
+        :param expression: query to run
+        :type expression: Any
+        :return: key of the query
+        :rtype: str
+        """
+        compiled = expression.compile(dialect=database._backend._dialect)
+        params = sorted(compiled.params.items())
+        return f"{database.url.obscure_password}|{method}|{compiled}|{params!r}"
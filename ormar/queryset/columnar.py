@@ -0,0 +1,98 @@
+import array
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# typecodes of arrays used for columns of given python types (64 bit values)
+ARRAY_TYPECODES = {int: "q", float: "d"}
+
+Column = Union[List, "array.array[Any]"]
+
+
+def column_python_type(column: Any) -> Optional[type]:
+    """
+    Returns python type of the values of selected sqlalchemy column,
+    or None if the type of the column does not define it.
+
+    :param column: selected column of the query
+    :type column: sqlalchemy.Column
+    :return: python type of the column values
+    :rtype: Optional[type]
+    """
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def to_column(values: Sequence, python_type: Optional[type]) -> Column:
+    """
+    Converts values of one column to `array.array` for integer and float columns,
+    or to a list for other columns and columns with values that cannot be stored
+    in an array (nulls or integers out of 64 bit range).
+
+    :param values: values of the column
+    :type values: Sequence
+    :param python_type: python type of the column values
+    :type python_type: Optional[type]
+    :return: column of values
+    :rtype: Union[List, array.array]
+    """
+    typecode = ARRAY_TYPECODES.get(python_type)  # type: ignore
+    if typecode is not None:
+        try:
+            return array.array(typecode, values)
+        except (TypeError, OverflowError):
+            pass
+    return list(values)
+
+
+def build_columns(
+    rows: Sequence[Any],
+    keys: List[str],
+    names: List[str],
+    python_types: List[Optional[type]],
+) -> Dict[str, Column]:
+    """
+    Builds columns from raw database rows, values of all keys are extracted from
+    each row at once and transposed into columns.
+
+    :param rows: raw result rows from the database
+    :type rows: Sequence[Any]
+    :param keys: keys of the selected columns in rows
+    :type keys: List[str]
+    :param names: names of the columns in result (in order of keys)
+    :type names: List[str]
+    :param python_types: python types of the columns (in order of keys)
+    :type python_types: List[Optional[type]]
+    :return: dictionary of column name: column values
+    :rtype: Dict[str, Union[List, array.array]]
+    """
+    if not keys:
+        return dict()
+    return {
+        name: to_column(column, python_type)
+        for name, column, python_type in zip(names, transpose(rows, keys), python_types)
+    }
+
+
+def transpose(rows: Sequence[Any], keys: List[str]) -> List[Sequence]:
+    """
+    Extracts values of all keys from each row at once and transposes them
+    into columns (one sequence of values for each key).
+
+    :param rows: raw result rows from the database
+    :type rows: Sequence[Any]
+    :param keys: keys of the selected columns in rows
+    :type keys: List[str]
+    :return: list of columns in order of keys
+    :rtype: List[Sequence]
+    """
+    if not keys:
+        return []
+    getter = itemgetter(*keys)
+    values = [getter(row) for row in rows]
+    if not values:
+        return [[] for _ in keys]
+    if len(keys) == 1:
+        return [values]
+    return list(zip(*values))
@@ -0,0 +1,274 @@
+import base64
+import datetime
+import decimal
+import enum
+import json
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+from ormar.queryset.utils import translate_list_to_dict
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import ForeignKeyField, Model
+    from ormar.models.model_row import RelationRowPlan, RowPlan
+
+# index of already dumped models by primary key, together with the indexes
+# of their nested relations (by relation name)
+DumpIndex = Dict[Any, Tuple[Dict[str, Any], Dict[str, "DumpIndex"]]]
+
+
+class DumpNode:
+    """
+    Precomputed instructions how to dump one model of the query from the row,
+    resolved once from the RowPlan of the query.
+    """
+
+    __slots__ = (
+        "pk_column",
+        "columns",
+        "fk_columns",
+        "base64_columns",
+        "none_fields",
+        "empty_lists",
+        "children",
+    )
+
+    def __init__(
+        self,
+        plan: "RowPlan",
+        relation_map: Dict,
+        proxy_source_model: Optional[Type["Model"]] = None,
+        is_through: bool = False,
+    ) -> None:
+        model_cls = plan.model_cls
+        model_fields = model_cls.ormar_config.model_fields
+        pkname = model_cls.ormar_config.pkname
+        self.pk_column = ""
+        self.columns: List[Tuple[str, str]] = []
+        self.fk_columns: List[Tuple[str, str, str]] = []
+        self.base64_columns: List[str] = []
+        # through models do not repeat the relations they link,
+        # model_dump() dumps them as None
+        self.none_fields: List[str] = (
+            sorted(model_cls.extract_related_names()) if is_through else []
+        )
+        # like in model_dump() only relations in the relation map are dumped,
+        # relations leading back to the models higher in the tree are skipped
+        followed = set(relation_map) if relation_map and not is_through else set()
+        for field_name, column in plan.columns:
+            field = model_fields[field_name]
+            if field_name == pkname:
+                self.pk_column = column
+            if field.is_relation:
+                if field_name not in followed:
+                    continue
+                target_pk = cast("ForeignKeyField", field).to.ormar_config.pkname
+                self.fk_columns.append((field_name, column, target_pk))
+                continue
+            self.columns.append((field_name, column))
+            if field.__type__ is bytes and field.represent_as_base64_str:
+                self.base64_columns.append(field_name)
+        self.children = [
+            DumpRelation(
+                relation_plan=relation_plan,
+                parent_plan=plan,
+                relation_map=cast(
+                    Dict,
+                    model_cls._skip_ellipsis(
+                        relation_map, relation_plan.item_key, default_return=dict()
+                    ),
+                ),
+                proxy_source_model=proxy_source_model,
+            )
+            for relation_plan in plan.children
+            if relation_plan.item_key in followed
+        ]
+        # not loaded list relations are dumped as empty lists like in model_dump()
+        loaded = {relation.name for relation in self.children}
+        self.empty_lists: List[str] = [
+            name
+            for name in sorted(followed)
+            if name not in loaded
+            and (model_fields[name].is_multi or model_fields[name].virtual)
+        ]
+
+    def build(self, row: Any) -> Dict[str, Any]:
+        """
+        Dumps own columns of the model from the row, not loaded foreign keys
+        are dumped as dictionaries with primary key only and not loaded list
+        relations as empty lists (like in model_dump()).
+
+        :param row: raw result row from the database
+        :type row: Any
+        :return: dictionary of the model
+        :rtype: Dict[str, Any]
+        """
+        item = {field_name: row[column] for field_name, column in self.columns}
+        for field_name in self.base64_columns:
+            if isinstance(item[field_name], bytes):
+                item[field_name] = base64.b64encode(item[field_name]).decode("utf-8")
+        for field_name, column, target_pk in self.fk_columns:
+            value = row[column]
+            item[field_name] = {target_pk: value} if value is not None else None
+        for field_name in self.none_fields:
+            item[field_name] = None
+        for field_name in self.empty_lists:
+            item[field_name] = []
+        for relation in self.children:
+            item[relation.name] = [] if relation.is_list else None
+        return item
+
+
+class DumpRelation:
+    """
+    Instructions how to dump one relation of the model, with own columns
+    of the through model for many to many relations.
+    """
+
+    __slots__ = ("name", "is_list", "node", "through_name", "through")
+
+    def __init__(
+        self,
+        relation_plan: "RelationRowPlan",
+        parent_plan: "RowPlan",
+        relation_map: Dict,
+        proxy_source_model: Optional[Type["Model"]] = None,
+    ) -> None:
+        field = parent_plan.model_cls.ormar_config.model_fields[relation_plan.item_key]
+        self.name = relation_plan.item_key
+        self.is_list = bool(field.is_multi or field.virtual)
+        self.node = DumpNode(
+            plan=relation_plan.plan,
+            relation_map=relation_map,
+            proxy_source_model=proxy_source_model,
+        )
+        self.through_name = relation_plan.through_name
+        # through model of the relation to the source model of the relation proxy
+        # is set on the parent model in from_row_plan, and model_dump() skips it
+        self.through = (
+            DumpNode(plan=relation_plan.through_plan, relation_map={}, is_through=True)
+            if relation_plan.through_plan
+            and relation_plan.plan.model_cls is not proxy_source_model
+            else None
+        )
+
+
+class RowDumper:
+    """
+    Dumps rows returned by the query straight to nested dictionaries following
+    the select_related tree and fields included and excluded in the query,
+    without constructing the models.
+
+    Rows of the same model (repeated by joins of reverse and many to many
+    relations) are merged by primary key.
+    """
+
+    def __init__(
+        self, plan: "RowPlan", proxy_source_model: Optional[Type["Model"]] = None
+    ) -> None:
+        self.node = DumpNode(
+            plan=plan,
+            relation_map=translate_list_to_dict(
+                plan.model_cls._iterate_related_models()
+            ),
+            proxy_source_model=proxy_source_model,
+        )
+
+    def dump(self, rows: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Dumps the rows to the list of dictionaries of main models.
+
+        :param rows: raw result rows from the database
+        :type rows: List[Any]
+        :return: list of dictionaries
+        :rtype: List[Dict[str, Any]]
+        """
+        index: DumpIndex = {}
+        for row in rows:
+            self._dump_row(row=row, node=self.node, index=index)
+        return [item for item, _ in index.values()]
+
+    def _dump_row(
+        self, row: Any, node: DumpNode, index: DumpIndex
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Dumps the model from the row or merges the nested relations of the row
+        into the already dumped model with the same primary key.
+
+        :param row: raw result row from the database
+        :type row: Any
+        :param node: node of the model
+        :type node: DumpNode
+        :param index: already dumped models of the same relation
+        :type index: DumpIndex
+        :return: dictionary of the model (None if not in row) and flag if it's new
+        :rtype: Tuple[Optional[Dict[str, Any]], bool]
+        """
+        pk = row[node.pk_column]
+        if pk is None:
+            return None, False
+        entry = index.get(pk)
+        created = entry is None
+        if entry is None:
+            entry = (node.build(row), {})
+            index[pk] = entry
+        item, relations_index = entry
+        for relation in node.children:
+            child, child_created = self._dump_row(
+                row=row,
+                node=relation.node,
+                index=relations_index.setdefault(relation.name, {}),
+            )
+            if child is None or not child_created:
+                continue
+            if relation.is_list:
+                item[relation.name].append(child)
+            else:
+                item[relation.name] = child
+            if relation.through:
+                child[relation.through_name] = relation.through.build(row)
+        return item, created
+
+
+def encode_default(value: Any) -> Any:
+    """
+    Converts values not supported by json library, to the same representation
+    as pydantic uses in model_dump_json().
+
+    :param value: value to convert
+    :type value: Any
+    :return: converted value
+    :rtype: Any
+    """
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serializes data to json bytes, with orjson if it's installed.
+
+    :param data: data to serialize
+    :type data: Any
+    :return: json bytes
+    :rtype: bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=encode_default)
+    return json.dumps(data, default=encode_default, separators=(",", ":")).encode(
+        "utf-8"
+    )
@@ -0,0 +1,152 @@
+import base64
+import csv
+import io
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, List, Sequence, Tuple
+
+import pydantic
+
+from ormar.queryset.dump import dumps, encode_default
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar.fields import BaseField
+
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    """
+    Formats of the rows streamed by `QuerySet.stream_export()`.
+    """
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+def csv_value(value: Any) -> Any:
+    """
+    Converts value not supported by csv writer to the same representation
+    as used in json export, other values are written as they are
+    (None is written as an empty string).
+
+    :param value: value of the column
+    :type value: Any
+    :return: converted value
+    :rtype: Any
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    try:
+        return encode_default(value)
+    except TypeError:
+        return str(value)
+
+
+def base64_value(value: Any) -> Any:
+    """
+    Encodes bytes of the column represented as base64 string
+    (like in model_dump_json()).
+
+    :param value: value of the column
+    :type value: Any
+    :return: base64 string (or not changed value if it's not bytes)
+    :rtype: Any
+    """
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("utf-8")
+    return value
+
+
+def json_value(value: Any) -> Any:
+    """
+    Encodes value of json column as json string (None is written as empty string).
+
+    :param value: value of the column
+    :type value: Any
+    :return: json string
+    :rtype: Any
+    """
+    return None if value is None else dumps(value).decode("utf-8")
+
+
+class RowExporter:
+    """
+    Encodes flat rows of the query (with the same column names as in `values()`)
+    into chunks of bytes, one chunk for each batch of rows.
+
+    Values are read straight from the database rows without constructing
+    the models, so validators of the models are not applied.
+    """
+
+    __slots__ = ("export_format", "columns", "base64_columns", "csv_converters")
+
+    def __init__(
+        self,
+        export_format: ExportFormat,
+        columns: List[Tuple[str, str]],
+        fields: List["BaseField"],
+    ) -> None:
+        self.export_format = export_format
+        self.columns = columns
+        self.base64_columns: List[str] = []
+        self.csv_converters: List[Callable[[Any], Any]] = []
+        for (_, name), field in zip(columns, fields):
+            if field.__type__ is bytes and field.represent_as_base64_str:
+                self.base64_columns.append(name)
+                self.csv_converters.append(base64_value)
+            elif field.__type__ == pydantic.Json:
+                self.csv_converters.append(json_value)
+            else:
+                self.csv_converters.append(csv_value)
+
+    def header(self) -> bytes:
+        """
+        Returns the header of the export, for csv it's the line with column names.
+
+        :return: encoded header (empty for ndjson)
+        :rtype: bytes
+        """
+        if self.export_format != ExportFormat.csv:
+            return b""
+        return self._write_csv([[name for _, name in self.columns]])
+
+    def encode(self, rows: Sequence[Any]) -> bytes:
+        """
+        Encodes the batch of rows, in ndjson each row is a json object
+        in separate line, in csv each row is a line with values in order of header.
+
+        :param rows: raw result rows from the database
+        :type rows: Sequence[Any]
+        :return: encoded rows
+        :rtype: bytes
+        """
+        columns = self.columns
+        if self.export_format == ExportFormat.csv:
+            return self._write_csv(
+                [
+                    converter(row[key])
+                    for (key, _), converter in zip(columns, self.csv_converters)
+                ]
+                for row in rows
+            )
+        lines = []
+        for row in rows:
+            item = {name: row[key] for key, name in columns}
+            for name in self.base64_columns:
+                item[name] = base64_value(item[name])
+            lines.append(dumps(item) + b"\n")
+        return b"".join(lines)
+
+    @staticmethod
+    def _write_csv(lines: Any) -> bytes:
+        """
+        Writes lines of values with csv writer.
+
+        :param lines: iterable of lists of values
+        :type lines: Any
+        :return: encoded csv lines
+        :rtype: bytes
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(lines)
+        return buffer.getvalue().encode("utf-8")
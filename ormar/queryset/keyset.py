@@ -0,0 +1,187 @@
+import base64
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Type
+
+import pydantic
+from pydantic_core import to_jsonable_python
+
+import ormar  # noqa I100
+from ormar.exceptions import QueryDefinitionError
+from ormar.queryset.actions.order_action import OrderAction
+from ormar.queryset.clause import FilterGroup, and_, or_
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+
+
+class Keyset:
+    """
+    Resolves the columns used in keyset (seek) pagination from the order of
+    the queryset and converts positions in that order to and from opaque cursors.
+
+    Keyset consists of the leading orders on the main model columns, followed by
+    the primary key (if not already included) so that the order is unique.
+    """
+
+    def __init__(self, model_cls: Type["Model"], order_bys: List[OrderAction]) -> None:
+        self.model_cls = model_cls
+        self.key_orders: List[OrderAction] = []
+        self.other_orders: List[OrderAction] = []
+        self._split_orders(order_bys=order_bys)
+
+    def _split_orders(self, order_bys: List[OrderAction]) -> None:
+        """
+        Extracts the orders on main model columns, used as a key of the pagination,
+        from orders on related models, that only sort the children of main models.
+
+        If no order is set the default ordering from model config is used.
+
+        :param order_bys: list of order actions of the queryset
+        :type order_bys: List[OrderAction]
+        """
+        order_bys = order_bys or [
+            OrderAction(order_str=order_str, model_cls=self.model_cls)
+            for order_str in self.model_cls.ormar_config.orders_by
+        ]
+        for order_by in order_bys:
+            if order_by.is_source_model_order:
+                if self.other_orders:
+                    raise QueryDefinitionError(
+                        "Keyset pagination requires ordering by main model columns "
+                        "before ordering by related models columns"
+                    )
+                self.key_orders.append(order_by)
+            else:
+                self.other_orders.append(order_by)
+
+        pkname = self.model_cls.ormar_config.pkname
+        if pkname not in self.field_names:
+            self.key_orders.append(
+                OrderAction(order_str=pkname, model_cls=self.model_cls)
+            )
+
+    @property
+    def field_names(self) -> List[str]:
+        return [order.field_name for order in self.key_orders]
+
+    @property
+    def order_bys(self) -> List[OrderAction]:
+        """
+        Returns order of the queryset with unique key orders of the pagination.
+
+        :return: list of order actions
+        :rtype: List[OrderAction]
+        """
+        return self.key_orders + self.other_orders
+
+    @property
+    def reversed_order_bys(self) -> List[OrderAction]:
+        """
+        Returns order of the queryset with reversed directions of key orders,
+        used to fetch the models preceding the cursor.
+
+        :return: list of order actions
+        :rtype: List[OrderAction]
+        """
+        reversed_orders = [
+            OrderAction(
+                order_str=(
+                    order.field_name if order.direction else f"-{order.field_name}"
+                ),
+                model_cls=self.model_cls,
+            )
+            for order in self.key_orders
+        ]
+        return reversed_orders + self.other_orders
+
+    def encode(self, instance: "Model") -> str:
+        """
+        Creates an opaque cursor pointing to the position of the instance
+        in the order of the queryset.
+
+        :param instance: model instance to which cursor points
+        :type instance: Model
+        :return: cursor
+        :rtype: str
+        """
+        values = []
+        for field_name in self.field_names:
+            value = getattr(instance, field_name)
+            if isinstance(value, ormar.Model):
+                value = value.pk
+            if value is None:
+                raise QueryDefinitionError(
+                    f"Cannot create a cursor, {field_name} of "
+                    f"{self.model_cls.get_name()} is empty"
+                )
+            values.append(to_jsonable_python(value))
+        payload = json.dumps({"fields": self.field_names, "values": values})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode(self, cursor: str) -> List[Any]:
+        """
+        Extracts the values of the key columns from the cursor.
+
+        :param cursor: cursor created with encode
+        :type cursor: str
+        :return: values of the key columns
+        :rtype: List[Any]
+        """
+        try:
+            payload: Dict = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            fields, values = payload["fields"], payload["values"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise QueryDefinitionError("Invalid pagination cursor") from e
+        if fields != self.field_names or len(values) != len(fields):
+            raise QueryDefinitionError(
+                "Pagination cursor does not match the ordering of the queryset"
+            )
+        return [
+            self._validate_value(field_name=field_name, value=value)
+            for field_name, value in zip(fields, values)
+        ]
+
+    def _validate_value(self, field_name: str, value: Any) -> Any:
+        """
+        Converts the json value from the cursor back to the python type of the field.
+
+        :param field_name: name of the field
+        :type field_name: str
+        :param value: value extracted from the cursor
+        :type value: Any
+        :return: value converted to the field type
+        :rtype: Any
+        """
+        field = self.model_cls.ormar_config.model_fields[field_name]
+        field_type = field.to.pk_type() if field.is_relation else field.__type__
+        try:
+            return pydantic.TypeAdapter(field_type).validate_python(value)
+        except pydantic.ValidationError as e:
+            raise QueryDefinitionError("Invalid pagination cursor") from e
+
+    def get_filter(self, values: List[Any], before: bool = False) -> FilterGroup:
+        """
+        Builds the seek condition selecting models following (or preceding) the
+        position given by the values of the key columns.
+
+        For key (a, b) ordered ascending it's equal to `a > x or (a = x and b > y)`.
+
+        :param values: values of the key columns
+        :type values: List[Any]
+        :param before: flag if models preceding the position should be selected
+        :type before: bool
+        :return: filter group with the seek condition
+        :rtype: FilterGroup
+        """
+        conditions = []
+        for position, order in enumerate(self.key_orders):
+            descending = bool(order.direction)
+            operator = "lt" if descending != before else "gt"
+            equal = {
+                previous.field_name: value
+                for previous, value in zip(self.key_orders[:position], values)
+            }
+            conditions.append(
+                and_(**equal, **{f"{order.field_name}__{operator}": values[position]})
+            )
+        return or_(*conditions)
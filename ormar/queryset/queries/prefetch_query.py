@@ -1,4 +1,6 @@
 import abc
+import asyncio
+import copy
 import logging
 from abc import abstractmethod
 from typing import (
@@ -6,25 +8,42 @@ from typing import (
     Any,
     Dict,
     List,
+    Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
     cast,
 )
 
+import databases
+import sqlalchemy
+
 import ormar  # noqa:  I100, I202
+from ormar.instrumentation import operation, phase, track
 from ormar.queryset.clause import QueryClause
 from ormar.queryset.queries.query import Query
-from ormar.queryset.utils import translate_list_to_dict
+from ormar.queryset.replicas import read_database
+from ormar.queryset.utils import (
+    is_in_transaction,
+    new_connection,
+    translate_list_to_dict,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from ormar import ForeignKeyField, Model
     from ormar.models.excludable import ExcludableItems
     from ormar.queryset import FilterAction, OrderAction
+    from ormar.queryset.cache import QueryCache
 
 logger = logging.getLogger(__name__)
 
+# max number of ids in one prefetch query per dialect, stays below the limits
+# of bound parameters in one statement (i.e. 999 in older sqlite versions)
+DEFAULT_PREFETCH_CHUNK_SIZES = {"sqlite": 900, "postgresql": 10000, "mysql": 10000}
+DEFAULT_PREFETCH_CHUNK_SIZE = 1000
+
 
 class UniqueList(list):
     """
@@ -32,8 +51,13 @@ class UniqueList(list):
     Cannot use set as the order is important
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._seen: Set = set()
+
     def append(self, item: Any) -> None:
-        if item not in self:
+        if item not in self._seen:
+            self._seen.add(item)
             super().append(item)
 
 
@@ -72,6 +96,30 @@ class Node(abc.ABC):
         else:
             return self.relation_field.default_target_field_name()
 
+    @property
+    def root(self) -> "RootNode":
+        """
+        Returns the root node of the tree that holds the settings of whole load.
+
+        :return: root node
+        :rtype: RootNode
+        """
+        node: Node = self
+        while not isinstance(node, RootNode):
+            node = node.parent
+        return node
+
+    async def _load_children(self) -> None:
+        """
+        Triggers a data load in the child nodes.
+        Sibling nodes are loaded concurrently if the root node allows it.
+        """
+        if self.root.concurrency > 1 and len(self.children) > 1:
+            await asyncio.gather(*[child.load_data() for child in self.children])
+        else:
+            for child in self.children:
+                await child.load_data()
+
     @abstractmethod
     def extract_related_ids(self, column_name: str) -> List:  # pragma: no cover
         pass
@@ -84,24 +132,30 @@ class Node(abc.ABC):
     async def load_data(self) -> None:  # pragma: no cover
         pass
 
-    def get_filter_for_prefetch(self) -> List["FilterAction"]:
+    def get_filter_for_prefetch(
+        self, chunk_size: Optional[int] = None
+    ) -> List[List["FilterAction"]]:
         """
-        Populates where clause with condition to return only models within the
+        Populates where clauses with condition to return only models within the
         set of extracted ids.
+        Ids are split into chunks of given size, each chunk has own filter clauses.
         If there are no ids for relation the empty list is returned.
 
-        :return: list of filter clauses based on original models
-        :rtype: List[sqlalchemy.sql.elements.TextClause]
+        :param chunk_size: max number of ids in one chunk
+        :type chunk_size: Optional[int]
+        :return: list of filter clauses based on original models per chunk of ids
+        :rtype: List[List[FilterAction]]
         """
         column_name = self.relation_field.get_model_relation_fields(
             self.parent.use_alias
         )
 
         ids = self.parent.extract_related_ids(column_name=column_name)
-
-        if ids:
-            return self._prepare_filter_clauses(ids=ids)
-        return []
+        chunk_size = chunk_size or len(ids)
+        return [
+            self._prepare_filter_clauses(ids=ids[start : start + chunk_size])
+            for start in range(0, len(ids), chunk_size)
+        ]
 
     def _prepare_filter_clauses(self, ids: List) -> List["FilterAction"]:
         """
@@ -150,8 +204,7 @@ class AlreadyLoadedNode(Node):
         """
         Triggers a data load in the child nodes
         """
-        for child in self.children:
-            await child.load_data()
+        await self._load_children()
 
     def reload_tree(self) -> None:
         """
@@ -186,10 +239,89 @@ class RootNode(AlreadyLoadedNode):
     Root model Node from which both main and prefetch query originated
     """
 
-    def __init__(self, models: List["Model"]) -> None:
+    def __init__(
+        self,
+        models: List["Model"],
+        concurrency: int = 1,
+        chunk_size: Optional[int] = None,
+        query_cache: Optional["QueryCache"] = None,
+    ) -> None:
         self.models = models
         self.use_alias = False
         self.children = []
+        self.concurrency = max(concurrency, 1)
+        self.limiter = asyncio.Semaphore(self.concurrency)
+        self.chunk_size = chunk_size
+        self.query_cache = query_cache
+
+    def get_chunk_size(self, database: databases.Database) -> int:
+        """
+        Returns max number of ids used in one prefetch query, if not set explicitly
+        the default for database dialect is used.
+
+        :param database: database to run the query on
+        :type database: databases.Database
+        :return: max number of ids in one query
+        :rtype: int
+        """
+        if self.chunk_size:
+            return self.chunk_size
+        return DEFAULT_PREFETCH_CHUNK_SIZES.get(
+            database._backend._dialect.name, DEFAULT_PREFETCH_CHUNK_SIZE
+        )
+
+    async def get_rows(
+        self,
+        database: databases.Database,
+        expr: sqlalchemy.sql.Select,
+        primary: databases.Database,
+    ) -> List:
+        """
+        Returns rows of the prefetch query, taken from the cache if the cache
+        is enabled on the queryset (outside of transactions).
+
+        :param database: database to run the query on
+        :type database: databases.Database
+        :param expr: query to run
+        :type expr: sqlalchemy.sql.Select
+        :param primary: primary database of the queried model
+        :type primary: databases.Database
+        :return: rows returned by the query
+        :rtype: List
+        """
+        if self.query_cache is None or is_in_transaction(primary):
+            return await self.fetch_rows(database=database, expr=expr)
+        return await self.query_cache.fetch(
+            database=primary,
+            method="fetch_all",
+            expression=expr,
+            load=lambda: self.fetch_rows(database=database, expr=expr),
+        )
+
+    async def fetch_rows(
+        self, database: databases.Database, expr: sqlalchemy.sql.Select
+    ) -> List:
+        """
+        Runs the prefetch query, at most the concurrency number of queries
+        are run at the same time.
+
+        Concurrent queries run on separate connections from the pool,
+        unless there is an active transaction (or a database with force_rollback),
+        as they would not see changes made in that transaction.
+        Then queries share the connection and are run one after another.
+
+        :param database: database to run the query on
+        :type database: databases.Database
+        :param expr: query to run
+        :type expr: sqlalchemy.sql.Select
+        :return: rows returned by the query
+        :rtype: List
+        """
+        async with self.limiter:
+            if self.concurrency == 1 or is_in_transaction(database):
+                return await track(database.fetch_all(expr), expr)
+            async with new_connection(database) as connection:
+                return await track(connection.fetch_all(expr), expr)
 
     def reload_tree(self) -> None:
         for child in self.children:
@@ -208,6 +340,7 @@ class LoadNode(Node):
         orders_by: List["OrderAction"],
         parent: "Node",
         source_model: Type["Model"],
+        trusted_load: bool = False,
     ) -> None:
         super().__init__(relation_field=relation_field, parent=parent)
         self.excludable = excludable
@@ -216,6 +349,7 @@ class LoadNode(Node):
         self.use_alias = True
         self.grouped_models: Dict[Any, List["Model"]] = dict()
         self.source_model = source_model
+        self.trusted_load = trusted_load
 
     async def load_data(self) -> None:
         """
@@ -234,31 +368,49 @@ class LoadNode(Node):
             query_target = self.relation_field.to
             select_related = []
 
-        filter_clauses = self.get_filter_for_prefetch()
+        database = read_database(query_target.ormar_config)
+        chunks = self.get_filter_for_prefetch(
+            chunk_size=self.root.get_chunk_size(database)
+        )
 
-        if filter_clauses:
-            qry = Query(
-                model_cls=query_target,
-                select_related=select_related,
-                filter_clauses=filter_clauses,
-                exclude_clauses=[],
-                offset=None,
-                limit_count=None,
-                excludable=self.excludable,
-                order_bys=self._extract_own_order_bys(),
-                limit_raw_sql=False,
-            )
-            expr = qry.build_select_expression()
-            logger.debug(
-                expr.compile(
-                    dialect=self.source_model.ormar_config.database._backend._dialect,
-                    compile_kwargs={"literal_binds": True},
-                )
+        if chunks:
+            order_bys = self._extract_own_order_bys()
+            with phase("build"):
+                expressions = [
+                    Query(
+                        model_cls=query_target,
+                        select_related=select_related,
+                        filter_clauses=filter_clauses,
+                        exclude_clauses=[],
+                        offset=None,
+                        limit_count=None,
+                        excludable=self.excludable,
+                        order_bys=order_bys,
+                        limit_raw_sql=False,
+                    ).build_select_expression()
+                    for filter_clauses in chunks
+                ]
+            if logger.isEnabledFor(logging.DEBUG):
+                for expr in expressions:
+                    logger.debug(
+                        expr.compile(
+                            dialect=database._backend._dialect,
+                            compile_kwargs={"literal_binds": True},
+                        )
+                    )
+            chunks_rows = await asyncio.gather(
+                *[
+                    self.root.get_rows(
+                        database=database,
+                        expr=expr,
+                        primary=query_target.ormar_config.database,
+                    )
+                    for expr in expressions
+                ]
             )
-            self.rows = await query_target.ormar_config.database.fetch_all(expr)
+            self.rows = [row for rows in chunks_rows for row in rows]
 
-            for child in self.children:
-                await child.load_data()
+            await self._load_children()
 
     def _update_excludable_with_related_pks(self) -> None:
         """
@@ -315,6 +467,8 @@ class LoadNode(Node):
                 order_by.target_model == self.relation_field.to
                 and order_by.related_str.endswith(f"{own_path}")
             ):
+                # copy as order actions are shared with the main queryset
+                order_by = copy.copy(order_by)
                 order_by.is_source_model_order = True
                 order_by.table_prefix = self.table_prefix
                 own_order_bys.append(order_by)
@@ -393,6 +547,9 @@ class LoadNode(Node):
             excludable=self.excludable, alias=self.exclude_prefix
         )
         parsed_rows: Dict[Tuple, "Model"] = {}
+        model_cls = self.relation_field.to
+        pkname = model_cls.ormar_config.pkname
+        session = ormar.Session.current()
         for row in self.rows:
             item = self.relation_field.to.extract_prefixed_table_columns(
                 item={},
@@ -401,10 +558,22 @@ class LoadNode(Node):
                 excludable=self.excludable,
             )
             hashable_item = self._hash_item(item)
-            instance = parsed_rows.setdefault(
-                hashable_item,
-                self.relation_field.to(**item, **{"__excluded__": fields_to_exclude}),
-            )
+            instance = parsed_rows.get(hashable_item)
+            if instance is None and session:
+                instance = session.get(model_cls, item.get(pkname))
+                if instance is not None:
+                    session.fill_unloaded(instance=instance, values=item)
+            if instance is None:
+                instance = model_cls(
+                    **item,
+                    **{
+                        "__excluded__": fields_to_exclude,
+                        "__trusted__": self.trusted_load,
+                    },
+                )
+                if session:
+                    session.add(instance, unloaded=fields_to_exclude)
+            parsed_rows[hashable_item] = instance
             self.models.append(instance)
 
     def _hash_item(self, item: Dict) -> Tuple:
@@ -495,12 +664,20 @@ class PrefetchQuery:
         prefetch_related: List,
         select_related: List,
         orders_by: List["OrderAction"],
+        trusted_load: bool = False,
+        concurrency: int = 1,
+        chunk_size: Optional[int] = None,
+        query_cache: Optional["QueryCache"] = None,
     ) -> None:
         self.model = model_cls
         self.excludable = excludable
         self.select_dict = translate_list_to_dict(select_related, default={})
         self.prefetch_dict = translate_list_to_dict(prefetch_related, default={})
         self.orders_by = orders_by
+        self.trusted_load = trusted_load
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.query_cache = query_cache
         self.load_tasks: List[Node] = []
 
     async def prefetch_related(self, models: Sequence["Model"]) -> Sequence["Model"]:
@@ -520,15 +697,22 @@ class PrefetchQuery:
         :return: list of models with children prefetched
         :rtype: List[Model]
         """
-        parent_task = RootNode(models=cast(List["Model"], models))
+        parent_task = RootNode(
+            models=cast(List["Model"], models),
+            concurrency=self.concurrency,
+            chunk_size=self.chunk_size,
+            query_cache=self.query_cache,
+        )
         self._build_load_tree(
             prefetch_dict=self.prefetch_dict,
             select_dict=self.select_dict,
             parent=parent_task,
             model=self.model,
         )
-        await parent_task.load_data()
-        parent_task.reload_tree()
+        with operation(self.model, "prefetch_related"):
+            await parent_task.load_data()
+            with phase("hydrate"):
+                parent_task.reload_tree()
         return parent_task.models
 
     def _build_load_tree(
@@ -566,6 +750,7 @@ class PrefetchQuery:
                     orders_by=self.orders_by,
                     parent=parent,
                     source_model=self.model,
+                    trusted_load=self.trusted_load,
                 )
             if prefetch_dict:
                 self._build_load_tree(
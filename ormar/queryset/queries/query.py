@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
 
 import sqlalchemy
@@ -16,7 +17,25 @@ if TYPE_CHECKING:  # pragma no cover
     from ormar.queryset import OrderAction
 
 
+@dataclass
+class JoinPlan:
+    """
+    Resolved joins of a query - everything that depends only on the shape of the
+    query (model, select_related tree, excludable and order bys), so it can be
+    reused between queries that differ only in filter values, limit and offset.
+    """
+
+    select_from: Union[Join, Table]
+    columns: List
+    sorted_orders: Dict
+    used_aliases: List[str]
+
+
 class Query:
+    # shared cache of resolved joins keyed by the shape of the query
+    join_plans: Dict[Tuple, JoinPlan] = dict()
+    max_join_plans: int = 512
+
     def __init__(  # noqa CFQ002
         self,
         model_cls: Type["Model"],
@@ -97,6 +116,74 @@ class Query:
             and self._select_related
         )
 
+    @classmethod
+    def clear_join_plans(cls) -> None:
+        """
+        Removes all cached join plans, used when model relations change
+        (i.e. after ForwardRefs are updated).
+        """
+        cls.join_plans.clear()
+
+    def _join_plan_key(self) -> Tuple:
+        """
+        Builds a hashable key describing the shape of the query that determines
+        the joins, selected columns and sort orders. Filter values, limit and offset
+        are not part of the key as they are applied on top of the cached joins.
+
+        :return: key of the join plan
+        :rtype: Tuple
+        """
+        excludable_key = tuple(
+            sorted(
+                (key, frozenset(value.include), frozenset(value.exclude))
+                for key, value in self.excludable.items.items()
+            )
+        )
+        orders_key = tuple(
+            (
+                order.query_str,
+                order.table_prefix,
+                order.is_source_model_order,
+                order.target_model,
+            )
+            for order in self.order_columns or []
+        )
+        return (
+            self.model_cls,
+            tuple(sorted(self._select_related)),
+            excludable_key,
+            orders_key,
+        )
+
+    def _store_join_plan(self, key: Tuple) -> None:
+        """
+        Stores current joins in cache, evicting the oldest entry if cache is full.
+
+        :param key: key of the join plan
+        :type key: Tuple
+        """
+        if len(self.join_plans) >= self.max_join_plans:
+            self.join_plans.pop(next(iter(self.join_plans)))
+        self.join_plans[key] = JoinPlan(
+            select_from=self.select_from,
+            columns=self.columns[:],
+            sorted_orders=dict(self.sorted_orders),
+            used_aliases=self.used_aliases[:],
+        )
+
+    def _apply_join_plan(self, plan: JoinPlan) -> None:
+        """
+        Populates query params from cached join plan.
+        Lists and dicts are copied as they are extended in place later on.
+
+        :param plan: cached join plan
+        :type plan: JoinPlan
+        """
+        self.select_from = plan.select_from
+        self.columns = plan.columns[:]
+        self.sorted_orders = dict(plan.sorted_orders)
+        self.used_aliases = plan.used_aliases[:]
+
     def build_select_expression(self) -> sqlalchemy.sql.select:
         """
         Main entry point from outside (after proper initialization).
@@ -105,11 +192,43 @@ class Query:
         construct all required joins for select related,
         then applies all conditional and sort clauses.
 
+        Joins are resolved only once for given query shape and later reused
+        from the join plans cache.
+
         Returns ready to run query with all joins and clauses.
 
         :return: ready to run query with all joins and clauses.
         :rtype: sqlalchemy.sql.selectable.Select
         """
+        key = self._join_plan_key()
+        plan = self.join_plans.get(key)
+        if plan is not None:
+            self._apply_join_plan(plan)
+        else:
+            self._build_joins()
+            self._store_join_plan(key)
+
+        if self._pagination_query_required():
+            limit_qry, on_clause = self._build_pagination_condition()
+            self.select_from = sqlalchemy.sql.join(
+                self.select_from, limit_qry, on_clause
+            )
+
+        expr = sqlalchemy.sql.select(self.columns)
+        expr = expr.select_from(self.select_from)
+
+        expr = self._apply_expression_modifiers(expr)
+
+        # print("\n", expr.compile(compile_kwargs={"literal_binds": True}))
+        self._reset_query_parameters()
+
+        return expr
+
+    def _build_joins(self) -> None:
+        """
+        Extracts columns list to fetch and constructs all required joins
+        for select related together with their sort orders.
+        """
         self_related_fields = self.model_cls.own_table_columns(
             model=self.model_cls, excludable=self.excludable, use_alias=True
         )
@@ -145,22 +264,6 @@ class Query:
                 self.sorted_orders,
             ) = sql_join.build_join()
 
-        if self._pagination_query_required():
-            limit_qry, on_clause = self._build_pagination_condition()
-            self.select_from = sqlalchemy.sql.join(
-                self.select_from, limit_qry, on_clause
-            )
-
-        expr = sqlalchemy.sql.select(self.columns)
-        expr = expr.select_from(self.select_from)
-
-        expr = self._apply_expression_modifiers(expr)
-
-        # print("\n", expr.compile(compile_kwargs={"literal_binds": True}))
-        self._reset_query_parameters()
-
-        return expr
-
     def _build_pagination_condition(
         self,
     ) -> Tuple[
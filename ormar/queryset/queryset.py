@@ -1,8 +1,13 @@
 import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    ContextManager,
     Dict,
     Generic,
     List,
@@ -14,20 +19,18 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    overload,
 )
 
-import databases
-import sqlalchemy
-from sqlalchemy import bindparam
-
 try:
-    from sqlalchemy.engine import LegacyRow
+    from typing import Literal  # type: ignore
 except ImportError:  # pragma: no cover
-    if TYPE_CHECKING:
-
-        class LegacyRow(dict):  # type: ignore
-            pass
+    from typing_extensions import Literal  # type: ignore
 
+import databases
+import sqlalchemy
+from sqlalchemy import bindparam
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
 import ormar  # noqa I100
 from ormar import MultipleMatches, NoMatch
@@ -36,17 +39,39 @@ from ormar.exceptions import (
     ModelPersistenceError,
     QueryDefinitionError,
 )
+from ormar.instrumentation import operation, phase, track
 from ormar.queryset import FieldAccessor, FilterQuery, SelectAction
 from ormar.queryset.actions.order_action import OrderAction
+from ormar.queryset.cache import CacheStore, QueryCache, invalidate_tables
 from ormar.queryset.clause import FilterGroup, QueryClause
+from ormar.queryset.columnar import Column, build_columns, column_python_type
+from ormar.queryset.dump import RowDumper, dumps
+from ormar.queryset.export import (
+    DEFAULT_EXPORT_BATCH_SIZE,
+    ExportFormat,
+    RowExporter,
+)
+from ormar.queryset.keyset import Keyset
 from ormar.queryset.queries.prefetch_query import PrefetchQuery
 from ormar.queryset.queries.query import Query
+from ormar.queryset.records import ArrowConverter, NumpyConverter
+from ormar.queryset.replicas import fetch_read, mark_written, read_database
 from ormar.queryset.reverse_alias_resolver import ReverseAliasResolver
+from ormar.queryset.utils import (
+    get_bulk_batch_size,
+    is_in_transaction,
+    new_connection,
+)
 
 if TYPE_CHECKING:  # pragma no cover
+    import numpy
+    import pyarrow
+
     from ormar import Model
+    from ormar.fields import BaseField
     from ormar.models import T
     from ormar.models.excludable import ExcludableItems
+    from ormar.models.model_row import RowPlan
     from ormar.models.ormar_config import OrmarConfig
 else:
     T = TypeVar("T", bound="Model")
@@ -70,8 +95,12 @@ class QuerySet(Generic[T]):
         prefetch_related: Optional[List] = None,
         limit_raw_sql: bool = False,
         proxy_source_model: Optional[Type["Model"]] = None,
+        trusted_load: Optional[bool] = None,
+        proxy_relation_name: Optional[str] = None,
+        query_cache: Optional[QueryCache] = None,
     ) -> None:
         self.proxy_source_model = proxy_source_model
+        self.proxy_relation_name = proxy_relation_name
         self.model_cls = model_cls
         self.filter_clauses = [] if filter_clauses is None else filter_clauses
         self.exclude_clauses = [] if exclude_clauses is None else exclude_clauses
@@ -82,6 +111,8 @@ class QuerySet(Generic[T]):
         self._excludable = excludable or ormar.ExcludableItems()
         self.order_bys = order_bys or []
         self.limit_sql_raw = limit_raw_sql
+        self._trusted_load = trusted_load
+        self._query_cache = query_cache
 
     @property
     def model_config(self) -> "OrmarConfig":
@@ -119,6 +150,9 @@ class QuerySet(Generic[T]):
         prefetch_related: Optional[List] = None,
         limit_raw_sql: Optional[bool] = None,
         proxy_source_model: Optional[Type["Model"]] = None,
+        trusted_load: Optional[bool] = None,
+        proxy_relation_name: Optional[str] = None,
+        query_cache: Optional[QueryCache] = None,
     ) -> "QuerySet":
         """
         Method that returns new instance of queryset based on passed params,
@@ -130,6 +164,8 @@ class QuerySet(Generic[T]):
             "excludable": "_excludable",
             "prefetch_related": "_prefetch_related",
             "limit_raw_sql": "limit_sql_raw",
+            "trusted_load": "_trusted_load",
+            "query_cache": "_query_cache",
         }
         passed_args = locals()
 
@@ -150,8 +186,62 @@ class QuerySet(Generic[T]):
             prefetch_related=replace_if_none("prefetch_related"),
             limit_raw_sql=replace_if_none("limit_raw_sql"),
             proxy_source_model=replace_if_none("proxy_source_model"),
+            trusted_load=replace_if_none("trusted_load"),
+            proxy_relation_name=replace_if_none("proxy_relation_name"),
+            query_cache=replace_if_none("query_cache"),
         )
 
+    def _operation(self, name: str) -> ContextManager:
+        """
+        Returns context manager instrumenting the operation of the queryset,
+        with the path of the relation if queryset is used by a relation proxy.
+
+        :param name: name of the operation
+        :type name: str
+        :return: operation context manager
+        :rtype: ContextManager
+        """
+        relation = (
+            f"{self.proxy_source_model.__name__}." f"{self.proxy_relation_name}"
+            if self.proxy_source_model and self.proxy_relation_name
+            else None
+        )
+        return operation(self.model, name, relation=relation)
+
+    async def _fetch(self, method: str, expr: Any) -> Any:
+        """
+        Runs the read query, if cache is enabled on the queryset the result is
+        taken from the cache (outside of transactions).
+
+        :param method: name of the database method to call (i.e. fetch_all)
+        :type method: str
+        :param expr: query to run
+        :type expr: Any
+        :return: result of the query
+        :rtype: Any
+        """
+        if self._query_cache is None or is_in_transaction(self.database):
+            return await track(fetch_read(self.model_config, method, expr), expr)
+        return await self._query_cache.fetch(
+            database=self.database,
+            method=method,
+            expression=expr,
+            load=lambda: track(fetch_read(self.model_config, method, expr), expr),
+        )
+
+    @property
+    def use_trusted_load(self) -> bool:
+        """
+        Flag if models should be constructed from database rows without validation.
+        Set on QuerySet with trusted_load(), otherwise taken from model's OrmarConfig.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        if self._trusted_load is not None:
+            return self._trusted_load
+        return self.model_config.trusted_load
+
     async def _prefetch_related_models(
         self, models: List["T"], rows: List
     ) -> List["T"]:
@@ -171,33 +261,60 @@ class QuerySet(Generic[T]):
             prefetch_related=self._prefetch_related,
             select_related=self._select_related,
             orders_by=self.order_bys,
+            trusted_load=self.use_trusted_load,
+            concurrency=self.model_config.prefetch_concurrency,
+            chunk_size=self.model_config.prefetch_chunk_size,
+            query_cache=self._query_cache,
         )
-        return await query.prefetch_related(models=models)  # type: ignore
+        with phase("prefetch"):
+            return await query.prefetch_related(models=models)  # type: ignore
 
-    async def _process_query_result_rows(self, rows: List) -> List["T"]:
+    def _build_row_plan(self) -> "RowPlan":
+        """
+        Resolves the plan of constructing models from the rows returned by
+        the query, shared by all rows of the query.
+
+        :return: plan of constructing model from the row
+        :rtype: RowPlan
+        """
+        return self.model.build_row_plan(
+            select_related=self._select_related,
+            excludable=self._excludable,
+            source_model=self.model,
+            trusted_load=self.use_trusted_load,
+        )
+
+    async def _process_query_result_rows(
+        self, rows: List, row_plan: Optional["RowPlan"] = None
+    ) -> List["T"]:
         """
         Process database rows and initialize ormar Model from each of the rows.
 
+        The plan of hydrating the rows is resolved once and applied to each row.
+
         :param rows: list of database rows from query result
         :type rows: List[sqlalchemy.engine.result.RowProxy]
+        :param row_plan: already resolved plan of constructing models from rows
+        :type row_plan: Optional[RowPlan]
         :return: list of models
         :rtype: List[Model]
         """
+        row_plan = row_plan or self._build_row_plan()
+        from_row_plan = self.model.from_row_plan
+        proxy_source_model = self.proxy_source_model
         result_rows = []
-        for row in rows:
-            result_rows.append(
-                self.model.from_row(
-                    row=row,
-                    select_related=self._select_related,
-                    excludable=self._excludable,
-                    source_model=self.model,
-                    proxy_source_model=self.proxy_source_model,
+        with phase("hydrate") as hydrate:
+            for row in rows:
+                result_rows.append(
+                    from_row_plan(
+                        row=row, plan=row_plan, proxy_source_model=proxy_source_model
+                    )
                 )
-            )
-            await asyncio.sleep(0)
+                await hydrate.yield_to_loop()
 
         if result_rows:
-            return self.model.merge_instances_list(result_rows)  # type: ignore
+            with phase("merge"):
+                return self.model.merge_instances_list(result_rows)  # type: ignore
         return cast(List["T"], result_rows)
 
     def _resolve_filter_groups(
@@ -283,18 +400,19 @@ class QuerySet(Generic[T]):
         :return: built sqlalchemy select expression
         :rtype: sqlalchemy.sql.selectable.Select
         """
-        qry = Query(
-            model_cls=self.model,
-            select_related=self._select_related,
-            filter_clauses=self.filter_clauses,
-            exclude_clauses=self.exclude_clauses,
-            offset=offset or self.query_offset,
-            excludable=self._excludable,
-            order_bys=order_bys or self.order_bys,
-            limit_raw_sql=self.limit_sql_raw,
-            limit_count=limit if limit is not None else self.limit_count,
-        )
-        exp = qry.build_select_expression()
+        with phase("build"):
+            qry = Query(
+                model_cls=self.model,
+                select_related=self._select_related,
+                filter_clauses=self.filter_clauses,
+                exclude_clauses=self.exclude_clauses,
+                offset=offset or self.query_offset,
+                excludable=self._excludable,
+                order_bys=order_bys or self.order_bys,
+                limit_raw_sql=self.limit_sql_raw,
+                limit_count=limit if limit is not None else self.limit_count,
+            )
+            exp = qry.build_select_expression()
         # print("\n", exp.compile(compile_kwargs={"literal_binds": True}))
         return exp
 
@@ -457,6 +575,48 @@ class QuerySet(Generic[T]):
         related = list(set(list(self._prefetch_related) + related))
         return self.rebuild_self(prefetch_related=related)
 
+    def trusted_load(self, trusted: bool = True) -> "QuerySet[T]":
+        """
+        Allows to construct the models loaded from the database without pydantic
+        validation, which makes loading of big number of rows significantly faster.
+
+        Values are set as returned by the database driver (only defaults of not
+        loaded fields are populated and relations are registered), so custom
+        validators and type coercions of pydantic fields are not applied.
+
+        By default the value is taken from `trusted_load` in model's `OrmarConfig`.
+
+        :param trusted: flag if models should be constructed without validation
+        :type trusted: bool
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self.rebuild_self(trusted_load=trusted)
+
+    def cache(
+        self, ttl: Optional[float] = None, store: Optional[CacheStore] = None
+    ) -> "QuerySet[T]":
+        """
+        Enables caching of the results of the queryset queries (including the
+        prefetch_related queries) keyed by the compiled statement and its parameters.
+
+        Cached results are removed after ttl seconds, or when any of the tables
+        the query reads from is written to with ormar (save, update, delete,
+        bulk operations), if ttl is None they are kept until such write.
+
+        Queries run in a transaction are not cached.
+
+        :param ttl: number of seconds the result is cached
+        :type ttl: Optional[float]
+        :param store: store of cached results, in-process LRU store by default
+        :type store: Optional[CacheStore]
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        if store is None:
+            store = ormar.queryset.cache.default_store
+        return self.rebuild_self(query_cache=QueryCache(store=store, ttl=ttl))
+
     def fields(
         self, columns: Union[List, str, Set, Dict], _is_exclude: bool = False
     ) -> "QuerySet[T]":
@@ -589,17 +749,53 @@ class QuerySet(Generic[T]):
         order_bys = self.order_bys + [x for x in orders_by if x not in self.order_bys]
         return self.rebuild_self(order_bys=order_bys)
 
+    @overload
     async def values(
         self,
         fields: Union[List, str, Set, Dict, None] = None,
         exclude_through: bool = False,
+        columnar: Literal[False] = False,
         _as_dict: bool = True,
         _flatten: bool = False,
-    ) -> List:
+    ) -> List: ...
+
+    @overload
+    async def values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        *,
+        columnar: Literal[True],
+        _as_dict: bool = True,
+        _flatten: bool = False,
+    ) -> Dict[str, Column]: ...
+
+    @overload
+    async def values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        columnar: bool = False,
+        _as_dict: bool = True,
+        _flatten: bool = False,
+    ) -> Union[List, Dict[str, Column]]: ...
+
+    async def values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        columnar: bool = False,
+        _as_dict: bool = True,
+        _flatten: bool = False,
+    ) -> Union[List, Dict[str, Column]]:
         """
         Return a list of dictionaries with column values in order of the fields
         passed or all fields from queried models.
 
+        If columnar flag is set a dictionary of column name: column values is
+        returned instead. Columns of integer and float values are returned as
+        `array.array` (if they do not contain nulls), other columns as lists.
+
         To filter for given row use filter/exclude methods before values,
         to limit number of rows use limit/offset or paginate before values.
 
@@ -607,42 +803,98 @@ class QuerySet(Generic[T]):
 
         :param exclude_through: flag if through models should be excluded
         :type exclude_through: bool
+        :param columnar: flag if values should be returned as columns
+        :type columnar: bool
         :param _flatten: internal parameter to flatten one element tuples
         :type _flatten: bool
         :param _as_dict: internal parameter if return dict or tuples
         :type _as_dict: bool
         :param fields: field name or list of field names to extract from db
         :type fields:  Union[List, str, Set, Dict]
+        :return: list of rows or dictionary of columns
+        :rtype: Union[List, Dict[str, Union[List, array.array]]]
         """
         if fields:
             return await self.fields(columns=fields).values(
-                _as_dict=_as_dict, _flatten=_flatten, exclude_through=exclude_through
+                exclude_through=exclude_through,
+                columnar=columnar,
+                _as_dict=_as_dict,
+                _flatten=_flatten,
             )
-        expr = self.build_select_expression()
-        rows = await self.database.fetch_all(expr)
-        if not rows:
+        with self._operation("values"):
+            expr = self.build_select_expression()
+            rows = await self._fetch("fetch_all", expr)
+        if not rows and not columnar:
             return []
-        alias_resolver = ReverseAliasResolver(
-            select_related=self._select_related,
-            excludable=self._excludable,
-            model_cls=self.model_cls,  # type: ignore
-            exclude_through=exclude_through,
+        columns = self._resolve_selected_columns(
+            expr=expr, exclude_through=exclude_through
         )
-        column_map = alias_resolver.resolve_columns(
-            columns_names=list(cast(LegacyRow, rows[0]).keys())
-        )
-        result = [
-            {column_map.get(k): v for k, v in dict(x).items() if k in column_map}
-            for x in rows
-        ]
+        keys = [key for key, _ in columns]
+        names = [name for _, name in columns]
+        if columnar:
+            return build_columns(
+                rows=rows,
+                keys=keys,
+                names=names,
+                python_types=[
+                    column_python_type(expr.selected_columns[x]) for x in keys
+                ],
+            )
         if _as_dict:
-            return result
+            return [dict(zip(names, [row[x] for x in keys])) for row in rows]
         if _flatten and self._excludable.include_entry_count() != 1:
             raise QueryDefinitionError(
                 "You cannot flatten values_list if more than one field is selected!"
             )
-        tuple_result = [tuple(x.values()) for x in result]
-        return tuple_result if not _flatten else [x[0] for x in tuple_result]
+        if _flatten:
+            return [row[keys[0]] for row in rows]
+        return [tuple([row[x] for x in keys]) for row in rows]
+
+    def _resolve_selected_columns(
+        self, expr: sqlalchemy.sql.select, exclude_through: bool
+    ) -> List[Tuple[str, str]]:
+        """
+        Resolves prefixed columns selected by the query into relation strings
+        used as keys in `values()`, skipping columns of excluded fields.
+
+        :param expr: select expression of the query
+        :type expr: sqlalchemy.sql.select
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :return: list of (column name in rows, resolved name) in order of select
+        :rtype: List[Tuple[str, str]]
+        """
+        columns_names = list(expr.selected_columns.keys())
+        alias_resolver = ReverseAliasResolver(
+            select_related=self._select_related,
+            excludable=self._excludable,
+            model_cls=self.model_cls,  # type: ignore
+            exclude_through=exclude_through,
+        )
+        column_map = alias_resolver.resolve_columns(columns_names=columns_names)
+        return [(x, column_map[x]) for x in columns_names if x in column_map]
+
+    def _resolve_column_fields(
+        self, columns: List[Tuple[str, str]]
+    ) -> List["BaseField"]:
+        """
+        Resolves ormar fields of the selected columns, following the relations
+        in resolved names of the columns (i.e. "posts__user__name").
+
+        :param columns: list of (column name in rows, resolved name)
+        :type columns: List[Tuple[str, str]]
+        :return: list of fields in order of columns
+        :rtype: List[BaseField]
+        """
+        fields = []
+        for _, name in columns:
+            *relations, column_name = name.split("__")
+            model_cls: Type["Model"] = self.model
+            for relation in relations:
+                model_cls = model_cls.ormar_config.model_fields[relation].to
+            field_name = model_cls.get_column_name_from_alias(column_name)
+            fields.append(model_cls.ormar_config.model_fields[field_name])
+        return fields
 
     async def values_list(
         self,
@@ -684,9 +936,10 @@ class QuerySet(Generic[T]):
         :return: result of the check
         :rtype: bool
         """
-        expr = self.build_select_expression()
-        expr = sqlalchemy.exists(expr).select()
-        return await self.database.fetch_val(expr)
+        with self._operation("exists"):
+            expr = self.build_select_expression()
+            expr = sqlalchemy.exists(expr).select()
+            return await self._fetch("fetch_val", expr)
 
     async def count(self, distinct: bool = True) -> int:
         """
@@ -704,13 +957,16 @@ class QuerySet(Generic[T]):
         :return: number of rows
         :rtype: int
         """
-        expr = self.build_select_expression().alias("subquery_for_count")
-        expr = sqlalchemy.func.count().select().select_from(expr)
-        if distinct:
-            pk_column_name = self.model.get_column_alias(self.model_config.pkname)
-            expr_distinct = expr.group_by(pk_column_name).alias("subquery_for_group")
-            expr = sqlalchemy.func.count().select().select_from(expr_distinct)
-        return await self.database.fetch_val(expr)
+        with self._operation("count"):
+            expr = self.build_select_expression().alias("subquery_for_count")
+            expr = sqlalchemy.func.count().select().select_from(expr)
+            if distinct:
+                pk_column_name = self.model.get_column_alias(self.model_config.pkname)
+                expr_distinct = expr.group_by(pk_column_name).alias(
+                    "subquery_for_group"
+                )
+                expr = sqlalchemy.func.count().select().select_from(expr_distinct)
+            return await self._fetch("fetch_val", expr)
 
     async def _query_aggr_function(self, func_name: str, columns: List) -> Any:
         func = getattr(sqlalchemy.func, func_name)
@@ -723,10 +979,11 @@ class QuerySet(Generic[T]):
                     "You can use sum and svg only with" "numeric types of columns"
                 )
         select_columns = [x.apply_func(func, use_label=True) for x in select_actions]
-        expr = self.build_select_expression().alias(f"subquery_for_{func_name}")
-        expr = sqlalchemy.select(select_columns).select_from(expr)
-        # print("\n", expr.compile(compile_kwargs={"literal_binds": True}))
-        result = await self.database.fetch_one(expr)
+        with self._operation(func_name):
+            expr = self.build_select_expression().alias(f"subquery_for_{func_name}")
+            expr = sqlalchemy.select(select_columns).select_from(expr)
+            # print("\n", expr.compile(compile_kwargs={"literal_binds": True}))
+            result = await self._fetch("fetch_one", expr)
         return dict(result) if len(result) > 1 else result[0]  # type: ignore
 
     async def max(self, columns: Union[str, List[str]]) -> Any:  # noqa: A003
@@ -804,13 +1061,18 @@ class QuerySet(Generic[T]):
         updates = self.model.validate_enums(updates)
         updates = self.model.translate_columns_to_aliases(updates)
 
-        expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
-            self.table.update().values(**updates)
-        )
-        expr = FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
-            expr
-        )
-        return await self.database.execute(expr)
+        mark_written(self.database)
+        with self._operation("update"):
+            with phase("build"):
+                expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
+                    self.table.update().values(**updates)
+                )
+                expr = FilterQuery(
+                    filter_clauses=self.exclude_clauses, exclude=True
+                ).apply(expr)
+            result = await track(self.database.execute(expr), expr)
+        invalidate_tables([self.model_config.tablename], database=self.database)
+        return result
 
     async def delete(self, *args: Any, each: bool = False, **kwargs: Any) -> int:
         """
@@ -833,13 +1095,18 @@ class QuerySet(Generic[T]):
                 "You cannot delete without filtering the queryset first. "
                 "If you want to delete all rows use delete(each=True)"
             )
-        expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
-            self.table.delete()
-        )
-        expr = FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
-            expr
-        )
-        return await self.database.execute(expr)
+        mark_written(self.database)
+        with self._operation("delete"):
+            with phase("build"):
+                expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
+                    self.table.delete()
+                )
+                expr = FilterQuery(
+                    filter_clauses=self.exclude_clauses, exclude=True
+                ).apply(expr)
+            result = await track(self.database.execute(expr), expr)
+        invalidate_tables([self.model_config.tablename], database=self.database)
+        return result
 
     def paginate(self, page: int, page_size: int = 20) -> "QuerySet[T]":
         """
@@ -860,6 +1127,76 @@ class QuerySet(Generic[T]):
         query_offset = (page - 1) * page_size
         return self.rebuild_self(limit_count=limit_count, offset=query_offset)
 
+    def after(self, cursor: str) -> "QuerySet[T]":
+        """
+        Keyset (seek) pagination - returns only models following the position
+        pointed by the cursor in the current order of the queryset.
+
+        Contrary to offset, database does not have to scan and discard the
+        previous rows, so deep pages are as fast as the first one.
+
+        Cursors are created with `get_cursor()` from the last model of the page
+        and have to be used with the same ordering. Primary key is added
+        to the ordering if not already included, so that the order is unique.
+
+        :param cursor: cursor created with get_cursor
+        :type cursor: str
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self._seek(cursor=cursor, before=False)
+
+    def before(self, cursor: str) -> "QuerySet[T]":
+        """
+        Keyset (seek) pagination - returns only models preceding the position
+        pointed by the cursor in the current order of the queryset.
+
+        Note that the order of the queryset is reversed, so models closest
+        to the cursor are returned first (and limit selects models directly
+        preceding the cursor).
+
+        :param cursor: cursor created with get_cursor
+        :type cursor: str
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self._seek(cursor=cursor, before=True)
+
+    def get_cursor(self, instance: "T") -> str:
+        """
+        Creates an opaque cursor pointing to the position of the instance in the
+        current order of the queryset, to be used in `after()` and `before()`.
+
+        Only columns of the main model can be used in keyset pagination
+        and they cannot be null.
+
+        :param instance: model instance to which cursor points
+        :type instance: Model
+        :return: cursor
+        :rtype: str
+        """
+        return Keyset(model_cls=self.model, order_bys=self.order_bys).encode(
+            instance=instance
+        )
+
+    def _seek(self, cursor: str, before: bool) -> "QuerySet[T]":
+        """
+        Applies the seek condition and unique order required by keyset pagination.
+
+        :param cursor: cursor created with get_cursor
+        :type cursor: str
+        :param before: flag if models preceding the cursor should be returned
+        :type before: bool
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        keyset = Keyset(model_cls=self.model, order_bys=self.order_bys)
+        values = keyset.decode(cursor=cursor)
+        order_bys = keyset.reversed_order_bys if before else keyset.order_bys
+        return self.rebuild_self(order_bys=order_bys).filter(
+            keyset.get_filter(values=values, before=before)
+        )
+
     def limit(
         self, limit_count: int, limit_raw_sql: Optional[bool] = None
     ) -> "QuerySet[T]":
@@ -912,24 +1249,27 @@ class QuerySet(Generic[T]):
         if kwargs or args:
             return await self.filter(*args, **kwargs).first()
 
-        expr = self.build_select_expression(
-            limit=1,
-            order_bys=(
-                [
-                    OrderAction(
-                        order_str=f"{self.model.ormar_config.pkname}",
-                        model_cls=self.model_cls,  # type: ignore
-                    )
-                ]
-                if not any([x.is_source_model_order for x in self.order_bys])
-                else []
+        with self._operation("first"):
+            expr = self.build_select_expression(
+                limit=1,
+                order_bys=(
+                    [
+                        OrderAction(
+                            order_str=f"{self.model.ormar_config.pkname}",
+                            model_cls=self.model_cls,  # type: ignore
+                        )
+                    ]
+                    if not any([x.is_source_model_order for x in self.order_bys])
+                    else []
+                )
+                + self.order_bys,
             )
-            + self.order_bys,
-        )
-        rows = await self.database.fetch_all(expr)
-        processed_rows = await self._process_query_result_rows(rows)
-        if self._prefetch_related and processed_rows:
-            processed_rows = await self._prefetch_related_models(processed_rows, rows)
+            rows = await self._fetch("fetch_all", expr)
+            processed_rows = await self._process_query_result_rows(rows)
+            if self._prefetch_related and processed_rows:
+                processed_rows = await self._prefetch_related_models(
+                    processed_rows, rows
+                )
         self.check_single_result_rows_count(processed_rows)
         return processed_rows[0]  # type: ignore
 
@@ -991,28 +1331,31 @@ class QuerySet(Generic[T]):
         if kwargs or args:
             return await self.filter(*args, **kwargs).get()
 
-        if not self.filter_clauses:
-            expr = self.build_select_expression(
-                limit=1,
-                order_bys=(
-                    [
-                        OrderAction(
-                            order_str=f"-{self.model.ormar_config.pkname}",
-                            model_cls=self.model_cls,  # type: ignore
-                        )
-                    ]
-                    if not any([x.is_source_model_order for x in self.order_bys])
-                    else []
+        with self._operation("get"):
+            if not self.filter_clauses:
+                expr = self.build_select_expression(
+                    limit=1,
+                    order_bys=(
+                        [
+                            OrderAction(
+                                order_str=f"-{self.model.ormar_config.pkname}",
+                                model_cls=self.model_cls,  # type: ignore
+                            )
+                        ]
+                        if not any([x.is_source_model_order for x in self.order_bys])
+                        else []
+                    )
+                    + self.order_bys,
+                )
+            else:
+                expr = self.build_select_expression()
+
+            rows = await self._fetch("fetch_all", expr)
+            processed_rows = await self._process_query_result_rows(rows)
+            if self._prefetch_related and processed_rows:
+                processed_rows = await self._prefetch_related_models(
+                    processed_rows, rows
                 )
-                + self.order_bys,
-            )
-        else:
-            expr = self.build_select_expression()
-
-        rows = await self.database.fetch_all(expr)
-        processed_rows = await self._process_query_result_rows(rows)
-        if self._prefetch_related and processed_rows:
-            processed_rows = await self._prefetch_related_models(processed_rows, rows)
         self.check_single_result_rows_count(processed_rows)
         return processed_rows[0]  # type: ignore
 
@@ -1079,17 +1422,75 @@ class QuerySet(Generic[T]):
         if kwargs or args:
             return await self.filter(*args, **kwargs).all()
 
-        expr = self.build_select_expression()
-        rows = await self.database.fetch_all(expr)
-        result_rows = await self._process_query_result_rows(rows)
-        if self._prefetch_related and result_rows:
-            result_rows = await self._prefetch_related_models(result_rows, rows)
+        with self._operation("all"):
+            expr = self.build_select_expression()
+            rows = await self._fetch("fetch_all", expr)
+            result_rows = await self._process_query_result_rows(rows)
+            if self._prefetch_related and result_rows:
+                result_rows = await self._prefetch_related_models(result_rows, rows)
 
         return result_rows
 
+    async def dump(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Returns all rows from a database for given model for set filter options
+        as list of nested dictionaries, built straight from the database rows
+        without constructing the models, which is significantly faster for
+        read only data that is serialized anyway (i.e. in API responses).
+
+        Dictionaries follow select_related tree and fields included/excluded with
+        `fields()` and `exclude_fields()`. Not loaded foreign keys are dumped as
+        dictionaries with primary key only. Values are dumped as returned by the
+        database, so validators of the models are not applied.
+
+        Passing args and/or kwargs is a shortcut and equals to calling
+        `filter(*args, **kwargs).dump()`.
+
+        :raises QueryDefinitionError: if prefetch_related is used
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: list of dictionaries of returned models
+        :rtype: List[Dict[str, Any]]
+        """
+        if kwargs or args:
+            return await self.filter(*args, **kwargs).dump()
+        if self._prefetch_related:
+            raise QueryDefinitionError(
+                "Prefetch related queries are not supported in dump() and json(), "
+                "use select_related instead."
+            )
+
+        with self._operation("dump"):
+            expr = self.build_select_expression()
+            rows = await self._fetch("fetch_all", expr)
+            with phase("hydrate"):
+                dumper = RowDumper(
+                    plan=self._build_row_plan(),
+                    proxy_source_model=self.proxy_source_model,
+                )
+                return dumper.dump(rows)
+
+    async def json(self, *args: Any, **kwargs: Any) -> bytes:
+        """
+        Returns all rows from a database for given model for set filter options
+        as json bytes, serialized from dictionaries returned by `dump()`
+        (with orjson if it's installed).
+
+        Passing args and/or kwargs is a shortcut and equals to calling
+        `filter(*args, **kwargs).json()`.
+
+        :raises QueryDefinitionError: if prefetch_related is used
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: json array of returned models
+        :rtype: bytes
+        """
+        return dumps(await self.dump(*args, **kwargs))
+
     async def iterate(  # noqa: A003
         self,
         *args: Any,
+        batch_size: Optional[int] = None,
         **kwargs: Any,
     ) -> AsyncGenerator["T", None]:
         """
@@ -1098,21 +1499,35 @@ class QuerySet(Generic[T]):
         Passing args and/or kwargs is a shortcut and equals to calling
         `filter(*args, **kwargs).iterate()`.
 
+        If batch_size is passed the rows are fetched in batches of rows for
+        batch_size main models, each batch is hydrated (and prefetched if
+        prefetch_related is used) at once.
+
         If there are no rows meeting the criteria an empty async generator is returned.
 
+        :param batch_size: number of main models processed at once
+        :type batch_size: Optional[int]
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :return: asynchronous iterable generator of returned models
         :rtype: AsyncGenerator[Model]
         """
 
-        if self._prefetch_related:
+        if self._prefetch_related and not batch_size:
             raise QueryDefinitionError(
-                "Prefetch related queries are not supported in iterators"
+                "Prefetch related queries are supported in iterators "
+                "only with batch_size"
             )
 
         if kwargs or args:
-            async for result in self.filter(*args, **kwargs).iterate():
+            async for result in self.filter(*args, **kwargs).iterate(
+                batch_size=batch_size
+            ):
+                yield result
+            return
+
+        if batch_size:
+            async for result in self._iterate_in_batches(batch_size=batch_size):
                 yield result
             return
 
@@ -1121,20 +1536,380 @@ class QuerySet(Generic[T]):
         rows: list = []
         last_primary_key = None
         pk_alias = self.model.get_column_alias(self.model_config.pkname)
+        row_plan = self._build_row_plan()
 
-        async for row in self.database.iterate(query=expr):
+        async for row in read_database(self.model_config).iterate(query=expr):
             current_primary_key = row[pk_alias]
             if last_primary_key == current_primary_key or last_primary_key is None:
                 last_primary_key = current_primary_key
                 rows.append(row)
                 continue
 
-            yield (await self._process_query_result_rows(rows))[0]
+            yield (await self._process_query_result_rows(rows, row_plan))[0]
             last_primary_key = current_primary_key
             rows = [row]
 
         if rows:
-            yield (await self._process_query_result_rows(rows))[0]
+            yield (await self._process_query_result_rows(rows, row_plan))[0]
+
+    async def stream_export(  # noqa: CFQ002
+        self,
+        format: Union[str, ExportFormat] = ExportFormat.ndjson,  # noqa: A002
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Return async generator of encoded chunks of bytes with all rows from
+        a database for given model, meant to be passed to streaming responses
+        (i.e. `StreamingResponse` in fastapi).
+
+        Rows are flat, with the same column names as in `values()` (relation
+        strings for columns of related models), respecting `fields()`,
+        `exclude_fields()` and `select_related()`.
+
+        Rows are streamed from one cursor and encoded straight from the database
+        rows in batches of batch_size rows (one chunk for each batch), without
+        constructing the models, so validators of the models are not applied.
+
+        In `ndjson` format each row is a json object in a separate line,
+        in `csv` format first chunk is a header with column names.
+
+        :raises QueryDefinitionError: if format is not supported
+        :param format: format of the export, "ndjson" or "csv"
+        :type format: Union[str, ExportFormat]
+        :param batch_size: number of rows encoded in one chunk
+        :type batch_size: int
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :return: asynchronous generator of encoded chunks
+        :rtype: AsyncGenerator[bytes]
+        """
+        if fields:
+            async for chunk in self.fields(columns=fields).stream_export(
+                format=format, batch_size=batch_size, exclude_through=exclude_through
+            ):
+                yield chunk
+            return
+        try:
+            export_format = ExportFormat(format)
+        except ValueError as e:
+            raise QueryDefinitionError(
+                f"Unsupported export format: {format}, "
+                f"use one of: {', '.join(x.value for x in ExportFormat)}."
+            ) from e
+
+        expr = self.build_select_expression()
+        columns = self._resolve_selected_columns(
+            expr=expr, exclude_through=exclude_through
+        )
+        exporter = RowExporter(
+            export_format=export_format,
+            columns=columns,
+            fields=self._resolve_column_fields(columns),
+        )
+        header = exporter.header()
+        if header:
+            yield header
+        async for rows in self._fetch_raw_row_batches(expr, batch_size=batch_size):
+            yield exporter.encode(rows)
+
+    async def to_arrow(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> "pyarrow.Table":
+        """
+        Return a `pyarrow.Table` with columns of all rows from a database
+        for given model, requires `pyarrow` to be installed.
+
+        Columns are flat, with the same names as in `values()` (relation
+        strings for columns of related models), respecting `fields()`,
+        `exclude_fields()` and `select_related()`. Types of the columns follow
+        types of the ormar fields, uuids and jsons are stored as strings.
+
+        Rows are streamed from one cursor and converted straight from the database
+        rows in record batches of batch_size rows, without constructing the models.
+
+        :raises QueryDefinitionError: if pyarrow is not installed
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param batch_size: number of rows converted in one record batch
+        :type batch_size: int
+        :return: table with all rows
+        :rtype: pyarrow.Table
+        """
+        if fields:
+            return await self.fields(columns=fields).to_arrow(
+                exclude_through=exclude_through, batch_size=batch_size
+            )
+        return await self._convert_rows(
+            converter_cls=ArrowConverter,
+            exclude_through=exclude_through,
+            batch_size=batch_size,
+        )
+
+    async def iterate_arrow(
+        self,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+    ) -> AsyncGenerator["pyarrow.RecordBatch", None]:
+        """
+        Return async generator of `pyarrow.RecordBatch` with batch_size rows each,
+        for results too large to be converted at once.
+        Columns are the same as in `to_arrow()`, requires `pyarrow` to be installed.
+
+        :raises QueryDefinitionError: if pyarrow is not installed
+        :param batch_size: number of rows converted in one record batch
+        :type batch_size: int
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :return: asynchronous generator of record batches
+        :rtype: AsyncGenerator[pyarrow.RecordBatch]
+        """
+        if fields:
+            async for batch in self.fields(columns=fields).iterate_arrow(
+                batch_size=batch_size, exclude_through=exclude_through
+            ):
+                yield batch
+            return
+        expr = self.build_select_expression()
+        converter = ArrowConverter(
+            *self._resolve_converted_columns(expr, exclude_through)
+        )
+        async for rows in self._fetch_raw_row_batches(expr, batch_size=batch_size):
+            yield converter.convert(rows)
+
+    async def to_numpy(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> Dict[str, "numpy.ndarray"]:
+        """
+        Return a dictionary of column name: `numpy.ndarray` with values of all rows
+        from a database for given model, requires `numpy` to be installed.
+
+        Columns are the same as in `values()`. Integer, float, decimal, boolean,
+        date and datetime columns are returned as arrays of native numpy types
+        (nulls as `nan` / `NaT`, integer columns with nulls as floats),
+        other columns as arrays of python objects.
+
+        Rows are streamed from one cursor and converted in batches of
+        batch_size rows, without constructing the models.
+
+        :raises QueryDefinitionError: if numpy is not installed
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param batch_size: number of rows converted at once
+        :type batch_size: int
+        :return: dictionary of columns
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        if fields:
+            return await self.fields(columns=fields).to_numpy(
+                exclude_through=exclude_through, batch_size=batch_size
+            )
+        return await self._convert_rows(
+            converter_cls=NumpyConverter,
+            exclude_through=exclude_through,
+            batch_size=batch_size,
+        )
+
+    async def _convert_rows(
+        self,
+        converter_cls: Type[Union[ArrowConverter, NumpyConverter]],
+        exclude_through: bool,
+        batch_size: int,
+    ) -> Any:
+        """
+        Converts batches of streamed rows with given converter and combines
+        the converted batches into one result.
+
+        :param converter_cls: class of the converter of rows
+        :type converter_cls: Type[Union[ArrowConverter, NumpyConverter]]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param batch_size: number of rows converted at once
+        :type batch_size: int
+        :return: combined result of the converter
+        :rtype: Any
+        """
+        expr = self.build_select_expression()
+        converter = converter_cls(
+            *self._resolve_converted_columns(expr, exclude_through)
+        )
+        batches = [
+            converter.convert(rows)
+            async for rows in self._fetch_raw_row_batches(expr, batch_size=batch_size)
+        ]
+        return converter.combine(batches)  # type: ignore
+
+    def _resolve_converted_columns(
+        self, expr: sqlalchemy.sql.select, exclude_through: bool
+    ) -> Tuple[List[Tuple[str, str]], List[Any]]:
+        """
+        Resolves selected columns of the query together with their sqlalchemy
+        types, used by converters of the rows.
+
+        :param expr: select expression of the query
+        :type expr: sqlalchemy.sql.select
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :return: list of (column name in rows, resolved name) and list of types
+        :rtype: Tuple[List[Tuple[str, str]], List[Any]]
+        """
+        columns = self._resolve_selected_columns(
+            expr=expr, exclude_through=exclude_through
+        )
+        sql_types = [expr.selected_columns[key].type for key, _ in columns]
+        return columns, sql_types
+
+    async def _fetch_raw_row_batches(
+        self, expr: sqlalchemy.sql.select, batch_size: int
+    ) -> AsyncGenerator[List, None]:
+        """
+        Yields lists of batch_size rows of the query streamed from one cursor,
+        regardless of the models the rows belong to.
+
+        :param expr: select expression of the query
+        :type expr: sqlalchemy.sql.select
+        :param batch_size: number of rows in one batch
+        :type batch_size: int
+        :return: asynchronous generator of lists of rows
+        :rtype: AsyncGenerator[List]
+        """
+        rows: list = []
+        in_transaction = is_in_transaction(self.database)
+        async with self._streaming_connection(in_transaction) as connection:
+            async for row in connection.iterate(query=expr):
+                rows.append(row)
+                if len(rows) == batch_size:
+                    yield rows
+                    rows = []
+        if rows:
+            yield rows
+
+    async def _iterate_in_batches(self, batch_size: int) -> AsyncGenerator["T", None]:
+        """
+        Hydrates and yields models from batches of rows, if prefetch_related is
+        set the related models are prefetched for each batch separately.
+
+        :param batch_size: number of main models processed at once
+        :type batch_size: int
+        :return: asynchronous iterable generator of returned models
+        :rtype: AsyncGenerator[Model]
+        """
+        row_plan = self._build_row_plan()
+        async for rows in self._fetch_row_batches(batch_size=batch_size):
+            result_rows = await self._process_query_result_rows(rows, row_plan)
+            if self._prefetch_related and result_rows:
+                result_rows = await self._prefetch_related_models(result_rows, rows)
+            for result in result_rows:
+                yield result
+
+    async def _fetch_row_batches(self, batch_size: int) -> AsyncGenerator[List, None]:
+        """
+        Yields lists of rows, each with rows of batch_size main models.
+
+        Rows are streamed from one cursor. Outside of transaction the cursor is
+        opened on a separate connection from the pool, so queries issued while
+        the cursor is open (i.e. prefetch queries) do not wait for it.
+
+        Inside a transaction there is only one connection, so if related models
+        have to be prefetched the batches are fetched in separate queries with
+        limit and offset instead.
+
+        :param batch_size: number of main models in one batch
+        :type batch_size: int
+        :return: asynchronous generator of lists of rows
+        :rtype: AsyncGenerator[List]
+        """
+        in_transaction = is_in_transaction(self.database)
+        if self._prefetch_related and in_transaction:
+            async for page_rows in self._fetch_paginated_row_batches(batch_size):
+                yield page_rows
+            return
+
+        expr = self.build_select_expression()
+        pk_alias = self.model.get_column_alias(self.model_config.pkname)
+        rows: list = []
+        models_count = 0
+        last_primary_key = None
+        async with self._streaming_connection(in_transaction) as connection:
+            async for row in connection.iterate(query=expr):
+                current_primary_key = row[pk_alias]
+                if current_primary_key != last_primary_key or not rows:
+                    if models_count == batch_size:
+                        yield rows
+                        rows = []
+                        models_count = 0
+                    models_count += 1
+                    last_primary_key = current_primary_key
+                rows.append(row)
+        if rows:
+            yield rows
+
+    @asynccontextmanager
+    async def _streaming_connection(
+        self, in_transaction: bool
+    ) -> AsyncIterator[databases.core.Connection]:
+        """
+        Provides connection on which the rows of iterated query are streamed.
+
+        :param in_transaction: flag if current task runs in a transaction
+        :type in_transaction: bool
+        :return: connection used to stream the rows
+        :rtype: AsyncIterator[databases.core.Connection]
+        """
+        if in_transaction:
+            yield self.database.connection()
+            return
+        database = read_database(self.model_config)
+        async with new_connection(database) as connection:
+            # server side cursors (i.e. in postgresql) require a transaction
+            async with connection.transaction():
+                yield connection
+
+    async def _fetch_paginated_row_batches(
+        self, batch_size: int
+    ) -> AsyncGenerator[List, None]:
+        """
+        Yields lists of rows, each with rows of batch_size main models,
+        each batch is fetched with separate query with limit and offset
+        (respecting limit and offset already set on the queryset).
+
+        :param batch_size: number of main models in one batch
+        :type batch_size: int
+        :return: asynchronous generator of lists of rows
+        :rtype: AsyncGenerator[List]
+        """
+        offset = self.query_offset or 0
+        remaining = self.limit_count
+        while remaining is None or remaining > 0:
+            limit_count = (
+                batch_size if remaining is None else min(batch_size, remaining)
+            )
+            queryset = self.rebuild_self(
+                offset=offset, limit_count=limit_count, limit_raw_sql=False
+            )
+            rows = await self.database.fetch_all(queryset.build_select_expression())
+            if not rows:
+                return
+            yield rows
+            offset += limit_count
+            if remaining is not None:
+                remaining -= limit_count
 
     async def create(self, **kwargs: Any) -> "T":
         """
@@ -1152,7 +1927,9 @@ class QuerySet(Generic[T]):
         instance = await instance.save()
         return instance
 
-    async def bulk_create(self, objects: List["T"]) -> None:
+    async def bulk_create(
+        self, objects: List["T"], batch_size: Optional[int] = None
+    ) -> None:
         """
         Performs a bulk create in one database session to speed up the process.
 
@@ -1160,30 +1937,347 @@ class QuerySet(Generic[T]):
 
         A valid list of `Model` objects needs to be passed.
 
+        Objects are inserted in batches, each with one statement, and all batches
+        are executed in one transaction. By default the size of the batch is
+        adjusted to the limit of bound parameters in one statement of the database.
+
+        If database supports `RETURNING` clause, generated primary keys and
+        server defaults are populated on passed objects.
+
         Bulk operations do not send signals.
 
         :param objects: list of ormar models already initialized and ready to save.
         :type objects: List[Model]
+        :param batch_size: max number of objects inserted in one statement
+        :type batch_size: Optional[int]
         """
 
         if not objects:
             raise ModelListEmptyError("Bulk create objects are empty!")
 
-        ready_objects = []
+        with self._operation("bulk_create"):
+            # reverse and many to many relations are not stored in model table
+            exclude = self.model.extract_related_names().difference(
+                self.model._extract_db_related_names()
+            )
+            ready_objects = []
+            for obj in objects:
+                ready_objects.append(
+                    obj.prepare_model_to_save(obj.model_dump(exclude=exclude))
+                )
+                await asyncio.sleep(0)  # Allow context switching to prevent blocking
+
+            pk_alias = self.model.get_column_alias(self.model_config.pkname)
+            await self._bulk_insert(
+                objects=objects,
+                ready_objects=ready_objects,
+                build_statement=lambda batch: self.table.insert().values(batch),
+                match_columns=[pk_alias],
+                batch_size=batch_size,
+            )
+
         for obj in objects:
-            ready_objects.append(obj.prepare_model_to_save(obj.model_dump()))
-            await asyncio.sleep(0)  # Allow context switching to prevent blocking
+            obj.set_save_status(True)
 
-        # don't use execute_many, as in databases it's executed in a loop
-        # instead of using execute_many from drivers
-        expr = self.table.insert().values(ready_objects)
-        await self.database.execute(expr)
+    async def bulk_upsert(
+        self,
+        objects: List["T"],
+        conflict_columns: Optional[List[str]] = None,
+        update_columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Performs a bulk insert or update of passed objects, each batch of objects
+        is saved with one statement - `INSERT ... ON CONFLICT DO UPDATE`
+        in postgresql and sqlite or `INSERT ... ON DUPLICATE KEY UPDATE` in mysql.
+
+        Objects that conflict with existing rows on `conflict_columns`
+        (primary key by default) update the `update_columns` of those rows (by
+        default all columns set on objects apart from conflict columns).
+        If update columns are empty, conflicting objects are skipped.
+
+        In mysql conflicts are resolved by all unique indexes of the table,
+        so conflict_columns are not used.
+
+        If database supports `RETURNING` clause, primary keys and server defaults
+        are populated on passed objects (skipped objects are not populated).
+
+        Bulk operations do not send signals.
+
+        :param objects: list of ormar models already initialized and ready to save.
+        :type objects: List[Model]
+        :param conflict_columns: names of fields of unique constraint or index
+        :type conflict_columns: Optional[List[str]]
+        :param update_columns: names of fields updated on conflict
+        :type update_columns: Optional[List[str]]
+        :param batch_size: max number of objects saved in one statement
+        :type batch_size: Optional[int]
+        """
+        if not objects:
+            raise ModelListEmptyError("Bulk upsert objects are empty!")
+
+        dialect_name = self.database._backend._dialect.name
+        dialect_insert = {
+            "postgresql": postgresql.insert,
+            "sqlite": sqlite.insert,
+            "mysql": mysql.insert,
+        }.get(dialect_name)
+        if dialect_insert is None:  # pragma: no cover
+            raise QueryDefinitionError(
+                f"Bulk upsert is not supported in {dialect_name} database"
+            )
+
+        with self._operation("bulk_upsert"):
+            conflict_columns = [
+                self.model.get_column_alias(name)
+                for name in conflict_columns or [self.model_config.pkname]
+            ]
+            # reverse and many to many relations are not stored in model table
+            exclude = self.model.extract_related_names().difference(
+                self.model._extract_db_related_names()
+            )
+            ready_objects = []
+            for obj in objects:
+                ready_objects.append(
+                    obj.prepare_model_to_save(obj.model_dump(exclude=exclude))
+                )
+                await asyncio.sleep(0)  # Allow context switching to prevent blocking
+
+            def build_statement(batch: List[Dict]) -> sqlalchemy.sql.Insert:
+                expr = dialect_insert(self.table).values(batch)
+                # update only the columns present in inserted values, otherwise
+                # not set columns would be overwritten with server defaults
+                columns = [
+                    column
+                    for column in (
+                        [self.model.get_column_alias(name) for name in update_columns]
+                        if update_columns is not None
+                        else list(batch[0])
+                    )
+                    if column in batch[0] and column not in conflict_columns
+                ]
+                if dialect_name == "mysql":
+                    columns = columns or conflict_columns[:1]
+                    return expr.on_duplicate_key_update(
+                        {column: expr.inserted[column] for column in columns}
+                    )
+                if not columns:
+                    return expr.on_conflict_do_nothing(index_elements=conflict_columns)
+                return expr.on_conflict_do_update(
+                    index_elements=conflict_columns,
+                    set_={column: expr.excluded[column] for column in columns},
+                )
+
+            await self._bulk_insert(
+                objects=objects,
+                ready_objects=ready_objects,
+                build_statement=build_statement,
+                match_columns=conflict_columns,
+                batch_size=batch_size,
+            )
 
         for obj in objects:
             obj.set_save_status(True)
 
-    async def bulk_update(  # noqa:  CCR001
-        self, objects: List["T"], columns: Optional[List[str]] = None
+    async def _bulk_insert(
+        self,
+        objects: List["T"],
+        ready_objects: List[Dict],
+        build_statement: Callable[[List[Dict]], sqlalchemy.sql.Insert],
+        match_columns: List[str],
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Inserts prepared objects values in batches, each with one statement,
+        all batches are executed in one transaction.
+
+        If database supports RETURNING, values generated by the database are
+        populated on objects.
+
+        :param objects: inserted models
+        :type objects: List[Model]
+        :param ready_objects: values of the models prepared to save
+        :type ready_objects: List[Dict]
+        :param build_statement: function building insert statement for a batch
+        :type build_statement: Callable[[List[Dict]], sqlalchemy.sql.Insert]
+        :param match_columns: columns used to match returned rows with objects
+        :type match_columns: List[str]
+        :param batch_size: max number of objects inserted in one statement
+        :type batch_size: Optional[int]
+        """
+        batch_size = batch_size or get_bulk_batch_size(
+            database=self.database, params_per_row=len(self.table.columns)
+        )
+        returning_columns = self._get_returning_columns(extra_columns=match_columns)
+        # multi row insert takes columns from the first row, so objects with
+        # different set of columns (i.e. not set server defaults) are split
+        groups: Dict[Tuple, List[int]] = {}
+        for index, ready_object in enumerate(ready_objects):
+            groups.setdefault(tuple(ready_object), []).append(index)
+
+        mark_written(self.database)
+        # don't use execute_many, as in databases it's executed in a loop
+        # instead of using execute_many from drivers
+        async with self.database.transaction():
+            for indexes in groups.values():
+                for start in range(0, len(indexes), batch_size):
+                    batch_indexes = indexes[start : start + batch_size]
+                    batch = [ready_objects[index] for index in batch_indexes]
+                    expr = build_statement(batch)
+                    returning_expr = self._add_returning_clause(
+                        expr=expr, columns=returning_columns
+                    )
+                    if returning_expr is None:
+                        await track(self.database.execute(expr), expr)
+                        continue
+                    rows = await track(
+                        self.database.fetch_all(returning_expr), returning_expr
+                    )
+                    self._populate_returned_values(
+                        objects=[objects[index] for index in batch_indexes],
+                        ready_objects=batch,
+                        rows=rows,
+                        columns=returning_columns,
+                        match_columns=match_columns,
+                    )
+        invalidate_tables([self.model_config.tablename], database=self.database)
+
+    def _get_returning_columns(
+        self, extra_columns: Optional[List[str]] = None
+    ) -> List[sqlalchemy.Column]:
+        """
+        Returns columns populated by the database on insert - primary key
+        and columns with server default, together with passed extra columns.
+
+        :param extra_columns: names of additional columns to return
+        :type extra_columns: Optional[List[str]]
+        :return: list of columns
+        :rtype: List[sqlalchemy.Column]
+        """
+        column_names = [
+            field.get_alias()
+            for name, field in self.model_config.model_fields.items()
+            if field.get_alias() in self.table.c
+            and (name == self.model_config.pkname or field.server_default is not None)
+        ]
+        column_names += [
+            name for name in extra_columns or [] if name not in column_names
+        ]
+        return [self.table.c[name] for name in column_names]
+
+    def _add_returning_clause(
+        self, expr: sqlalchemy.sql.Insert, columns: List[sqlalchemy.Column]
+    ) -> Optional[sqlalchemy.sql.expression.Executable]:
+        """
+        Adds RETURNING clause to multi row insert statement if database supports it.
+
+        Sqlalchemy 1.4 supports RETURNING in multi row insert only for postgresql,
+        in sqlite (since version 3.35) the clause is appended to the compiled
+        statement and bound parameters keep their types.
+
+        :param expr: insert statement
+        :type expr: sqlalchemy.sql.Insert
+        :param columns: columns to return
+        :type columns: List[sqlalchemy.Column]
+        :return: statement with RETURNING clause or None if it's not supported
+        :rtype: Optional[sqlalchemy.sql.expression.Executable]
+        """
+        if not self._returning_supported():
+            return None
+        dialect = self.database._backend._dialect
+        if getattr(dialect, "full_returning", False):
+            return expr.returning(*columns)
+        compiled = expr.compile(dialect=sqlite.dialect(paramstyle="named"))
+        quote = dialect.identifier_preparer.quote
+        returning = ", ".join(quote(column.name) for column in columns)
+        params = compiled.params
+        return (
+            sqlalchemy.text(f"{compiled.string} RETURNING {returning}")
+            .bindparams(
+                *[
+                    bindparam(name, params[name], type_=bind.type)
+                    for bind, name in compiled.bind_names.items()
+                ]
+            )
+            .columns(*columns)
+        )
+
+    def _returning_supported(self) -> bool:
+        """
+        Checks if database of the model supports RETURNING clause
+        in multi row insert statements.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        dialect = self.database._backend._dialect
+        if getattr(dialect, "full_returning", False):
+            return True
+        return dialect.name == "sqlite" and sqlite3.sqlite_version_info >= (3, 35, 0)
+
+    def _populate_returned_values(
+        self,
+        objects: List["T"],
+        ready_objects: List[Dict],
+        rows: List,
+        columns: List[sqlalchemy.Column],
+        match_columns: List[str],
+    ) -> None:
+        """
+        Sets values returned from the database on inserted objects.
+
+        Objects with values of match columns set are matched by those columns,
+        otherwise rows are matched in order of insertion (with autoincrement
+        primary key the returned rows are sorted by the key, as it grows with
+        each row).
+
+        :param objects: inserted models
+        :type objects: List[Model]
+        :param ready_objects: values of the models that were inserted
+        :type ready_objects: List[Dict]
+        :param rows: rows returned by the database
+        :type rows: List
+        :param columns: returned columns
+        :type columns: List[sqlalchemy.Column]
+        :param match_columns: columns used to match returned rows with objects
+        :type match_columns: List[str]
+        """
+        pkname = self.model_config.pkname
+        pk_alias = self.model.get_column_alias(pkname)
+        # returned row for each of the objects (None if there is no matching row)
+        matched_rows: List[Any]
+        if all(
+            obj.get(column) is not None
+            for obj in ready_objects
+            for column in match_columns
+        ):
+            rows_by_key = {
+                tuple(row[column] for column in match_columns): row for row in rows
+            }
+            matched_rows = [
+                rows_by_key.get(tuple(obj[column] for column in match_columns))
+                for obj in ready_objects
+            ]
+        elif self.model_config.model_fields[pkname].autoincrement:
+            matched_rows = sorted(rows, key=lambda row: row[pk_alias])
+        else:
+            matched_rows = list(rows)
+
+        for obj, row in zip(objects, matched_rows):
+            if row is None:
+                continue
+            for column in columns:
+                setattr(
+                    obj,
+                    self.model.get_column_name_from_alias(column.name),
+                    row[column.name],
+                )
+
+    async def bulk_update(
+        self,
+        objects: List["T"],
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         """
         Performs bulk update in one database session to speed up the process.
@@ -1193,7 +2287,15 @@ class QuerySet(Generic[T]):
         All `Models` passed need to have primary key column populated.
 
         You can also select which fields to update by passing `columns` list
-        as a list of string names.
+        as a list of string names. Without `columns` only the fields changed
+        since each model was loaded or saved are updated (all fields for models
+        not loaded from the database), models without changes are skipped.
+
+        Each batch of objects is updated with one statement
+        (`UPDATE ... SET column = CASE pk WHEN ... END WHERE pk IN (...)`),
+        all batches are executed in one transaction.
+        By default the size of the batch is adjusted to the limit of bound
+        parameters in one statement of the database.
 
         Bulk operations do not send signals.
 
@@ -1201,12 +2303,39 @@ class QuerySet(Generic[T]):
         :type objects: List[Model]
         :param columns: list of columns to update
         :type columns: List[str]
+        :param batch_size: max number of objects updated in one statement
+        :type batch_size: Optional[int]
         """
         if not objects:
             raise ModelListEmptyError("Bulk update objects are empty!")
 
+        await self._bulk_update(objects=objects, columns=columns, batch_size=batch_size)
+
+        await cast(
+            Type["Model"], self.model_cls
+        ).ormar_config.signals.post_bulk_update.send(
+            sender=self.model_cls, instances=objects  # type: ignore
+        )
+
+    async def _bulk_update(  # noqa:  CCR001
+        self,
+        objects: List["T"],
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Updates objects in batches, each with one statement, without sending signals.
+
+        :param objects: list of ormar models
+        :type objects: List[Model]
+        :param columns: list of columns to update
+        :type columns: List[str]
+        :param batch_size: max number of objects updated in one statement
+        :type batch_size: Optional[int]
+        """
         ready_objects = []
         pk_name = self.model_config.pkname
+        track_changes = not columns
         if not columns:
             columns = list(
                 self.model.extract_db_own_fields().union(
@@ -1218,6 +2347,11 @@ class QuerySet(Generic[T]):
             columns.append(pk_name)
 
         columns = [self.model.get_column_alias(k) for k in columns]
+        pk_column_name = self.model.get_column_alias(pk_name)
+        table_columns = [c.name for c in self.model_config.table.c]
+        update_columns = [
+            k for k in columns if k != pk_column_name and k in table_columns
+        ]
 
         for obj in objects:
             new_kwargs = obj.model_dump()
@@ -1227,34 +2361,81 @@ class QuerySet(Generic[T]):
                     f"{self.model.__name__} has to have {pk_name} filled."
                 )
             new_kwargs = obj.prepare_model_to_update(new_kwargs)
+            obj_columns = columns
+            changed = obj.changed_fields if track_changes else None
+            if changed is not None:
+                # only fields changed since load/save are written, apart from
+                # json fields, as in place changes of their values are not tracked
+                obj_columns = [
+                    self.model.get_column_alias(k)
+                    for k in changed | self.model._json_fields
+                ]
+                if not any(k in update_columns for k in obj_columns):
+                    continue
+                obj_columns.append(pk_column_name)
             ready_objects.append(
-                {"new_" + k: v for k, v in new_kwargs.items() if k in columns}
+                {k: v for k, v in new_kwargs.items() if k in obj_columns}
             )
             await asyncio.sleep(0)
 
-        pk_column = self.model_config.table.c.get(self.model.get_column_alias(pk_name))
-        pk_column_name = self.model.get_column_alias(pk_name)
-        table_columns = [c.name for c in self.model_config.table.c]
-        expr = self.table.update().where(
-            pk_column == bindparam("new_" + pk_column_name)
-        )
-        expr = expr.values(
-            **{
-                k: bindparam("new_" + k)
-                for k in columns
-                if k != pk_column_name and k in table_columns
-            }
-        )
-        # databases bind params only where query is passed as string
-        # otherwise it just passes all data to values and results in unconsumed columns
-        expr = str(expr)
-        await self.database.execute_many(expr, ready_objects)
+        if update_columns and ready_objects:
+            batch_size = batch_size or get_bulk_batch_size(
+                database=self.database, params_per_row=len(update_columns) * 2 + 1
+            )
+            mark_written(self.database)
+            with self._operation("bulk_update"):
+                async with self.database.transaction():
+                    for start in range(0, len(ready_objects), batch_size):
+                        with phase("build"):
+                            expr = self._build_bulk_update_expression(
+                                objects=ready_objects[start : start + batch_size],
+                                pk_column_name=pk_column_name,
+                                update_columns=update_columns,
+                            )
+                        await track(self.database.execute(expr), expr)
+            invalidate_tables([self.model_config.tablename], database=self.database)
 
         for obj in objects:
             obj.set_save_status(True)
 
-        await cast(
-            Type["Model"], self.model_cls
-        ).ormar_config.signals.post_bulk_update.send(
-            sender=self.model_cls, instances=objects  # type: ignore
+    def _build_bulk_update_expression(
+        self, objects: List[Dict], pk_column_name: str, update_columns: List[str]
+    ) -> sqlalchemy.sql.Update:
+        """
+        Builds one update statement for a batch of objects, each column is set
+        with a case expression selecting the value by the primary key of the row.
+
+        :param objects: list of objects values to update, keyed by column names
+        :type objects: List[Dict]
+        :param pk_column_name: name of the primary key column
+        :type pk_column_name: str
+        :param update_columns: names of the columns to update
+        :type update_columns: List[str]
+        :return: update statement
+        :rtype: sqlalchemy.sql.Update
+        """
+        pk_column = self.table.c[pk_column_name]
+        values = {}
+        # values are already prepared to save (i.e. json dumped to strings),
+        # so the types of bound parameters are resolved from values not columns
+        for column_name in update_columns:
+            column = self.table.c[column_name]
+            whens = [
+                (
+                    bindparam(None, obj[pk_column_name]),
+                    bindparam(None, obj[column_name]),
+                )
+                for obj in objects
+                if column_name in obj
+            ]
+            if whens:
+                values[column_name] = sqlalchemy.case(
+                    *whens, value=pk_column, else_=column
+                )
+        return (
+            self.table.update()
+            .where(
+                pk_column.in_([bindparam(None, obj[pk_column_name]) for obj in objects])
+            )
+            .values(**values)
         )
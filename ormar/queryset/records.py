@@ -0,0 +1,310 @@
+import datetime
+import enum
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import sqlalchemy
+
+from ormar.exceptions import QueryDefinitionError
+from ormar.queryset.columnar import transpose
+from ormar.queryset.dump import dumps
+
+if TYPE_CHECKING:  # pragma no cover
+    import numpy
+    import pyarrow
+
+# largest precision of decimals stored in 128 bit arrow decimals
+MAX_DECIMAL128_PRECISION = 38
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def import_optional(module_name: str, feature: str) -> Any:
+    """
+    Imports optional dependency required only by given feature.
+
+    :raises QueryDefinitionError: if the dependency is not installed
+    :param module_name: name of the module to import
+    :type module_name: str
+    :param feature: name of the feature that requires the module
+    :type feature: str
+    :return: imported module
+    :rtype: module
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise QueryDefinitionError(
+            f"In order to use {feature} '{module_name}' is required!"
+        ) from e
+
+
+def enum_value(value: Any) -> Any:
+    """
+    Converts enum member into string of its value.
+
+    :param value: value of the column
+    :type value: Any
+    :return: string value of enum
+    :rtype: Any
+    """
+    return str(value.value) if isinstance(value, enum.Enum) else value
+
+
+def json_value(value: Any) -> str:
+    """
+    Converts deserialized value of json column back into json string.
+
+    :param value: value of the column
+    :type value: Any
+    :return: json string
+    :rtype: str
+    """
+    return dumps(value).decode("utf-8")
+
+
+def utc_naive(value: Any) -> Any:
+    """
+    Converts timezone aware datetime into naive datetime in utc,
+    as numpy datetimes do not support timezones.
+
+    :param value: value of the column
+    :type value: Any
+    :return: naive datetime
+    :rtype: Any
+    """
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def arrow_type(pyarrow: Any, sql_type: Any) -> Tuple["pyarrow.DataType", Converter]:
+    """
+    Maps sqlalchemy type of the column into arrow type, together with
+    the function converting values that arrow cannot store as they are.
+
+    Jsons and enums are stored as strings, decimals without declared precision
+    as floats, and all other types (i.e. uuids) as their string representation.
+
+    :param pyarrow: imported pyarrow module
+    :type pyarrow: module
+    :param sql_type: type of the selected column
+    :type sql_type: sqlalchemy.types.TypeEngine
+    :return: arrow type and optional value converter
+    :rtype: Tuple[pyarrow.DataType, Optional[Callable]]
+    """
+    if isinstance(sql_type, sqlalchemy.Boolean):
+        return pyarrow.bool_(), None
+    if isinstance(sql_type, sqlalchemy.SmallInteger):
+        return pyarrow.int16(), None
+    if isinstance(sql_type, sqlalchemy.Integer):
+        return pyarrow.int64(), None
+    if isinstance(sql_type, sqlalchemy.Float):
+        return pyarrow.float64(), None
+    if isinstance(sql_type, sqlalchemy.Numeric):
+        if sql_type.precision is None or sql_type.scale is None:
+            return pyarrow.float64(), float
+        if sql_type.precision > MAX_DECIMAL128_PRECISION:
+            return pyarrow.decimal256(sql_type.precision, sql_type.scale), None
+        return pyarrow.decimal128(sql_type.precision, sql_type.scale), None
+    if isinstance(sql_type, sqlalchemy.DateTime):
+        return pyarrow.timestamp("us", tz="UTC" if sql_type.timezone else None), None
+    if isinstance(sql_type, sqlalchemy.Date):
+        return pyarrow.date32(), None
+    if isinstance(sql_type, sqlalchemy.Time):
+        return pyarrow.time64("us"), None
+    if isinstance(sql_type, sqlalchemy.Enum):
+        return pyarrow.string(), enum_value
+    if isinstance(sql_type, sqlalchemy.String):
+        return pyarrow.string(), None
+    if isinstance(sql_type, sqlalchemy.LargeBinary):
+        return pyarrow.binary(), None
+    if isinstance(sql_type, sqlalchemy.JSON):
+        return pyarrow.string(), json_value
+    return pyarrow.string(), str
+
+
+def convert_values(values: Sequence, converter: Converter) -> Sequence:
+    """
+    Applies converter to not null values of the column.
+
+    :param values: values of the column
+    :type values: Sequence
+    :param converter: function converting single value
+    :type converter: Optional[Callable]
+    :return: converted values
+    :rtype: Sequence
+    """
+    if converter is None:
+        return values
+    return [None if value is None else converter(value) for value in values]
+
+
+class ArrowConverter:
+    """
+    Converts batches of raw database rows into arrow record batches,
+    with schema resolved once from the types of the selected columns.
+    """
+
+    __slots__ = ("pyarrow", "keys", "converters", "schema")
+
+    def __init__(self, columns: List[Tuple[str, str]], sql_types: List[Any]) -> None:
+        self.pyarrow = import_optional("pyarrow", "to_arrow()")
+        self.keys = [key for key, _ in columns]
+        fields = []
+        self.converters: List[Converter] = []
+        for (_, name), sql_type in zip(columns, sql_types):
+            data_type, converter = arrow_type(self.pyarrow, sql_type)
+            fields.append(self.pyarrow.field(name, data_type))
+            self.converters.append(converter)
+        self.schema = self.pyarrow.schema(fields)
+
+    def convert(self, rows: Sequence[Any]) -> "pyarrow.RecordBatch":
+        """
+        Converts batch of rows into arrow record batch.
+
+        :param rows: raw result rows from the database
+        :type rows: Sequence[Any]
+        :return: record batch with columns of the rows
+        :rtype: pyarrow.RecordBatch
+        """
+        arrays = [
+            self.pyarrow.array(convert_values(values, converter), type=field.type)
+            for values, converter, field in zip(
+                transpose(rows, self.keys), self.converters, self.schema
+            )
+        ]
+        return self.pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def combine(self, batches: List["pyarrow.RecordBatch"]) -> "pyarrow.Table":
+        """
+        Combines record batches into one arrow table (empty if there are no batches).
+
+        :param batches: converted record batches
+        :type batches: List[pyarrow.RecordBatch]
+        :return: table with all rows
+        :rtype: pyarrow.Table
+        """
+        return self.pyarrow.Table.from_batches(batches, schema=self.schema)
+
+
+class NumpyConverter:
+    """
+    Converts batches of raw database rows into dictionaries of numpy arrays.
+
+    Integer, float, decimal, boolean, date and datetime columns are stored in
+    arrays of native numpy types, all other columns in arrays of python objects.
+    Nulls are stored as `nan` in float columns and `NaT` in datetime columns,
+    integer columns with nulls are stored as floats and boolean columns with
+    nulls as objects (if there are nulls in any of the converted batches).
+    """
+
+    __slots__ = ("numpy", "keys", "names", "kinds")
+
+    def __init__(self, columns: List[Tuple[str, str]], sql_types: List[Any]) -> None:
+        self.numpy = import_optional("numpy", "to_numpy()")
+        self.keys = [key for key, _ in columns]
+        self.names = [name for _, name in columns]
+        self.kinds = [self._resolve_kind(sql_type) for sql_type in sql_types]
+
+    @staticmethod
+    def _resolve_kind(sql_type: Any) -> str:
+        """
+        Resolves numpy dtype used for the column of given sqlalchemy type.
+
+        :param sql_type: type of the selected column
+        :type sql_type: sqlalchemy.types.TypeEngine
+        :return: numpy dtype of the column
+        :rtype: str
+        """
+        if isinstance(sql_type, sqlalchemy.Boolean):
+            return "bool"
+        if isinstance(sql_type, sqlalchemy.Integer):
+            return "int64"
+        if isinstance(sql_type, sqlalchemy.Numeric):
+            return "float64"
+        if isinstance(sql_type, sqlalchemy.DateTime):
+            return "datetime64[us]"
+        if isinstance(sql_type, sqlalchemy.Date):
+            return "datetime64[D]"
+        return "object"
+
+    def _to_array(self, values: Sequence, kind: str) -> "numpy.ndarray":
+        """
+        Converts values of one column into numpy array.
+
+        :param values: values of the column
+        :type values: Sequence
+        :param kind: numpy dtype of the column
+        :type kind: str
+        :return: array with values
+        :rtype: numpy.ndarray
+        """
+        has_nulls = any(value is None for value in values)
+        if kind == "int64" and has_nulls:
+            kind = "float64"
+        if kind == "float64":
+            values = [float("nan") if value is None else value for value in values]
+        elif kind == "datetime64[us]":
+            values = [utc_naive(value) for value in values]
+        elif kind == "object" or (kind == "bool" and has_nulls):
+            result = self.numpy.empty(len(values), dtype=object)
+            for index, value in enumerate(values):
+                result[index] = value
+            return result
+        return self.numpy.array(values, dtype=kind)
+
+    def convert(self, rows: Sequence[Any]) -> Dict[str, "numpy.ndarray"]:
+        """
+        Converts batch of rows into dictionary of column name: numpy array.
+
+        :param rows: raw result rows from the database
+        :type rows: Sequence[Any]
+        :return: dictionary of columns
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        return {
+            name: self._to_array(values, kind)
+            for name, values, kind in zip(
+                self.names, transpose(rows, self.keys), self.kinds
+            )
+        }
+
+    def combine(
+        self, batches: List[Dict[str, "numpy.ndarray"]]
+    ) -> Dict[str, "numpy.ndarray"]:
+        """
+        Concatenates columns of converted batches (empty arrays if there are no
+        batches).
+
+        :param batches: converted batches
+        :type batches: List[Dict[str, numpy.ndarray]]
+        :return: dictionary of columns with all rows
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        if not batches:
+            return self.convert([])
+        if len(batches) == 1:
+            return batches[0]
+        return {
+            name: self._concatenate([batch[name] for batch in batches], kind)
+            for name, kind in zip(self.names, self.kinds)
+        }
+
+    def _concatenate(self, arrays: List["numpy.ndarray"], kind: str) -> "numpy.ndarray":
+        """
+        Concatenates arrays of one column, if nulls were found in any of the
+        batches, integer arrays are stored as floats and boolean arrays as objects,
+        so the dtype of the column does not depend on the size of the batches.
+
+        :param arrays: arrays of the column from converted batches
+        :type arrays: List[numpy.ndarray]
+        :param kind: numpy dtype of the column
+        :type kind: str
+        :return: array with all values of the column
+        :rtype: numpy.ndarray
+        """
+        if kind in ("int64", "bool") and any(array.dtype != kind for array in arrays):
+            dtype = "float64" if kind == "int64" else "object"
+            arrays = [array.astype(dtype) for array in arrays]
+        return self.numpy.concatenate(arrays)
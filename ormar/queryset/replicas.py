@@ -0,0 +1,178 @@
+import itertools
+import time
+from contextvars import ContextVar
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List
+
+import databases
+
+from ormar.queryset.utils import is_in_transaction
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar.models.ormar_config import OrmarConfig
+
+LATENCY_SMOOTHING = 0.2
+# with least_latency policy each n-th read probes the least recently measured replica
+LATENCY_PROBE_INTERVAL = 10
+
+_written_databases: ContextVar[FrozenSet[databases.Database]] = ContextVar(
+    "ormar_written_databases", default=frozenset()
+)
+
+
+class ReplicaPolicy(str, Enum):
+    """
+    Policy of choosing the read replica for a read query.
+
+    * round_robin - replicas are used one after another
+    * least_latency - replica with the lowest average latency of reads is used
+    * sticky_after_write - replicas are used one after another, until a write
+    to the primary database happens in the current context, after that all reads
+    in this context go to the primary database (so they see the written data)
+    """
+
+    round_robin = "round_robin"
+    least_latency = "least_latency"
+    sticky_after_write = "sticky_after_write"
+
+
+def mark_written(database: databases.Database) -> None:
+    """
+    Registers the write to the primary database in the current context,
+    used by sticky_after_write policy to route following reads to the primary.
+
+    :param database: primary database written to
+    :type database: databases.Database
+    """
+    written = _written_databases.get()
+    if database not in written:
+        _written_databases.set(written | {database})
+
+
+class ReplicaRouter:
+    """
+    Routes read queries of models to the read replicas of the primary database.
+
+    Reads run in an active transaction (or with database forced to rollback)
+    always go to the primary database, as replicas would not see the changes
+    made in that transaction.
+    """
+
+    def __init__(
+        self, replicas: List[databases.Database], policy: ReplicaPolicy
+    ) -> None:
+        self.replicas = list(replicas)
+        self.policy = ReplicaPolicy(policy)
+        self.latencies: Dict[databases.Database, float] = {}
+        self.last_measured: Dict[databases.Database, int] = {}
+        self._counter = itertools.count()
+        self._reads = itertools.count(1)
+        self._measurements = itertools.count()
+
+    def select(self, primary: databases.Database) -> databases.Database:
+        """
+        Chooses the database the read query should run on.
+
+        :param primary: primary database of the model
+        :type primary: databases.Database
+        :return: replica or primary database
+        :rtype: databases.Database
+        """
+        if is_in_transaction(primary):
+            return primary
+        if self.policy == ReplicaPolicy.least_latency:
+            return self._select_least_latency()
+        if (
+            self.policy == ReplicaPolicy.sticky_after_write
+            and primary in _written_databases.get()
+        ):
+            return primary
+        return self.replicas[next(self._counter) % len(self.replicas)]
+
+    def _select_least_latency(self) -> databases.Database:
+        """
+        Chooses the replica with the lowest average latency. Each n-th read goes
+        to the least recently measured replica instead, so a replica that was
+        slow once gets measured again and can be chosen after it recovers.
+
+        :return: chosen replica
+        :rtype: databases.Database
+        """
+        if next(self._reads) % LATENCY_PROBE_INTERVAL == 0:
+            return min(self.replicas, key=lambda x: self.last_measured.get(x, -1))
+        return min(self.replicas, key=lambda x: self.latencies.get(x, 0.0))
+
+    async def fetch(
+        self, primary: databases.Database, method: str, expression: Any
+    ) -> Any:
+        """
+        Runs the read query on the chosen database, with least_latency policy
+        the duration of the query is included in the average latency of the replica.
+
+        :param primary: primary database of the model
+        :type primary: databases.Database
+        :param method: name of the database method to call (i.e. fetch_all)
+        :type method: str
+        :param expression: query to run
+        :type expression: Any
+        :return: result of the query
+        :rtype: Any
+        """
+        database = self.select(primary)
+        if database is primary or self.policy != ReplicaPolicy.least_latency:
+            return await getattr(database, method)(expression)
+        start = time.perf_counter()
+        result = await getattr(database, method)(expression)
+        self.record_latency(database, time.perf_counter() - start)
+        return result
+
+    def record_latency(self, database: databases.Database, duration: float) -> None:
+        """
+        Updates exponentially weighted average latency of the replica.
+
+        :param database: replica the query was run on
+        :type database: databases.Database
+        :param duration: duration of the query in seconds
+        :type duration: float
+        """
+        self.last_measured[database] = next(self._measurements)
+        previous = self.latencies.get(database)
+        if previous is None:
+            self.latencies[database] = duration
+        else:
+            self.latencies[database] = previous + LATENCY_SMOOTHING * (
+                duration - previous
+            )
+
+
+def read_database(config: "OrmarConfig") -> databases.Database:
+    """
+    Returns the database the read query of the model should run on.
+
+    :param config: config of the model
+    :type config: OrmarConfig
+    :return: replica or primary database
+    :rtype: databases.Database
+    """
+    if config.replica_router is None:
+        return config.database
+    return config.replica_router.select(config.database)
+
+
+async def fetch_read(config: "OrmarConfig", method: str, expression: Any) -> Any:
+    """
+    Runs the read query of the model on the replica chosen by the replica router,
+    or on the primary database if model has no read replicas.
+
+    :param config: config of the model
+    :type config: OrmarConfig
+    :param method: name of the database method to call (i.e. fetch_all)
+    :type method: str
+    :param expression: query to run
+    :type expression: Any
+    :return: result of the query
+    :rtype: Any
+    """
+    if config.replica_router is None:
+        return await getattr(config.database, method)(expression)
+    return await config.replica_router.fetch(config.database, method, expression)
@@ -12,9 +12,24 @@ from typing import (
     Union,
 )
 
+import databases
+
+from ormar.exceptions import DatabasesVersionError
+
 if TYPE_CHECKING:  # pragma no cover
     from ormar import BaseField, Model
 
+# max number of bound parameters in one statement per dialect
+# (999 in sqlite older than 3.32, 32767 in asyncpg, 65535 in mysql protocol)
+MAX_BOUND_PARAMETERS = {"sqlite": 999, "postgresql": 32767, "mysql": 65535}
+DEFAULT_MAX_BOUND_PARAMETERS = 999
+# max number of rows processed in one statement by bulk operations
+DEFAULT_BULK_BATCH_SIZE = 1000
+# versions of databases verified to provide the private attributes of database,
+# connection and transaction used below, in other versions they are checked on use
+VERIFIED_DATABASES_VERSIONS = {(0, 7)}
+DATABASES_VERSION = tuple(int(x) for x in databases.__version__.split(".")[:2])
+
 
 def check_node_not_dict_or_not_last_node(
     part: str, is_last: bool, current_level: Any
@@ -64,7 +79,8 @@ def translate_list_to_dict(  # noqa: CCR001
     for path in list_to_trans:
         current_level = new_dict
         parts = path.split("__")
-        def_val: Any = default
+        # copy default as mutable defaults cannot be shared between nodes
+        def_val: Any = copy.copy(default)
         for ind, part in enumerate(parts):
             is_last = ind == len(parts) - 1
             if check_node_not_dict_or_not_last_node(
@@ -262,3 +278,102 @@ def _process_through_field(
     else:
         relation = related_field.related_name
     return previous_model, relation, is_through
+
+
+def check_databases_internals(target: Any, *attributes: str) -> None:
+    """
+    Checks that private attributes of databases objects used by ormar are
+    available, the check is skipped for verified versions of databases.
+
+    :raises DatabasesVersionError: if any of the attributes is missing
+    :param target: database, connection or transaction
+    :type target: Any
+    :param attributes: names of the private attributes
+    :type attributes: str
+    """
+    if DATABASES_VERSION in VERIFIED_DATABASES_VERSIONS:
+        return
+    missing = [name for name in attributes if not hasattr(target, name)]
+    if missing:
+        raise DatabasesVersionError(
+            f"Installed databases {databases.__version__} does not provide "
+            f"{', '.join(missing)} of {type(target).__name__} used by ormar!"
+        )
+
+
+def new_connection(database: "databases.Database") -> databases.core.Connection:
+    """
+    Creates new connection to the database, not shared with the connection
+    of current task (i.e. to run queries concurrently).
+
+    :param database: database to connect to
+    :type database: databases.Database
+    :return: new connection, not yet connected (use it as context manager)
+    :rtype: databases.core.Connection
+    """
+    check_databases_internals(database, "_backend")
+    return databases.core.Connection(database._backend)
+
+
+def get_transaction_stack(
+    connection: databases.core.Connection,
+) -> List[databases.core.Transaction]:
+    """
+    Returns active transactions of the connection, starting from the root one.
+
+    :param connection: connection to check
+    :type connection: databases.core.Connection
+    :return: list of active transactions
+    :rtype: List[databases.core.Transaction]
+    """
+    check_databases_internals(connection, "_transaction_stack")
+    return connection._transaction_stack
+
+
+def is_transaction_active(transaction: databases.core.Transaction) -> bool:
+    """
+    Checks if transaction was started and not yet committed or rolled back.
+
+    :param transaction: transaction to check
+    :type transaction: databases.core.Transaction
+    :return: result of the check
+    :rtype: bool
+    """
+    check_databases_internals(transaction, "_connection")
+    return transaction in get_transaction_stack(transaction._connection)
+
+
+def is_in_transaction(database: "databases.Database") -> bool:
+    """
+    Checks if queries of current task have to run in the shared connection,
+    that is either in the connection of an active transaction or in the global
+    connection used when database is forced to rollback.
+
+    :param database: database to check
+    :type database: databases.Database
+    :return: result of the check
+    :rtype: bool
+    """
+    check_databases_internals(database, "_global_connection")
+    if database._global_connection is not None:
+        return True
+    return bool(get_transaction_stack(database.connection()))
+
+
+def get_bulk_batch_size(database: "databases.Database", params_per_row: int) -> int:
+    """
+    Calculates the default number of rows processed in one statement of bulk
+    operation, so that the number of bound parameters in one statement
+    stays below the limit of the database dialect.
+
+    :param database: database to run the statement on
+    :type database: databases.Database
+    :param params_per_row: number of bound parameters required by one row
+    :type params_per_row: int
+    :return: number of rows in one statement
+    :rtype: int
+    """
+    max_params = MAX_BOUND_PARAMETERS.get(
+        database._backend._dialect.name, DEFAULT_MAX_BOUND_PARAMETERS
+    )
+    return max(1, min(DEFAULT_BULK_BATCH_SIZE, max_params // max(params_per_row, 1)))
@@ -14,17 +14,32 @@ from typing import (  # noqa: I100, I201
     TypeVar,
     Union,
     cast,
+    overload,
 )
 
+try:
+    from typing import Literal  # type: ignore
+except ImportError:  # pragma: no cover
+    from typing_extensions import Literal  # type: ignore
+
 from _weakref import CallableProxyType
 
 import ormar  # noqa: I100, I202
 from ormar.exceptions import ModelPersistenceError, NoMatch, QueryDefinitionError
+from ormar.instrumentation import operation, track
+from ormar.queryset.cache import CacheStore, invalidate_tables
+from ormar.queryset.export import DEFAULT_EXPORT_BATCH_SIZE, ExportFormat
+from ormar.queryset.replicas import mark_written
+from ormar.queryset.utils import get_bulk_batch_size
 
 if TYPE_CHECKING:  # pragma no cover
+    import numpy
+    import pyarrow
+
     from ormar import OrderAction, RelationType
     from ormar.models import Model, T
     from ormar.queryset import QuerySet
+    from ormar.queryset.columnar import Column
     from ormar.relations import Relation
 else:
     T = TypeVar("T", bound="Model")
@@ -48,6 +63,8 @@ class QuerysetProxy(Generic[T]):
     ) -> None:
         self.relation: "Relation" = relation
         self._queryset: Optional["QuerySet[T]"] = qryset
+        # only not filtered proxies of relations can be loaded in batches
+        self._batchable = qryset is None
         self.type_: "RelationType" = type_
         self._owner: Union[CallableProxyType, "Model"] = self.relation.manager.owner
         self.related_field_name = self._owner.ormar_config.model_fields[
@@ -139,6 +156,38 @@ class QuerysetProxy(Generic[T]):
             )
         await model_cls(**final_kwargs).save()
 
+    async def create_through_instances(
+        self, children: Sequence["T"], **kwargs: Any
+    ) -> None:
+        """
+        Crete through model instances in the database for m2m relations
+        with multi row inserts (one per batch of children).
+
+        :param kwargs: dict of additional keyword arguments for through instances
+        :type kwargs: Any
+        :param children: child models instances
+        :type children: Sequence[Model]
+        """
+        model_cls = self.relation.through
+        owner_column = self.related_field.default_target_field_name()  # type: ignore
+        child_column = self.related_field.default_source_field_name()  # type: ignore
+        through_instances = []
+        for child in children:
+            if child.pk is None:
+                raise ModelPersistenceError(
+                    f"You cannot save {child.get_name()} "
+                    f"model without primary key set! \n"
+                    f"Save the child model first."
+                )
+            through_instances.append(
+                model_cls(
+                    **{owner_column: self._owner.pk, child_column: child.pk, **kwargs}
+                )
+            )
+        await ormar.QuerySet(model_cls=model_cls).bulk_create(  # type: ignore
+            through_instances
+        )
+
     async def update_through_instance(self, child: "T", **kwargs: Any) -> None:
         """
         Updates a through model instance in the database for m2m relations.
@@ -184,6 +233,37 @@ class QuerysetProxy(Generic[T]):
         link_instance = await queryset.filter(**kwargs).get()  # type: ignore
         await link_instance.delete()
 
+    async def delete_through_instances(self, children: Sequence["T"]) -> None:
+        """
+        Removes through model instances from the database for m2m relations
+        with one statement per batch of children, all batches in one transaction.
+
+        :param children: child models instances
+        :type children: Sequence[Model]
+        """
+        model_cls = self.relation.through
+        owner_column = self.related_field.default_target_field_name()  # type: ignore
+        child_column = self.related_field.default_source_field_name()  # type: ignore
+        table = model_cls.ormar_config.table
+        owner_col = table.c[model_cls.get_column_alias(owner_column)]
+        child_col = table.c[model_cls.get_column_alias(child_column)]
+        database = model_cls.ormar_config.database
+        pks = [child.pk for child in children]
+        batch_size = get_bulk_batch_size(database=database, params_per_row=1)
+        mark_written(database)
+        relation = f"{self._owner.__class__.__name__}.{self.relation.field_name}"
+        with operation(model_cls, "delete", relation=relation):
+            async with database.transaction():
+                for start in range(0, len(pks), batch_size):
+                    expr = table.delete().where(
+                        owner_col == self._owner.pk,
+                        child_col.in_(pks[start : start + batch_size]),
+                    )
+                    await track(database.execute(expr), expr)
+        invalidate_tables(
+            [model_cls.ormar_config.tablename], database=model_cls.ormar_config.database
+        )
+
     async def exists(self) -> bool:
         """
         Returns a bool value to confirm if there are rows matching the given criteria
@@ -286,15 +366,44 @@ class QuerysetProxy(Generic[T]):
             )
         return await queryset.delete(**kwargs)  # type: ignore
 
+    @overload
     async def values(
         self,
         fields: Union[List, str, Set, Dict, None] = None,
         exclude_through: bool = False,
-    ) -> List:
+        columnar: Literal[False] = False,
+    ) -> List: ...
+
+    @overload
+    async def values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        *,
+        columnar: Literal[True],
+    ) -> Dict[str, "Column"]: ...
+
+    @overload
+    async def values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        columnar: bool = False,
+    ) -> Union[List, Dict[str, "Column"]]: ...
+
+    async def values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        columnar: bool = False,
+    ) -> Union[List, Dict[str, "Column"]]:
         """
         Return a list of dictionaries with column values in order of the fields
         passed or all fields from queried models.
 
+        If columnar flag is set a dictionary of column name: column values is
+        returned instead.
+
         To filter for given row use filter/exclude methods before values,
         to limit number of rows use limit/offset or paginate before values.
 
@@ -302,11 +411,15 @@ class QuerysetProxy(Generic[T]):
 
         :param exclude_through: flag if through models should be excluded
         :type exclude_through: bool
+        :param columnar: flag if values should be returned as columns
+        :type columnar: bool
         :param fields: field name or list of field names to extract from db
         :type fields:  Union[List, str, Set, Dict]
+        :return: list of rows or dictionary of columns
+        :rtype: Union[List, Dict[str, Union[List, array.array]]]
         """
         return await self.queryset.values(
-            fields=fields, exclude_through=exclude_through
+            fields=fields, exclude_through=exclude_through, columnar=columnar
         )
 
     async def values_list(
@@ -425,19 +538,64 @@ class QuerysetProxy(Generic[T]):
 
         List of related models is cleared before the call.
 
+        If BatchLoader is active and no filters are applied, concurrent calls
+        on the same relation of models of the same class are issued as one query.
+
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :return: list of returned models
         :rtype: List[Model]
         """
-        all_items = await self.queryset.all(*args, **kwargs)
+        loader = ormar.BatchLoader.current()
+        all_items: List["T"]
+        if loader and self._batchable and not args and not kwargs:
+            all_items = cast(List["T"], await loader.load_relation(self))
+        else:
+            all_items = await self.queryset.all(*args, **kwargs)
         self._clean_items_on_load()
         self._register_related(all_items)
         return all_items
 
+    async def dump(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Returns all rows from a database for given model for set filter options
+        as list of nested dictionaries, built straight from the database rows
+        without constructing the models.
+
+        Passing args and/or kwargs is a shortcut and equals to calling
+        `filter(*args, **kwargs).dump()`.
+
+        Actual call delegated to QuerySet, related models are not registered
+        on the relation.
+
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: list of dictionaries of returned models
+        :rtype: List[Dict[str, Any]]
+        """
+        return await self.queryset.dump(*args, **kwargs)
+
+    async def json(self, *args: Any, **kwargs: Any) -> bytes:
+        """
+        Returns all rows from a database for given model for set filter options
+        as json bytes, serialized from dictionaries returned by `dump()`.
+
+        Passing args and/or kwargs is a shortcut and equals to calling
+        `filter(*args, **kwargs).json()`.
+
+        Actual call delegated to QuerySet.
+
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: json array of returned models
+        :rtype: bytes
+        """
+        return await self.queryset.json(*args, **kwargs)
+
     async def iterate(  # noqa: A003
         self,
         *args: Any,
+        batch_size: Optional[int] = None,
         **kwargs: Any,
     ) -> AsyncGenerator["T", None]:
         """
@@ -446,17 +604,128 @@ class QuerysetProxy(Generic[T]):
         Passing args and/or kwargs is a shortcut and equals to calling
         `filter(*args, **kwargs).iterate()`.
 
+        If batch_size is passed the rows are fetched and hydrated in batches.
+
         If there are no rows meeting the criteria an empty async generator is returned.
 
+        :param batch_size: number of main models processed at once
+        :type batch_size: Optional[int]
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :return: asynchronous iterable generator of returned models
         :rtype: AsyncGenerator[Model]
         """
 
-        async for item in self.queryset.iterate(*args, **kwargs):
+        async for item in self.queryset.iterate(*args, batch_size=batch_size, **kwargs):
             yield item
 
+    async def stream_export(
+        self,
+        format: Union[str, ExportFormat] = ExportFormat.ndjson,  # noqa: A002
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Return async generator of encoded chunks of bytes with all rows from
+        a database for given model, in "ndjson" or "csv" format.
+
+        Actual call delegated to QuerySet.
+
+        :param format: format of the export, "ndjson" or "csv"
+        :type format: Union[str, ExportFormat]
+        :param batch_size: number of rows encoded in one chunk
+        :type batch_size: int
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :return: asynchronous generator of encoded chunks
+        :rtype: AsyncGenerator[bytes]
+        """
+        async for chunk in self.queryset.stream_export(
+            format=format,
+            batch_size=batch_size,
+            fields=fields,
+            exclude_through=exclude_through,
+        ):
+            yield chunk
+
+    async def to_arrow(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> "pyarrow.Table":
+        """
+        Return a `pyarrow.Table` with columns of all rows from a database
+        for given model, requires `pyarrow` to be installed.
+
+        Actual call delegated to QuerySet.
+
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param batch_size: number of rows converted in one record batch
+        :type batch_size: int
+        :return: table with all rows
+        :rtype: pyarrow.Table
+        """
+        return await self.queryset.to_arrow(
+            fields=fields, exclude_through=exclude_through, batch_size=batch_size
+        )
+
+    async def iterate_arrow(
+        self,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+    ) -> AsyncGenerator["pyarrow.RecordBatch", None]:
+        """
+        Return async generator of `pyarrow.RecordBatch` with batch_size rows each.
+
+        Actual call delegated to QuerySet.
+
+        :param batch_size: number of rows converted in one record batch
+        :type batch_size: int
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :return: asynchronous generator of record batches
+        :rtype: AsyncGenerator[pyarrow.RecordBatch]
+        """
+        async for batch in self.queryset.iterate_arrow(
+            batch_size=batch_size, fields=fields, exclude_through=exclude_through
+        ):
+            yield batch
+
+    async def to_numpy(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> Dict[str, "numpy.ndarray"]:
+        """
+        Return a dictionary of column name: `numpy.ndarray` with values of all rows
+        from a database for given model, requires `numpy` to be installed.
+
+        Actual call delegated to QuerySet.
+
+        :param fields: field name or list of field names to extract from db
+        :type fields: Union[List, str, Set, Dict]
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param batch_size: number of rows converted at once
+        :type batch_size: int
+        :return: dictionary of columns
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        return await self.queryset.to_numpy(
+            fields=fields, exclude_through=exclude_through, batch_size=batch_size
+        )
+
     async def create(self, **kwargs: Any) -> "T":
         """
         Creates the model instance, saves it in a database and returns the updates model
@@ -702,6 +971,45 @@ class QuerysetProxy(Generic[T]):
             relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
         )
 
+    def trusted_load(self, trusted: bool = True) -> "QuerysetProxy[T]":
+        """
+        Allows to construct the models loaded from the database without pydantic
+        validation, which makes loading of big number of rows significantly faster.
+
+        Actual call delegated to QuerySet.
+
+        :param trusted: flag if models should be constructed without validation
+        :type trusted: bool
+        :return: QuerysetProxy
+        :rtype: QuerysetProxy
+        """
+        queryset = self.queryset.trusted_load(trusted=trusted)
+        return self.__class__(
+            relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
+        )
+
+    def cache(
+        self, ttl: Optional[float] = None, store: Optional[CacheStore] = None
+    ) -> "QuerysetProxy[T]":
+        """
+        Enables caching of the results of the queries keyed by the compiled
+        statement and its parameters, for ttl seconds or until any of the
+        tables the query reads from is written to.
+
+        Actual call delegated to QuerySet.
+
+        :param ttl: number of seconds the result is cached
+        :type ttl: Optional[float]
+        :param store: store of cached results, in-process LRU store by default
+        :type store: Optional[CacheStore]
+        :return: QuerysetProxy
+        :rtype: QuerysetProxy
+        """
+        queryset = self.queryset.cache(ttl=ttl, store=store)
+        return self.__class__(
+            relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
+        )
+
     def paginate(self, page: int, page_size: int = 20) -> "QuerysetProxy[T]":
         """
         You can paginate the result which is a combination of offset and limit clauses.
@@ -721,6 +1029,54 @@ class QuerysetProxy(Generic[T]):
             relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
         )
 
+    def after(self, cursor: str) -> "QuerysetProxy[T]":
+        """
+        Keyset (seek) pagination - returns only models following the position
+        pointed by the cursor in the current order of the queryset.
+
+        Actual call delegated to QuerySet.
+
+        :param cursor: cursor created with get_cursor
+        :type cursor: str
+        :return: QuerysetProxy
+        :rtype: QuerysetProxy
+        """
+        queryset = self.queryset.after(cursor=cursor)
+        return self.__class__(
+            relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
+        )
+
+    def before(self, cursor: str) -> "QuerysetProxy[T]":
+        """
+        Keyset (seek) pagination - returns only models preceding the position
+        pointed by the cursor in the reversed order of the queryset.
+
+        Actual call delegated to QuerySet.
+
+        :param cursor: cursor created with get_cursor
+        :type cursor: str
+        :return: QuerysetProxy
+        :rtype: QuerysetProxy
+        """
+        queryset = self.queryset.before(cursor=cursor)
+        return self.__class__(
+            relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
+        )
+
+    def get_cursor(self, instance: "T") -> str:
+        """
+        Creates an opaque cursor pointing to the position of the instance in the
+        current order of the queryset, to be used in `after()` and `before()`.
+
+        Actual call delegated to QuerySet.
+
+        :param instance: model instance to which cursor points
+        :type instance: Model
+        :return: cursor
+        :rtype: str
+        """
+        return self.queryset.get_cursor(instance=instance)
+
     def limit(self, limit_count: int) -> "QuerysetProxy[T]":
         """
         You can limit the results to desired number of parent models.
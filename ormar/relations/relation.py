@@ -166,8 +166,24 @@ class Relation(Generic[T]):
                 self._owner.__dict__[relation_name] = rel
 
     def _populate_owner_side_dict(self, rel: List["Model"], child: "Model") -> None:
+        """
+        Adds child to the list of related models kept in owner's __dict__.
+
+        Usually the list mirrors the RelationProxy (to which child was just added)
+        or already contains the child on the same position (if populated during
+        owner initialization), so that is checked first to avoid comparing the child
+        with each of the models in the list.
+
+        :param rel: list of related models kept in owner's __dict__
+        :type rel: List[Model]
+        :param child: model to add
+        :type child: Model
+        """
+        position = len(self.related_models) - 1  # type: ignore
         try:
-            if child not in rel:
+            if len(rel) > position and rel[position] is child:
+                return
+            if len(rel) == position or child not in rel:
                 rel.append(child)
         except ReferenceError:
             rel.clear()
@@ -192,6 +208,26 @@ class Relation(Generic[T]):
                 self.related_models.pop(position)  # type: ignore
                 del self._owner.__dict__[relation_name][position]
 
+    def remove_many(self, children: List["Model"]) -> None:
+        """
+        Removes children Models from the list of related models kept in
+        RelationProxy in one pass over the list.
+
+        :param children: models to remove from relation
+        :type children: List[Model]
+        """
+        related_models = cast("RelationProxy", self.related_models)
+        positions = {
+            related_models.index(child) for child in children if child in related_models
+        }
+        related_models._remove_positions(positions)
+        relation_name = self.field_name
+        rel = self._owner.__dict__.get(relation_name)
+        if rel:
+            self._owner.__dict__[relation_name] = [
+                child for position, child in enumerate(rel) if position not in positions
+            ]
+
     def get(self) -> Optional[Union[List["Model"], "Model"]]:
         """
         Return the related model or models from RelationProxy.
@@ -1,3 +1,4 @@
+import bisect
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -5,6 +6,7 @@ from typing import (
     Generic,
     List,
     Optional,
+    Sequence,
     Set,
     Type,
     TypeVar,
@@ -14,6 +16,8 @@ from typing_extensions import SupportsIndex
 
 import ormar
 from ormar.exceptions import NoMatch, RelationshipInstanceError
+from ormar.models.save_planner import SavePlanner
+from ormar.queryset.utils import get_bulk_batch_size
 from ormar.relations.querysetproxy import QuerysetProxy
 
 if TYPE_CHECKING:  # pragma no cover
@@ -162,6 +166,24 @@ class RelationProxy(Generic[T], List[T]):
 
         return super().pop(index)
 
+    def _remove_positions(self, positions: Set[int]) -> None:
+        """
+        Removes items on given positions from the list in one pass,
+        shifting the indexes kept in the relation cache.
+
+        :param positions: indexes of the items to remove
+        :type positions: Set[int]
+        """
+        removed = sorted(positions)
+        self._relation_cache = {
+            hash_: idx - bisect.bisect_left(removed, idx)
+            for hash_, idx in self._relation_cache.items()
+            if idx not in positions
+        }
+        kept = [item for idx, item in enumerate(self) if idx not in positions]
+        super().clear()
+        super().extend(kept)
+
     def __contains__(self, item: object) -> bool:
         """
         Checks whether the item exists in self. This relies
@@ -251,7 +273,9 @@ class RelationProxy(Generic[T], List[T]):
         kwargs = {f"{related_field_name}__{pkname}": self._owner.pk}
         queryset = (
             ormar.QuerySet(
-                model_cls=self.relation.to, proxy_source_model=self._owner.__class__
+                model_cls=self.relation.to,
+                proxy_source_model=self._owner.__class__,
+                proxy_relation_name=self.field_name,
             )
             .select_related(related_field_name)
             .filter(**kwargs)
@@ -349,3 +373,126 @@ class RelationProxy(Generic[T], List[T]):
             relation_name=self.field_name,
             passed_kwargs=kwargs,
         )
+
+    async def add_many(self, items: Sequence["T"], **kwargs: Any) -> None:
+        """
+        Adds child models to relation at once.
+
+        For ManyToMany relations through instances are created with multi row
+        inserts, for reverse ForeignKey relations children are saved with
+        bulk inserts/updates (as in `save_related`).
+
+        Relation add signals are sent for each of the children.
+
+        :param kwargs: dict of additional keyword arguments for through instances
+        :type kwargs: Any
+        :param items: children to add to relation
+        :type items: Sequence[Model]
+        """
+        relation_name = self.related_field_name
+        for item in items:
+            await self._owner.signals.pre_relation_add.send(
+                sender=self._owner.__class__,
+                instance=self._owner,
+                child=item,
+                relation_name=self.field_name,
+                passed_kwargs=kwargs,
+            )
+        self._check_if_model_saved()
+        if items and self.type_ == ormar.RelationType.MULTIPLE:
+            await self.queryset_proxy.create_through_instances(items, **kwargs)
+            for item in items:
+                setattr(self._owner, self.field_name, item)
+        elif items:
+            planner = SavePlanner(follow=False, save_all=True)
+            for item in items:
+                setattr(item, relation_name, self._owner)
+                planner.collect(instance=item, relation_map={})
+            await planner.save()
+        for item in items:
+            await self._owner.signals.post_relation_add.send(
+                sender=self._owner.__class__,
+                instance=self._owner,
+                child=item,
+                relation_name=self.field_name,
+                passed_kwargs=kwargs,
+            )
+
+    async def remove_many(  # noqa: CCR001
+        self, items: Sequence["T"], keep_reversed: bool = True
+    ) -> None:
+        """
+        Removes the related models from relation with parent at once.
+
+        Through models are deleted for m2m relations with one statement
+        (per batch of children), all statements run in one transaction.
+
+        For reverse FK relations keep_reversed flag marks if the reversed models
+        should be kept (with foreign keys nulled in one bulk update)
+        or deleted from the database too (with one delete statement).
+
+        Relation remove signals are sent for each of the children.
+
+        :param items: children to remove from relation
+        :type items: Sequence[Model]
+        :param keep_reversed: flag if the reversed models should be kept or deleted
+        :type keep_reversed: bool
+        """
+        for item in items:
+            if item not in self:
+                raise NoMatch(
+                    f"Object {self._owner.get_name()} has no "
+                    f"{item.get_name()} with given primary key!"
+                )
+        for item in items:
+            await self._owner.signals.pre_relation_remove.send(
+                sender=self._owner.__class__,
+                instance=self._owner,
+                child=item,
+                relation_name=self.field_name,
+            )
+
+        relation_name = self.related_field_name
+        for item in items:
+            relation = item._orm._get(relation_name)
+            if relation:
+                relation.remove(self._owner)
+        self.relation.remove_many(list(items))
+        if items and self.type_ == ormar.RelationType.MULTIPLE:
+            await self.queryset_proxy.delete_through_instances(items)
+        elif items:
+            async with self.relation.to.ormar_config.database.transaction():
+                if keep_reversed:
+                    for item in items:
+                        setattr(item, relation_name, None)
+                    await ormar.QuerySet(model_cls=self.relation.to).bulk_update(
+                        list(items), columns=[relation_name]
+                    )
+                else:
+                    await self._delete_models(items)
+        for item in items:
+            await self._owner.signals.post_relation_remove.send(
+                sender=self._owner.__class__,
+                instance=self._owner,
+                child=item,
+                relation_name=self.field_name,
+            )
+
+    async def _delete_models(self, items: Sequence["T"]) -> None:
+        """
+        Deletes models from the database with one statement per batch of models.
+
+        :param items: models to delete
+        :type items: Sequence[Model]
+        """
+        model_cls = self.relation.to
+        pkname = model_cls.ormar_config.pkname
+        pks = [item.pk for item in items]
+        batch_size = get_bulk_batch_size(
+            database=model_cls.ormar_config.database, params_per_row=1
+        )
+        for start in range(0, len(pks), batch_size):
+            kwargs: Dict[str, Any] = {f"{pkname}__in": pks[start : start + batch_size]}
+            await ormar.QuerySet(model_cls=model_cls).filter(**kwargs).delete()
+        for item in items:
+            item.set_save_status(False)
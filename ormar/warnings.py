@@ -49,3 +49,9 @@ class OrmarDeprecatedSince020(OrmarDeprecationWarning):
 
     def __init__(self, message: str, *args: object) -> None:  # pragma: no cover
         super().__init__(message, *args, since=(0, 20), expected_removal=(0, 30))
+
+
+class NPlusOneWarning(UserWarning):
+    """
+    Warning issued by NPlusOneDetector when repeated similar queries are detected.
+    """
@@ -0,0 +1,114 @@
+from typing import List, Optional
+
+import ormar
+from ormar.models.dump_plan import ModelDumpPlan
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Customer(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="plans_customers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    avatar: str = ormar.LargeBinary(
+        max_length=100, represent_as_base64_str=True, nullable=True
+    )
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="plans_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+    def model_dump(self, **kwargs):  # type: ignore
+        result = super().model_dump(**kwargs)
+        result["custom"] = True
+        return result
+
+
+class Order(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="plans_orders")
+
+    id: int = ormar.Integer(primary_key=True)
+    number: str = ormar.String(max_length=100)
+    customer: Optional[Customer] = ormar.ForeignKey(Customer)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag)
+
+
+class OrderItem(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="plans_items")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    order: Optional[Order] = ormar.ForeignKey(Order, related_name="items")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def create_orders():
+    customer = Customer(id=1, name="John", avatar=b"john")
+    orders = [Order(id=i, number=f"{i}", customer=customer) for i in range(1, 3)]
+    items = [
+        OrderItem(id=i * 10 + j, name=f"item{j}", order=order)
+        for i, order in enumerate(orders)
+        for j in range(2)
+    ]
+    return orders, items
+
+
+def test_plans_are_reused_for_the_same_params():
+    orders, items = create_orders()
+    ModelDumpPlan.clear_plans()
+
+    dumped = [order.model_dump(exclude={"items": {"name"}}) for order in orders]
+    assert len(ModelDumpPlan.plans) == 1
+    assert dumped[0] == {
+        "id": 1,
+        "number": "1",
+        "customer": {"id": 1, "name": "John", "avatar": "am9obg=="},
+        "items": [{"id": 0}, {"id": 1}],
+        "tags": [],
+    }
+
+    orders[0].model_dump(exclude={"items__name"})
+    orders[0].model_dump(exclude={"items": {"name": ...}})
+    assert len(ModelDumpPlan.plans) == 3
+
+    orders[0].model_dump(exclude={"items": {"name"}}, exclude_list=True)
+    assert len(ModelDumpPlan.plans) == 4
+
+
+def test_plans_are_not_affected_by_modified_params():
+    orders, items = create_orders()
+    exclude = {"customer": {"avatar"}}
+    assert "avatar" not in orders[0].model_dump(exclude=exclude)["customer"]
+
+    exclude["customer"].add("name")
+    assert orders[0].model_dump(exclude=exclude)["customer"] == {"id": 1}
+    assert orders[0].model_dump(exclude={"customer": {"avatar"}})["customer"] == {
+        "id": 1,
+        "name": "John",
+    }
+
+
+def test_nested_models_with_custom_dump():
+    orders, items = create_orders()
+    orders[0].tags.append(Tag(id=1, name="urgent"))
+    result = orders[0].model_dump(exclude={"customer", "items"})
+    assert result == {
+        "id": 1,
+        "number": "1",
+        "tags": [{"id": 1, "name": "urgent", "custom": True}],
+    }
+    result = items[0].model_dump(exclude={"order": {"customer": ..., "tags": {"id"}}})
+    assert result == {
+        "id": 0,
+        "name": "item0",
+        "order": {"id": 1, "number": "1", "tags": [{"name": "urgent", "custom": True}]},
+    }
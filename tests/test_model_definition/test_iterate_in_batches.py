@@ -0,0 +1,169 @@
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.queryset.queryset import QuerySet
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Team(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="batch_teams")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Skill(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="batch_skills")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Player(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="batch_players")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    team: Optional[Team] = ormar.ForeignKey(Team)
+    skills: Optional[List[Skill]] = ormar.ManyToMany(Skill)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    processed = []
+    original = QuerySet._process_query_result_rows
+
+    async def counting_process(self, rows, row_plan=None):
+        result = await original(self, rows, row_plan)
+        processed.append(len(result))
+        return result
+
+    monkeypatch.setattr(QuerySet, "_process_query_result_rows", counting_process)
+    return processed
+
+
+async def create_sample_data():
+    skills = [await Skill.objects.create(name=f"Skill {num}") for num in range(3)]
+    for team_num in range(5):
+        team = await Team.objects.create(name=f"Team {team_num}")
+        for player_num in range(3):
+            player = await Player.objects.create(
+                name=f"Player {team_num}-{player_num}", team=team
+            )
+            for skill in skills[: player_num + 1]:
+                await player.skills.add(skill)
+
+
+def check_teams(teams):
+    assert [team.name for team in teams] == [f"Team {num}" for num in range(5)]
+    for team in teams:
+        assert [player.name for player in team.players] == [
+            f"{team.name.replace('Team', 'Player')}-{num}" for num in range(3)
+        ]
+        for num, player in enumerate(team.players):
+            assert [skill.name for skill in player.skills] == [
+                f"Skill {skill}" for skill in range(num + 1)
+            ]
+
+
+@pytest.mark.asyncio
+async def test_iterate_in_batches_with_select_related(batches):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            teams = [
+                team
+                async for team in Team.objects.select_related("players__skills")
+                .order_by(["id", "players__id", "players__skills__id"])
+                .iterate(batch_size=2)
+            ]
+            check_teams(teams)
+            assert batches == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_iterate_in_batches_with_prefetch_in_transaction(batches):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            teams = [
+                team
+                async for team in Team.objects.prefetch_related("players__skills")
+                .order_by(["players__id", "players__skills__id"])
+                .iterate(batch_size=2)
+            ]
+            check_teams(teams)
+            assert batches[:3] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_iterate_in_batches_respects_limit_and_offset():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            names = [
+                team.name
+                async for team in Team.objects.prefetch_related("players")
+                .offset(1)
+                .limit(3)
+                .iterate(batch_size=2)
+            ]
+            assert names == ["Team 1", "Team 2", "Team 3"]
+
+            names = [
+                team.name
+                async for team in Team.objects.select_related("players")
+                .offset(1)
+                .limit(3)
+                .iterate(batch_size=2)
+            ]
+            assert names == ["Team 1", "Team 2", "Team 3"]
+
+
+@pytest.mark.asyncio
+async def test_iterate_in_batches_outside_transaction_streams_rows(batches):
+    async with base_ormar_config.database:
+        await create_sample_data()
+        try:
+            teams = []
+            async for team in (
+                Team.objects.prefetch_related("players__skills")
+                .order_by(["players__id", "players__skills__id"])
+                .iterate(batch_size=2)
+            ):
+                # separate connection used by cursor does not block other queries
+                assert await Team.objects.get(id=team.id) == team
+                teams.append(team)
+            check_teams(teams)
+            assert batches[0] == 2
+        finally:
+            through = Player.ormar_config.model_fields["skills"].through
+            for model in [through, Player, Skill, Team]:
+                await model.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_iterate_in_batches_with_filter_on_relation_proxy():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            team = await Team.objects.get(name="Team 0")
+
+            names = [
+                player.name
+                async for player in team.players.iterate(
+                    name__endswith="2", batch_size=1
+                )
+            ]
+            assert names == ["Player 0-2"]
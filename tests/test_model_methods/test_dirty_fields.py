@@ -0,0 +1,160 @@
+from typing import Optional
+
+import databases
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Publisher(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dirty_publishers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dirty_books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    pages: int = ormar.Integer(default=100)
+    publisher: Optional[Publisher] = ormar.ForeignKey(Publisher)
+
+
+class Settings(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dirty_settings")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    options: dict = ormar.JSON(default={})
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    executed = []
+    original = databases.Database.execute
+
+    async def counting(self, query, values=None):
+        executed.append(query)
+        return await original(self, query, values)
+
+    monkeypatch.setattr(databases.Database, "execute", counting)
+    return executed
+
+
+def updated_columns(statement):
+    return set(statement.compile().params) - {"id_1"}
+
+
+@pytest.mark.asyncio
+async def test_update_writes_only_changed_fields(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            publisher = await Publisher.objects.create(name="Penguin")
+            await Book.objects.create(title="Dune", publisher=publisher)
+
+            book = await Book.objects.get()
+            assert book.changed_fields == set()
+            assert Book(title="New").changed_fields is None
+
+            book.title = "Dune Messiah"
+            assert book.changed_fields == {"title"}
+            assert not book.saved
+            statements.clear()
+            await book.update()
+            assert len(statements) == 1
+            assert "title" in updated_columns(statements[0])
+            assert "pages" not in updated_columns(statements[0])
+            assert book.saved and book.changed_fields == set()
+
+            statements.clear()
+            await book.update()
+            await book.upsert()
+            assert statements == []
+
+            other = await Publisher.objects.create(name="Tor")
+            statements.clear()
+            await book.update(publisher=other)
+            assert "publisher" in updated_columns(statements[0])
+            assert "title" not in updated_columns(statements[0])
+
+            check = await Book.objects.get()
+            assert check.title == "Dune Messiah"
+            assert check.publisher.pk == other.pk
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_skips_not_changed_models(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Book.objects.bulk_create(
+                [Book(title=f"Book {num}") for num in range(3)]
+            )
+            books = await Book.objects.order_by("id").all()
+            statements.clear()
+            await Book.objects.bulk_update(books)
+            assert statements == []
+
+            books[0].title = "First"
+            books[1].pages = 200
+            await Book.objects.bulk_update(books)
+            assert len(statements) == 1
+            assert all(book.saved for book in books)
+
+            # concurrent change of not modified field is not overwritten
+            await Book.objects.filter(id=books[0].id).update(pages=50)
+            books[0].title = "Changed"
+            await Book.objects.bulk_update(books)
+
+            check = await Book.objects.order_by("id").all()
+            assert [(book.title, book.pages) for book in check] == [
+                ("Changed", 50),
+                ("Book 1", 200),
+                ("Book 2", 100),
+            ]
+
+
+@pytest.mark.asyncio
+async def test_in_place_changes_of_json_fields_are_saved(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Settings.objects.create(name="first", options={"a": 1})
+            await Settings.objects.create(name="second", options={"b": [1]})
+
+            settings = await Settings.objects.get(name="first")
+            settings.options["a"] = 2
+            assert settings.changed_fields == set()
+            statements.clear()
+            await settings.update()
+            assert updated_columns(statements[0]) == {"options"}
+            settings = await Settings.objects.get(name="first")
+            assert settings.options == {"a": 2}
+
+            all_settings = await Settings.objects.order_by("id").all()
+            all_settings[1].options["b"].append(2)
+            await Settings.objects.bulk_update(all_settings)
+            settings = await Settings.objects.get(name="second")
+            assert settings.options == {"b": [1, 2]}
+
+
+@pytest.mark.asyncio
+async def test_changed_fields_are_kept_in_session():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            publisher = await Publisher.objects.create(name="Penguin")
+            await Book.objects.create(title="Dune", publisher=publisher)
+
+            with ormar.Session():
+                book = await Book.objects.get()
+                book.pages = 300
+                same = await Book.objects.select_related("publisher").get()
+                assert same is book
+                assert book.changed_fields == {"pages"}
@@ -0,0 +1,161 @@
+from typing import List, Optional
+
+import databases
+import ormar
+import pytest
+from ormar import post_save, pre_update
+from ormar.queryset import queryset
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Customer(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_save_customers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_save_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class ItemTag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_save_items_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    note: Optional[str] = ormar.String(max_length=100, nullable=True)
+
+
+class Order(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_save_orders")
+
+    id: int = ormar.Integer(primary_key=True)
+    number: str = ormar.String(max_length=100)
+    customer: Optional[Customer] = ormar.ForeignKey(Customer)
+
+
+class LineItem(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_save_line_items")
+
+    id: int = ormar.Integer(primary_key=True)
+    product: str = ormar.String(max_length=100)
+    quantity: int = ormar.Integer(default=1)
+    order: Optional[Order] = ormar.ForeignKey(Order, related_name="items")
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag, through=ItemTag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    executed = []
+    for method in ["execute", "fetch_all", "fetch_one", "fetch_val"]:
+        original = getattr(databases.Database, method)
+
+        def counting(self, query, values=None, *args, _original=original, **kwargs):
+            executed.append(query)
+            return _original(self, query, values, *args, **kwargs)
+
+        monkeypatch.setattr(databases.Database, method, counting)
+    return executed
+
+
+def build_order(tags):
+    return Order(
+        number="A-1",
+        customer=Customer(name="Alice"),
+        items=[
+            LineItem(product=f"Product {num}", tags=tags[num % 2 :])
+            for num in range(300)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_related_saves_each_model_class_in_bulk(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            tags = [Tag(name="gift"), Tag(name="fragile")]
+            order = build_order(tags)
+
+            count = await order.save_related(follow=True, save_all=True)
+            assert count == 304
+            assert len(statements) < 10
+
+            check = (
+                await Order.objects.select_related(["customer", "items__tags"])
+                .order_by(["items__id", "items__tags__id"])
+                .get()
+            )
+            assert check.customer.name == "Alice"
+            assert len(check.items) == 300
+            assert check.items[0].product == "Product 0"
+            assert check.items[0].quantity == 1
+            assert [tag.name for tag in check.items[0].tags] == ["gift", "fragile"]
+            assert [tag.name for tag in check.items[1].tags] == ["fragile"]
+            assert await ItemTag.objects.count() == 450
+            assert all(item.pk and item.saved for item in order.items)
+
+
+@pytest.mark.asyncio
+async def test_save_related_updates_existing_and_inserts_new_models(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            gift = await Tag.objects.create(name="gift")
+            order = await Order.objects.create(number="A-1")
+            first = await LineItem.objects.create(product="Pen", order=order)
+            await first.tags.add(gift, note="old")
+            updated = []
+
+            @pre_update(LineItem)
+            async def before_update(sender, instance, **kwargs):
+                updated.append(instance.product)
+
+            @post_save(LineItem)
+            async def after_save(sender, instance, **kwargs):
+                instance.quantity = 10
+
+            try:
+                order = await Order.objects.select_related("items__tags").get()
+                order.items[0].product = "Pencil"
+                order.items[0].tags[0].itemtag.note = "new"
+                order.items[0].tags[0].name = "present"
+                book = LineItem(product="Book", quantity=2, order=order)
+                statements.clear()
+
+                count = await order.save_related(follow=True)
+            finally:
+                LineItem.ormar_config.signals.pre_update.disconnect(before_update)
+                LineItem.ormar_config.signals.post_save.disconnect(after_save)
+
+            assert count == 3
+            assert updated == ["Pencil"]
+            assert book.quantity == 10
+            items = await LineItem.objects.select_related("tags").order_by("id").all()
+            assert [item.product for item in items] == ["Pencil", "Book"]
+            assert items[0].tags[0].name == "present"
+            assert items[0].tags[0].itemtag.note == "new"
+
+
+@pytest.mark.asyncio
+async def test_save_related_without_returning_inserts_one_by_one(monkeypatch):
+    monkeypatch.setattr(queryset.sqlite3, "sqlite_version_info", (3, 31, 1))
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            order = build_order([Tag(name="gift")])
+
+            count = await order.save_related(follow=True, save_all=True)
+            assert count == 303
+
+            check = await Order.objects.select_related(["customer", "items"]).get()
+            assert check.customer.name == "Alice"
+            assert len(check.items) == 300
+            assert await ItemTag.objects.count() == 150
@@ -0,0 +1,237 @@
+import datetime
+import decimal
+import enum
+import uuid
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.exceptions import QueryDefinitionError
+from ormar.queryset.records import import_optional
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Status(enum.Enum):
+    new = "new"
+    paid = "paid"
+
+
+class Customer(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="records_customers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Invoice(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="records_invoices")
+
+    id: int = ormar.Integer(primary_key=True)
+    number: uuid.UUID = ormar.UUID(default=uuid.uuid4)
+    total: decimal.Decimal = ormar.Decimal(max_digits=10, decimal_places=2)
+    weight: Optional[float] = ormar.Float(nullable=True)
+    issued: datetime.datetime = ormar.DateTime(
+        default=datetime.datetime(2024, 1, 1, 12, 30)
+    )
+    due: Optional[datetime.date] = ormar.Date(nullable=True)
+    paid: bool = ormar.Boolean(default=False)
+    status: Status = ormar.Enum(enum_class=Status, default=Status.new)
+    meta: Optional[dict] = ormar.JSON(nullable=True)
+    customer: Optional[Customer] = ormar.ForeignKey(Customer)
+
+
+class Shipment(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="records_shipments")
+
+    id: int = ormar.Integer(primary_key=True)
+    parcels: Optional[int] = ormar.Integer(nullable=True)
+    delivered: Optional[bool] = ormar.Boolean(nullable=True)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_invoices() -> Customer:
+    customer = await Customer.objects.create(name="Acme")
+    await Invoice.objects.create(
+        number=uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        total=decimal.Decimal("10.50"),
+        weight=1.5,
+        due=datetime.date(2024, 2, 1),
+        meta={"tags": ["a", "b"]},
+        customer=customer,
+    )
+    for i in range(4):
+        await Invoice.objects.create(
+            total=i, paid=True, status=Status.paid, customer=customer
+        )
+    await Invoice.objects.create(total=100)
+    return customer
+
+
+@pytest.mark.asyncio
+async def test_to_arrow_maps_field_types():
+    pyarrow = pytest.importorskip("pyarrow")
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            customer = await create_invoices()
+
+            table = await Invoice.objects.order_by("id").to_arrow(batch_size=2)
+            assert table.schema == pyarrow.schema(
+                [
+                    ("id", pyarrow.int64()),
+                    ("number", pyarrow.string()),
+                    ("total", pyarrow.decimal128(10, 2)),
+                    ("weight", pyarrow.float64()),
+                    ("issued", pyarrow.timestamp("us")),
+                    ("due", pyarrow.date32()),
+                    ("paid", pyarrow.bool_()),
+                    ("status", pyarrow.string()),
+                    ("meta", pyarrow.string()),
+                    ("customer", pyarrow.int64()),
+                ]
+            )
+            assert table.num_rows == 6
+            assert len(table.column("id").chunks) == 3
+            first = table.slice(0, 1).to_pylist()[0]
+            assert first == {
+                "id": 1,
+                "number": "12345678-1234-5678-1234-567812345678",
+                "total": decimal.Decimal("10.50"),
+                "weight": 1.5,
+                "issued": datetime.datetime(2024, 1, 1, 12, 30),
+                "due": datetime.date(2024, 2, 1),
+                "paid": False,
+                "status": "new",
+                "meta": '{"tags":["a","b"]}',
+                "customer": customer.id,
+            }
+            assert table.column("customer").null_count == 1
+            assert table.column("status").to_pylist()[1:5] == ["paid"] * 4
+
+            table = (
+                await Invoice.objects.select_related("customer")
+                .filter(paid=True)
+                .to_arrow(fields=["total", "customer__name"])
+            )
+            assert table.column_names == ["total", "customer__name"]
+            assert table.column("customer__name").to_pylist() == ["Acme"] * 4
+
+            table = await customer.invoices.to_arrow(fields="weight")
+            assert table.column("weight").to_pylist()[0] == 1.5
+
+            table = await Invoice.objects.filter(total__gt=1000).to_arrow()
+            assert table.num_rows == 0
+            assert table.schema.field("total").type == pyarrow.decimal128(10, 2)
+
+
+@pytest.mark.asyncio
+async def test_iterate_arrow_yields_record_batches():
+    pyarrow = pytest.importorskip("pyarrow")
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_invoices()
+
+            batches = [
+                batch
+                async for batch in Invoice.objects.order_by("id").iterate_arrow(
+                    batch_size=4, fields=["id", "paid"]
+                )
+            ]
+            assert [batch.num_rows for batch in batches] == [4, 2]
+            assert all(isinstance(x, pyarrow.RecordBatch) for x in batches)
+            assert pyarrow.Table.from_batches(batches).column("id").to_pylist() == [
+                1,
+                2,
+                3,
+                4,
+                5,
+                6,
+            ]
+
+
+@pytest.mark.asyncio
+async def test_to_numpy_returns_typed_arrays():
+    numpy = pytest.importorskip("numpy")
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_invoices()
+
+            columns = await Invoice.objects.order_by("id").to_numpy(batch_size=4)
+            assert list(columns) == [
+                "id",
+                "number",
+                "total",
+                "weight",
+                "issued",
+                "due",
+                "paid",
+                "status",
+                "meta",
+                "customer",
+            ]
+            assert columns["id"].dtype == numpy.int64
+            assert columns["id"].tolist() == [1, 2, 3, 4, 5, 6]
+            assert columns["total"].dtype == numpy.float64
+            assert columns["total"].tolist() == [10.5, 0, 1, 2, 3, 100]
+            assert columns["weight"][0] == 1.5
+            assert numpy.isnan(columns["weight"][1:]).all()
+            assert columns["issued"].dtype == numpy.dtype("datetime64[us]")
+            assert columns["issued"][0] == numpy.datetime64("2024-01-01T12:30")
+            assert columns["due"].dtype == numpy.dtype("datetime64[D]")
+            assert numpy.isnat(columns["due"][1:]).all()
+            assert columns["paid"].dtype == numpy.bool_
+            assert columns["number"].dtype == object
+            assert columns["number"][0] == uuid.UUID(
+                "12345678-1234-5678-1234-567812345678"
+            )
+            assert columns["meta"][0] == {"tags": ["a", "b"]}
+            assert columns["status"][1] == Status.paid
+            # integers with nulls are stored as floats
+            assert columns["customer"].dtype == numpy.float64
+            assert numpy.isnan(columns["customer"][-1])
+
+            columns = await Invoice.objects.filter(total__gt=1000).to_numpy(
+                fields=["id", "total"]
+            )
+            assert columns["id"].dtype == numpy.int64
+            assert columns["id"].size == 0
+            assert columns["total"].dtype == numpy.float64
+
+
+@pytest.mark.asyncio
+async def test_to_numpy_dtypes_do_not_depend_on_batch_size():
+    numpy = pytest.importorskip("numpy")
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            for i in range(5):
+                await Shipment.objects.create(parcels=i, delivered=i % 2 == 0)
+            await Shipment.objects.create()
+
+            for batch_size in (1, 2, 5, 6):
+                columns = await Shipment.objects.order_by("id").to_numpy(
+                    batch_size=batch_size
+                )
+                assert columns["parcels"].dtype == numpy.float64
+                assert columns["parcels"][:5].tolist() == [0, 1, 2, 3, 4]
+                assert numpy.isnan(columns["parcels"][5])
+                assert columns["delivered"].dtype == object
+                assert columns["delivered"].tolist() == [
+                    True,
+                    False,
+                    True,
+                    False,
+                    True,
+                    None,
+                ]
+                assert all(isinstance(x, bool) for x in columns["delivered"][:5])
+
+
+def test_missing_optional_dependency_raises():
+    with pytest.raises(QueryDefinitionError) as exc:
+        import_optional("not_installed_module", "to_arrow()")
+    assert "'not_installed_module' is required" in str(exc.value)
@@ -0,0 +1,102 @@
+import uuid
+from typing import Optional
+
+import databases
+import ormar
+import pytest
+from ormar.queryset import queryset
+from sqlalchemy import text
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Event(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="returning_events")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, name="event_name")
+    status: Optional[str] = ormar.String(
+        max_length=20, server_default=text("'pending'"), nullable=True
+    )
+
+
+class Ticket(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="returning_tickets")
+
+    id: uuid.UUID = ormar.UUID(primary_key=True, default=uuid.uuid4)
+    seat: str = ormar.String(max_length=10)
+    price: Optional[int] = ormar.Integer(server_default=text("100"), nullable=True)
+    event: Optional[Event] = ormar.ForeignKey(Event)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    executed = []
+    original_execute = databases.Database.execute
+    original_fetch_all = databases.Database.fetch_all
+
+    async def counting_execute(self, query, values=None):
+        executed.append(query)
+        return await original_execute(self, query, values)
+
+    async def counting_fetch_all(self, query, values=None):
+        executed.append(query)
+        return await original_fetch_all(self, query, values)
+
+    monkeypatch.setattr(databases.Database, "execute", counting_execute)
+    monkeypatch.setattr(databases.Database, "fetch_all", counting_fetch_all)
+    return executed
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_populates_generated_values(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Event.objects.create(name="existing")
+            events = [Event(name=f"Event {num}") for num in range(10)]
+
+            statements.clear()
+            await Event.objects.bulk_create(events, batch_size=4)
+            assert len(statements) == 3
+
+            assert all(event.status == "pending" for event in events)
+            assert all(event.saved for event in events)
+            loaded = {event.id: event.name for event in await Event.objects.all()}
+            assert len(set(event.id for event in events)) == 10
+            for event in events:
+                assert loaded[event.id] == event.name
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_with_provided_primary_keys():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            event = await Event.objects.create(name="Concert")
+            tickets = [Ticket(seat=f"A{num}", event=event) for num in range(5)]
+            tickets[2].price = 250
+            ids = [ticket.id for ticket in tickets]
+
+            await Ticket.objects.bulk_create(tickets)
+            assert [ticket.id for ticket in tickets] == ids
+            assert [ticket.price for ticket in tickets] == [100, 100, 250, 100, 100]
+
+            ticket = await Ticket.objects.select_related("event").get(seat="A2")
+            assert ticket.id == ids[2]
+            assert ticket.event.name == "Concert"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_without_returning_support(monkeypatch):
+    monkeypatch.setattr(queryset.sqlite3, "sqlite_version_info", (3, 31, 0))
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            events = [Event(name=f"Event {num}") for num in range(3)]
+            await Event.objects.bulk_create(events)
+            assert all(event.id is None for event in events)
+            assert await Event.objects.count() == 3
@@ -0,0 +1,127 @@
+import datetime
+import decimal
+from typing import Optional
+
+import databases
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Warehouse(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_warehouses")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Stock(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_stocks")
+
+    id: int = ormar.Integer(primary_key=True)
+    sku: str = ormar.String(max_length=100, name="stock_sku")
+    quantity: int = ormar.Integer(default=0)
+    price: decimal.Decimal = ormar.Decimal(max_digits=10, decimal_places=2)
+    checked: Optional[datetime.datetime] = ormar.DateTime(nullable=True)
+    attributes: Optional[dict] = ormar.JSON(nullable=True)
+    warehouse: Optional[Warehouse] = ormar.ForeignKey(Warehouse)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    executed = []
+    original = databases.Database.execute
+
+    async def counting_execute(self, query, values=None):
+        executed.append(query)
+        return await original(self, query, values)
+
+    monkeypatch.setattr(databases.Database, "execute", counting_execute)
+    return executed
+
+
+async def create_stocks(count: int):
+    main = await Warehouse.objects.create(name="Main")
+    await Stock.objects.bulk_create(
+        [
+            Stock(sku=f"SKU-{num}", price=decimal.Decimal("1.50"), warehouse=main)
+            for num in range(count)
+        ]
+    )
+    return await Stock.objects.order_by("id").all()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_uses_one_statement_per_batch(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            stocks = await create_stocks(25)
+            backup = await Warehouse.objects.create(name="Backup")
+            checked = datetime.datetime(2024, 5, 1, 12, 30)
+            for num, stock in enumerate(stocks):
+                stock.sku = f"NEW-{num}"
+                stock.quantity = num
+                stock.price = decimal.Decimal(num) / 4
+                stock.checked = checked
+                stock.attributes = {"num": num}
+                stock.warehouse = backup if num % 2 else stock.warehouse
+
+            statements.clear()
+            await Stock.objects.bulk_update(stocks, batch_size=10)
+            assert len(statements) == 3
+
+            updated = (
+                await Stock.objects.select_related("warehouse").order_by("id").all()
+            )
+            for num, stock in enumerate(updated):
+                assert stock.sku == f"NEW-{num}"
+                assert stock.quantity == num
+                assert stock.price == decimal.Decimal(num) / 4
+                assert stock.checked == checked
+                assert stock.attributes == {"num": num}
+                assert stock.warehouse.name == ("Backup" if num % 2 else "Main")
+                assert stock.saved
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_selected_columns_only(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            stocks = await create_stocks(5)
+            for stock in stocks:
+                stock.sku = "ignored"
+                stock.quantity = 7
+
+            statements.clear()
+            await Stock.objects.bulk_update(stocks, columns=["quantity"])
+            assert len(statements) == 1
+
+            updated = await Stock.objects.order_by("id").all()
+            assert [stock.quantity for stock in updated] == [7] * 5
+            assert [stock.sku for stock in updated] == [
+                f"SKU-{num}" for num in range(5)
+            ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_default_batch_respects_parameters_limit(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            stocks = await create_stocks(400)
+            for stock in stocks:
+                stock.quantity = stock.id
+
+            statements.clear()
+            await Stock.objects.bulk_update(stocks)
+            # 6 columns with 13 bound parameters per row, 76 rows per statement
+            assert len(statements) == 6
+
+            updated = await Stock.objects.all()
+            assert all(stock.quantity == stock.id for stock in updated)
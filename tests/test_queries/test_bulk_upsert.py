@@ -0,0 +1,136 @@
+from typing import Optional
+
+import databases
+import ormar
+import pytest
+from sqlalchemy import text
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Supplier(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="upsert_suppliers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="upsert_products",
+        constraints=[ormar.UniqueColumns("code")],
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    code: str = ormar.String(max_length=20)
+    name: str = ormar.String(max_length=100)
+    stock: int = ormar.Integer(default=0)
+    origin: Optional[str] = ormar.String(
+        max_length=20, server_default=text("'local'"), nullable=True
+    )
+    supplier: Optional[Supplier] = ormar.ForeignKey(Supplier)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    executed = []
+    original = databases.Database.fetch_all
+
+    async def counting_fetch_all(self, query, values=None):
+        executed.append(query)
+        return await original(self, query, values)
+
+    monkeypatch.setattr(databases.Database, "fetch_all", counting_fetch_all)
+    return executed
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_on_unique_columns(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            supplier = await Supplier.objects.create(name="Acme")
+            await Product.objects.bulk_create(
+                [
+                    Product(
+                        code=f"P{num}", name=f"Old {num}", stock=num, origin="import"
+                    )
+                    for num in range(3)
+                ]
+            )
+            existing = {p.code: p.id for p in await Product.objects.all()}
+
+            products = [
+                Product(code=f"P{num}", name=f"New {num}", stock=10, supplier=supplier)
+                for num in range(1, 5)
+            ]
+            statements.clear()
+            await Product.objects.bulk_upsert(
+                products,
+                conflict_columns=["code"],
+                update_columns=["name", "supplier"],
+                batch_size=3,
+            )
+            assert len(statements) == 2
+
+            assert products[0].id == existing["P1"]
+            assert products[1].id == existing["P2"]
+            assert all(product.id is not None for product in products)
+            assert all(product.saved for product in products)
+
+            loaded = {
+                p.code: p
+                for p in await Product.objects.select_related("supplier").all()
+            }
+            assert len(loaded) == 5
+            assert loaded["P0"].name == "Old 0"
+            assert loaded["P0"].supplier is None
+            assert loaded["P1"].name == "New 1"
+            assert loaded["P1"].stock == 1
+            assert loaded["P1"].origin == "import"
+            assert loaded["P1"].supplier.name == "Acme"
+            assert loaded["P4"].name == "New 4"
+            assert loaded["P4"].stock == 10
+            assert loaded["P4"].origin == "local"
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_on_primary_key_updates_all_columns():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            first = await Product.objects.create(code="A", name="Apple", stock=1)
+            products = [
+                Product(id=first.id, code="A", name="Apricot", stock=5),
+                Product(id=first.id + 100, code="B", name="Banana", stock=3),
+            ]
+            await Product.objects.bulk_upsert(products)
+
+            loaded = await Product.objects.order_by("id").all()
+            assert [(p.id, p.name, p.stock) for p in loaded] == [
+                (first.id, "Apricot", 5),
+                (first.id + 100, "Banana", 3),
+            ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_without_update_columns_skips_conflicts():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Product.objects.create(code="A", name="Apple")
+            products = [
+                Product(code="A", name="Avocado"),
+                Product(code="C", name="Cherry"),
+            ]
+            await Product.objects.bulk_upsert(
+                products, conflict_columns=["code"], update_columns=[]
+            )
+
+            assert products[0].id is None
+            assert products[1].id is not None
+            names = [p.name for p in await Product.objects.order_by("code").all()]
+            assert names == ["Apple", "Cherry"]
@@ -0,0 +1,91 @@
+import array
+import datetime
+from typing import Optional
+
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Shop(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="columnar_shops")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Sale(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="columnar_sales")
+
+    id: int = ormar.Integer(primary_key=True)
+    quantity: int = ormar.Integer()
+    amount: float = ormar.Float()
+    discount: Optional[float] = ormar.Float(nullable=True)
+    sold: datetime.date = ormar.Date(default=datetime.date(2024, 1, 1))
+    paid: bool = ormar.Boolean(default=True)
+    shop: Optional[Shop] = ormar.ForeignKey(Shop)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_values_returned_as_columns():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            shop = await Shop.objects.create(name="Main")
+            await Sale.objects.create(quantity=2, amount=10.5, shop=shop)
+            await Sale.objects.create(quantity=3, amount=4, discount=0.5, paid=False)
+
+            columns = await Sale.objects.order_by("id").values(columnar=True)
+            assert list(columns) == [
+                "id",
+                "quantity",
+                "amount",
+                "discount",
+                "sold",
+                "paid",
+                "shop",
+            ]
+            assert columns["quantity"] == array.array("q", [2, 3])
+            assert columns["amount"] == array.array("d", [10.5, 4.0])
+            assert columns["discount"] == [None, 0.5]
+            assert columns["sold"] == [datetime.date(2024, 1, 1)] * 2
+            assert columns["paid"] == [True, False]
+            assert columns["shop"] == [1, None]
+
+            rows = await Sale.objects.order_by("id").values()
+            assert {key: list(value) for key, value in columns.items()} == {
+                key: [row[key] for row in rows] for key in rows[0]
+            }
+
+            columns = (
+                await Sale.objects.select_related("shop")
+                .order_by("id")
+                .values(["quantity", "shop__name"], columnar=True)
+            )
+            assert columns == {
+                "quantity": array.array("q", [2, 3]),
+                "shop__name": ["Main", None],
+            }
+
+            columns = await shop.sales.values("amount", columnar=True)
+            assert columns["amount"] == array.array("d", [10.5])
+
+            columns = await Sale.objects.filter(quantity=100).values(
+                ["quantity", "paid"], columnar=True
+            )
+            assert columns == {"quantity": array.array("q"), "paid": []}
+
+
+@pytest.mark.asyncio
+async def test_values_list_is_built_from_rows():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Sale.objects.create(quantity=2, amount=10.5)
+            assert await Sale.objects.values_list(["quantity", "amount"]) == [(2, 10.5)]
+            assert await Sale.objects.values_list("quantity", flatten=True) == [2]
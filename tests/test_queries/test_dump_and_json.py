@@ -0,0 +1,213 @@
+import datetime
+import decimal
+import json
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.exceptions import QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dump_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dump_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dump_products")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    price: decimal.Decimal = ormar.Decimal(max_digits=10, decimal_places=2)
+    created: datetime.datetime = ormar.DateTime(
+        default=datetime.datetime(2024, 1, 1, 12, 30)
+    )
+    data: str = ormar.LargeBinary(
+        max_length=100, represent_as_base64_str=True, nullable=True
+    )
+    category: Optional[Category] = ormar.ForeignKey(Category)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag)
+
+
+class Section(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dump_sections")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Item(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="dump_items")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    section: Optional[Section] = ormar.ForeignKey(Section)
+    sections: Optional[List[Section]] = ormar.ManyToMany(Section, related_name="items2")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    toys = await Category.objects.create(name="Toys")
+    red = await Tag.objects.create(name="red")
+    blue = await Tag.objects.create(name="blue")
+    ball = await Product.objects.create(
+        name="Ball", price=decimal.Decimal("9.99"), category=toys, data=b"ball"
+    )
+    await Product.objects.create(name="Kite", price=decimal.Decimal("20"))
+    await ball.tags.add(red)
+    await ball.tags.add(blue)
+
+
+@pytest.mark.asyncio
+async def test_dump_follows_select_related_tree_and_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            products = await Product.objects.order_by("id").dump()
+            assert products == [
+                {
+                    "id": 1,
+                    "name": "Ball",
+                    "price": decimal.Decimal("9.99"),
+                    "created": datetime.datetime(2024, 1, 1, 12, 30),
+                    "data": "YmFsbA==",
+                    "category": {"id": 1},
+                    "tags": [],
+                },
+                {
+                    "id": 2,
+                    "name": "Kite",
+                    "price": decimal.Decimal("20"),
+                    "created": datetime.datetime(2024, 1, 1, 12, 30),
+                    "data": None,
+                    "category": None,
+                    "tags": [],
+                },
+            ]
+
+            products = (
+                await Product.objects.select_related(["category", "tags"])
+                .fields(["id", "name", "category__name", "tags__name"])
+                .order_by(["id", "tags__id"])
+                .dump()
+            )
+            assert products == [
+                {
+                    "id": 1,
+                    "name": "Ball",
+                    "category": {"id": 1, "name": "Toys"},
+                    "tags": [
+                        {
+                            "id": 1,
+                            "name": "red",
+                            "producttag": {"id": 1, "product": None, "tag": None},
+                        },
+                        {
+                            "id": 2,
+                            "name": "blue",
+                            "producttag": {"id": 2, "product": None, "tag": None},
+                        },
+                    ],
+                },
+                {"id": 2, "name": "Kite", "category": None, "tags": []},
+            ]
+
+            categories = (
+                await Category.objects.select_related("products")
+                .exclude_fields(["products__data", "products__created"])
+                .dump(name="Toys")
+            )
+            assert categories == [
+                {
+                    "id": 1,
+                    "name": "Toys",
+                    "products": [
+                        {
+                            "id": 1,
+                            "name": "Ball",
+                            "price": decimal.Decimal("9.99"),
+                            "tags": [],
+                        }
+                    ],
+                }
+            ]
+
+            tag = await Tag.objects.get(name="red")
+            assert await tag.products.fields(["id", "name"]).dump() == [
+                {
+                    "id": 1,
+                    "name": "Ball",
+                    "tags": [{"id": 1, "name": "red"}],
+                }
+            ]
+
+
+@pytest.mark.asyncio
+async def test_json_matches_model_dump_json():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            red = await Tag.objects.get(name="red")
+            querysets = [
+                Category.objects.select_related("products"),
+                Product.objects.select_related(["category", "tags"]).order_by(
+                    ["id", "tags__id"]
+                ),
+                Tag.objects.select_related("products__category").order_by("id"),
+                red.products.select_related("category"),
+            ]
+            for queryset in querysets:
+                result = await queryset.json()
+                assert isinstance(result, bytes)
+                models = await queryset.all()
+                expected = [json.loads(model.model_dump_json()) for model in models]
+                assert json.loads(result) == expected
+
+            assert await Product.objects.json(name="Unknown") == b"[]"
+
+            with pytest.raises(QueryDefinitionError):
+                await Product.objects.prefetch_related("tags").json()
+
+
+@pytest.mark.asyncio
+async def test_dump_skips_all_relations_back_to_parent_model():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            books = await Section.objects.create(name="Books")
+            games = await Section.objects.create(name="Games")
+            item = await Item.objects.create(name="Chess", section=books)
+            await item.sections.add(books)
+            await item.sections.add(games)
+
+            dumped = await Item.objects.select_related("section").dump()
+            assert dumped[0]["section"] == {"id": books.id, "name": "Books"}
+
+            querysets = [
+                Item.objects.select_related("section"),
+                Item.objects.select_related("sections").order_by("sections__id"),
+                Item.objects.select_related(["section", "sections"]).order_by(
+                    "sections__id"
+                ),
+                Section.objects.select_related(["items", "items2"]).order_by("id"),
+                Section.objects.select_related("items__sections").order_by("id"),
+            ]
+            for queryset in querysets:
+                expected = [model.model_dump() for model in await queryset.all()]
+                assert await queryset.dump() == expected
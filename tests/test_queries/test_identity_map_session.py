@@ -0,0 +1,180 @@
+from typing import List, Optional
+
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="session_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="session_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="session_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag)
+
+
+class Writer(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="session_writers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: Optional[str] = ormar.String(max_length=100, nullable=True)
+    bio: Optional[str] = ormar.String(max_length=100, nullable=True)
+
+
+class Article(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="session_articles")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: Optional[str] = ormar.String(max_length=100, nullable=True)
+    writer: Optional[Writer] = ormar.ForeignKey(Writer)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    author = await Author.objects.create(name="Alice")
+    news = await Tag.objects.create(name="news")
+    for title in ["First", "Second"]:
+        post = await Post.objects.create(title=title, author=author)
+        await post.tags.add(news)
+
+
+@pytest.mark.asyncio
+async def test_session_returns_the_same_instance_for_the_same_row():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            with ormar.Session() as session:
+                assert ormar.Session.current() is session
+                posts = (
+                    await Post.objects.select_related(["author", "tags"])
+                    .order_by("id")
+                    .all()
+                )
+                assert posts[0].author is posts[1].author
+                assert posts[0].tags[0] is posts[1].tags[0]
+
+                author = await Author.objects.get(name="Alice")
+                assert author is posts[0].author
+                assert author.saved
+
+                prefetched = (
+                    await Post.objects.prefetch_related(["author", "tags"])
+                    .order_by("id")
+                    .all()
+                )
+                assert prefetched == posts
+                assert all(new is old for new, old in zip(prefetched, posts))
+                assert prefetched[0].tags[0] is posts[0].tags[0]
+
+                authors = await Author.objects.select_related("posts").all()
+                assert authors == [author]
+                assert [post.title for post in author.posts] == ["First", "Second"]
+
+            assert ormar.Session.current() is None
+            other = await Author.objects.get(name="Alice")
+            assert other is not author
+
+
+@pytest.mark.asyncio
+async def test_session_flushes_dirty_and_new_instances():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            with ormar.Session() as session:
+                posts = await Post.objects.select_related("author").all()
+                assert session.dirty == []
+
+                posts[0].title = "Updated"
+                posts[0].author.name = "Bob"
+                new_author = session.add(Author(name="Carol"))
+                new_post = session.add(Post(title="Third", author=new_author))
+                assert len(session.dirty) == 4
+
+                count = await session.flush()
+                assert count == 4
+                assert session.dirty == []
+                assert new_post.pk is not None
+                assert session.get(Post, new_post.pk) is new_post
+
+                created = await Post.objects.create(title="Fourth")
+                assert await Post.objects.get(title="Fourth") is created
+                await created.delete()
+                assert session.get(Post, created.pk) is None
+
+            titles = await Post.objects.select_related("author").order_by("id").all()
+            assert [(post.title, post.author.name) for post in titles] == [
+                ("Updated", "Bob"),
+                ("Second", "Bob"),
+                ("Third", "Carol"),
+            ]
+
+
+@pytest.mark.asyncio
+async def test_session_fills_fields_not_loaded_with_instance():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            writer = await Writer.objects.create(name="Alice", bio="Writes")
+            await Article.objects.create(title="First", writer=writer)
+            await Article.objects.create(title="Second", writer=writer)
+
+            with ormar.Session():
+                writer = await Writer.objects.exclude_fields(["name", "bio"]).get()
+                assert writer.name is None
+
+                assert await Writer.objects.exclude_fields("bio").get() is writer
+                assert writer.name == "Alice"
+                assert writer.bio is None
+                assert writer.saved
+                assert writer.changed_fields == set()
+
+                writer.bio = "Changed"
+                article = await Article.objects.select_related("writer").get(
+                    title="First"
+                )
+                assert article.writer is writer
+                assert writer.bio == "Changed"
+                assert writer.changed_fields == {"bio"}
+                assert not writer.saved
+
+                article = await Article.objects.exclude_fields("title").get(
+                    title="Second"
+                )
+                assert article.title is None
+                loaded = await Writer.objects.prefetch_related("articles").get()
+                assert article in loaded.articles
+                assert article.title == "Second"
+                assert article.saved
+
+            with ormar.Session():
+                # changes of instances marked as not saved are not tracked,
+                # so their not loaded fields are not filled
+                article = await Article.objects.exclude_fields("title").get(
+                    title="First"
+                )
+                article.set_save_status(False)
+                assert await Article.objects.get(title="First") is article
+                assert article.title is None
+                assert article.changed_fields is None
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.instrumentation import (
+    QueryEvent,
+    add_instrument,
+    operation,
+    remove_instrument,
+)
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+events: List[QueryEvent] = []
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="instrumented_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="instrumented_products", instruments=[events.append]
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+class Review(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="instrumented_reviews")
+
+    id: int = ormar.Integer(primary_key=True)
+    score: int = ormar.Integer()
+    products: Optional[List[Product]] = ormar.ManyToMany(Product)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_events_are_emitted_for_queryset_operations():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            category = await Category.objects.create(name="Books")
+            for num in range(3):
+                product = await Product.objects.create(
+                    name=f"Book {num}", category=category
+                )
+                review = await Review.objects.create(score=num)
+                await product.reviews.add(review)
+            assert [event.operation for event in events][:2] == ["save", "save"]
+            events.clear()
+
+            products = (
+                await Product.objects.select_related("category")
+                .prefetch_related("reviews")
+                .all()
+            )
+            assert len(products) == 3
+            prefetch, query = events
+            assert prefetch.operation == "prefetch_related"
+            assert prefetch.model is Product
+            assert prefetch.rows == 3
+            assert query.operation == "all"
+            assert query.rows == 3
+            assert len(query.statements) == 1
+            assert query.sql.startswith("SELECT")
+            assert "instrumented_categories" in query.sql
+            assert set(query.phases) == {
+                "build",
+                "execute",
+                "hydrate",
+                "merge",
+                "prefetch",
+            }
+            assert query.duration >= sum(
+                query.phases[name] for name in ["execute", "hydrate", "prefetch"]
+            )
+            assert query.error is None
+
+            events.clear()
+            await Product.objects.get(name="Book 1")
+            assert await Product.objects.filter(name__startswith="Book").count() == 3
+            await Product.objects.filter(name="Book 2").update(name="Book 3")
+            await Category.objects.all()
+            assert [event.operation for event in events] == ["get", "count", "update"]
+
+
+@pytest.mark.asyncio
+async def test_global_instruments_receive_events_of_all_models():
+    received = []
+    add_instrument(received.append)
+    try:
+        async with base_ormar_config.database:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                category = await Category(name="Games").save()
+                await category.update(name="Board games")
+                await category.load()
+                await Category.objects.bulk_create(
+                    [Category(name=f"Category {num}") for num in range(3)]
+                )
+                await category.delete()
+    finally:
+        remove_instrument(received.append)
+
+    assert [(event.model, event.operation) for event in received] == [
+        (Category, "save"),
+        (Category, "update"),
+        (Category, "load"),
+        (Category, "bulk_create"),
+        (Category, "delete"),
+    ]
+    assert received[1].sql.startswith("UPDATE instrumented_categories")
+    assert received[2].phases.keys() == {"build", "execute"}
+
+
+@pytest.mark.asyncio
+async def test_failing_instrument_does_not_fail_the_query(caplog):
+    received: List[QueryEvent] = []
+
+    def failing(event: QueryEvent) -> None:
+        raise RuntimeError("metrics backend is down")
+
+    add_instrument(failing)
+    add_instrument(received.append)
+    try:
+        async with base_ormar_config.database:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                await Category.objects.create(name="Games")
+                assert await Category.objects.count() == 1
+    finally:
+        remove_instrument(failing)
+        remove_instrument(received.append)
+
+    assert [event.operation for event in received] == ["save", "count"]
+    assert "metrics backend is down" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_hydrate_phase_excludes_time_of_other_tasks():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            for num in range(3):
+                await Product.objects.create(name=f"Book {num}")
+            events.clear()
+
+            async def blocking_task():
+                for _ in range(3):
+                    time.sleep(0.05)
+                    await asyncio.sleep(0)
+
+            rows = await Product.objects.database.fetch_all(
+                Product.ormar_config.table.select()
+            )
+            with operation(Product, "all") as current:
+                task = asyncio.ensure_future(blocking_task())
+                await Product.objects._process_query_result_rows(rows)
+                await task
+
+            assert current.phases["hydrate"] < 0.05
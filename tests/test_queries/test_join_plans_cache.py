@@ -0,0 +1,109 @@
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.queryset.join import SqlJoin
+from ormar.queryset.queries.query import Query
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="plan_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, nullable=True)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="plan_books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    year: int = ormar.Integer(nullable=True)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def join_counter(monkeypatch):
+    calls = []
+    original = SqlJoin.build_join
+
+    def counting_build_join(self):
+        calls.append(self.relation_name)
+        return original(self)
+
+    monkeypatch.setattr(SqlJoin, "build_join", counting_build_join)
+    Query.clear_join_plans()
+    yield calls
+    Query.clear_join_plans()
+
+
+@pytest.mark.asyncio
+async def test_joins_are_resolved_once_per_query_shape(join_counter):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="Tolkien")
+            other = await Author.objects.create(name="Sapkowski")
+            await Book.objects.create(title="Hobbit", year=1937, author=author)
+            await Book.objects.create(title="Witcher", year=1990, author=other)
+
+            books = await Book.objects.select_related("author").all(title="Hobbit")
+            assert len(join_counter) == 1
+            assert books[0].author.name == "Tolkien"
+
+            books = await Book.objects.select_related("author").all(title="Witcher")
+            assert len(join_counter) == 1
+            assert books[0].author.name == "Sapkowski"
+
+            book = (
+                await Book.objects.select_related("author")
+                .filter(author__name="Tolkien")
+                .limit(1)
+                .get()
+            )
+            assert book.title == "Hobbit"
+            assert len(join_counter) == 1
+
+
+@pytest.mark.asyncio
+async def test_different_query_shapes_use_separate_plans(join_counter):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="Tolkien")
+            await Book.objects.create(title="Hobbit", year=1937, author=author)
+
+            await Book.objects.select_related("author").all()
+            book = (
+                await Book.objects.select_related("author")
+                .exclude_fields("author__name")
+                .get()
+            )
+            assert book.author.name is None
+            assert len(join_counter) == 2
+
+            books = (
+                await Book.objects.select_related("author")
+                .order_by("-author__name")
+                .all()
+            )
+            assert books[0].author.name == "Tolkien"
+            assert len(join_counter) == 3
+
+            books = await Book.objects.select_related("author").all(year=1937)
+            assert books[0].author.name == "Tolkien"
+            assert len(join_counter) == 3
+
+
+def test_join_plans_cache_is_bounded(join_counter, monkeypatch):
+    monkeypatch.setattr(Query, "max_join_plans", 2)
+    Book.objects.select_related("author").build_select_expression()
+    Book.objects.build_select_expression()
+    Author.objects.build_select_expression()
+    assert len(Query.join_plans) == 2
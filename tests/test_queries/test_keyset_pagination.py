@@ -0,0 +1,168 @@
+import datetime
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.exceptions import QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Channel(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="keyset_channels")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Message(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="keyset_messages")
+
+    id: int = ormar.Integer(primary_key=True)
+    text: str = ormar.String(max_length=100)
+    priority: int = ormar.Integer()
+    created: datetime.datetime = ormar.DateTime()
+    channel: Optional[Channel] = ormar.ForeignKey(Channel)
+
+
+class Reaction(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="keyset_reactions")
+
+    id: int = ormar.Integer(primary_key=True)
+    emoji: str = ormar.String(max_length=10)
+    message: Optional[Message] = ormar.ForeignKey(Message)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+START = datetime.datetime(2024, 1, 1)
+
+
+async def create_sample_data():
+    channel = await Channel.objects.create(name="general")
+    for num in range(10):
+        message = await Message.objects.create(
+            text=f"Message {num}",
+            priority=num % 3,
+            created=START + datetime.timedelta(hours=num // 2),
+            channel=channel,
+        )
+        for emoji in ["+1", "heart"]:
+            await Reaction.objects.create(emoji=emoji, message=message)
+    return channel
+
+
+async def paginate(queryset, page_size=3):
+    pages = []
+    page = await queryset.limit(page_size).all()
+    while page:
+        pages.append([message.text for message in page])
+        cursor = queryset.get_cursor(page[-1])
+        page = await queryset.after(cursor).limit(page_size).all()
+    return pages
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_by_primary_key():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            pages = await paginate(Message.objects)
+            assert pages == [
+                ["Message 0", "Message 1", "Message 2"],
+                ["Message 3", "Message 4", "Message 5"],
+                ["Message 6", "Message 7", "Message 8"],
+                ["Message 9"],
+            ]
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_with_mixed_directions_and_ties():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            queryset = Message.objects.order_by(["-priority", "created"])
+            expected = [message.text for message in await queryset.order_by("id").all()]
+            pages = await paginate(queryset, page_size=4)
+            assert [text for page in pages for text in page] == expected
+            assert len(pages) == 3
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_with_select_related_children():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            queryset = Message.objects.select_related("reactions").order_by(
+                ["-created", "reactions__emoji"]
+            )
+            pages = []
+            page = await queryset.limit(4).all()
+            while page:
+                for message in page:
+                    assert [r.emoji for r in message.reactions] == ["+1", "heart"]
+                pages.append([message.text for message in page])
+                page = (
+                    await queryset.after(queryset.get_cursor(page[-1])).limit(4).all()
+                )
+            assert pages == [
+                ["Message 8", "Message 9", "Message 6", "Message 7"],
+                ["Message 4", "Message 5", "Message 2", "Message 3"],
+                ["Message 0", "Message 1"],
+            ]
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_before_cursor():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            queryset = Message.objects.order_by("-priority")
+            messages = await queryset.all()
+            cursor = queryset.get_cursor(messages[5])
+            previous = await queryset.before(cursor).limit(3).all()
+            assert [message.text for message in reversed(previous)] == [
+                message.text for message in messages[2:5]
+            ]
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_on_relation_proxy():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            channel = await create_sample_data()
+            channel = await Channel.objects.get(id=channel.id)
+
+            first = await channel.messages.order_by("created").limit(5).all()
+            cursor = channel.messages.order_by("created").get_cursor(first[-1])
+            rest = await channel.messages.order_by("created").after(cursor).all()
+            assert [message.text for message in rest] == [
+                f"Message {num}" for num in range(5, 10)
+            ]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursors():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            message = await Message.objects.first()
+
+            with pytest.raises(QueryDefinitionError):
+                Message.objects.after("not a cursor")
+
+            cursor = Message.objects.order_by("created").get_cursor(message)
+            with pytest.raises(QueryDefinitionError):
+                Message.objects.order_by("priority").after(cursor)
+
+            with pytest.raises(QueryDefinitionError):
+                Message.objects.order_by(["reactions__emoji", "created"]).get_cursor(
+                    message
+                )
@@ -0,0 +1,115 @@
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.models.newbasemodel import NewBaseModel
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Owner(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="merge_owners")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Pet(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="merge_pets")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    owner: Optional[Owner] = ormar.ForeignKey(Owner)
+
+
+class Toy(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="merge_toys")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    pet: Optional[Pet] = ormar.ForeignKey(Pet)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_merging_many_children_does_not_compare_each_pair(monkeypatch):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            owner = await Owner.objects.create(name="Alice")
+            await Pet.objects.bulk_create(
+                [Pet(name=f"Pet {num}", owner=owner) for num in range(300)]
+            )
+
+            comparisons = []
+            original_eq = NewBaseModel.__eq__
+
+            def counting_eq(self, other):
+                comparisons.append(self)
+                return original_eq(self, other)
+
+            monkeypatch.setattr(NewBaseModel, "__eq__", counting_eq)
+            owners = (
+                await Owner.objects.select_related("pets").order_by("pets__id").all()
+            )
+            monkeypatch.undo()
+
+            assert len(owners) == 1
+            assert [pet.name for pet in owners[0].pets] == [
+                f"Pet {num}" for num in range(300)
+            ]
+            assert len(comparisons) < 1000
+
+
+@pytest.mark.asyncio
+async def test_merging_nested_children_keeps_order():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            alice = await Owner.objects.create(name="Alice")
+            bob = await Owner.objects.create(name="Bob")
+            for owner in [alice, bob]:
+                for pet_num in range(3):
+                    pet = await Pet.objects.create(
+                        name=f"{owner.name} pet {pet_num}", owner=owner
+                    )
+                    for toy_num in range(2):
+                        await Toy.objects.create(
+                            name=f"{pet.name} toy {toy_num}", pet=pet
+                        )
+
+            owners = (
+                await Owner.objects.select_related("pets__toys")
+                .order_by(["id", "pets__id", "pets__toys__id"])
+                .all()
+            )
+            assert [owner.name for owner in owners] == ["Alice", "Bob"]
+            for owner in owners:
+                assert [pet.name for pet in owner.pets] == [
+                    f"{owner.name} pet {num}" for num in range(3)
+                ]
+                for pet in owner.pets:
+                    assert pet.owner == owner
+                    assert [toy.name for toy in pet.toys] == [
+                        f"{pet.name} toy {num}" for num in range(2)
+                    ]
+                    assert all(toy.pet == pet for toy in pet.toys)
+                assert owner.saved and owner.pets[0].toys[0].saved
+
+
+@pytest.mark.asyncio
+async def test_merge_two_instances():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            owner = await Owner.objects.create(name="Alice")
+            first = await Pet.objects.create(name="Rex", owner=owner)
+            second = await Pet.objects.create(name="Tom", owner=owner)
+
+            one = await Owner.objects.select_related("pets").get(pets__id=first.id)
+            other = await Owner.objects.select_related("pets").get(pets__id=second.id)
+            merged = Owner.merge_two_instances(one, other)
+            assert merged is other
+            assert [pet.name for pet in merged.pets] == ["Tom", "Rex"]
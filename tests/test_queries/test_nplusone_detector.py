@@ -0,0 +1,78 @@
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.exceptions import NPlusOneError
+from ormar.instrumentation import NPlusOneDetector
+from ormar.warnings import NPlusOneWarning
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="nplusone_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="nplusone_books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    for num in range(4):
+        author = await Author.objects.create(name=f"Author {num}")
+        await Book.objects.create(title=f"Book {num}", author=author)
+
+
+@pytest.mark.asyncio
+async def test_detector_raises_for_relation_loaded_in_loop():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            authors = await Author.objects.all()
+
+            with pytest.raises(NPlusOneError) as exc_info:
+                with NPlusOneDetector(raise_error=True):
+                    for author in authors:
+                        await author.books.all()
+            assert "Author.books" in str(exc_info.value)
+            assert 'prefetch_related("books")' in str(exc_info.value)
+
+            with NPlusOneDetector(raise_error=True) as detector:
+                await Author.objects.prefetch_related("books").all()
+                for author in authors[:2]:
+                    await author.books.all()
+                await Author.objects.get(name="Author 1")
+                await Author.objects.get(name="Author 2")
+            assert detector.reports == []
+
+
+@pytest.mark.asyncio
+async def test_detector_warns_for_repeated_loads():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            books = await Book.objects.all()
+
+            with pytest.warns(NPlusOneWarning, match="load()"):
+                with NPlusOneDetector() as detector:
+                    for book in books:
+                        await book.author.load()
+            assert len(detector.reports) == 1
+
+            # queries outside of detector context are not counted
+            for book in books:
+                await book.author.load()
+            assert len(detector.reports) == 1
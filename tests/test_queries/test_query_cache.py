@@ -0,0 +1,195 @@
+import asyncio
+from typing import List, Optional
+
+import ormar
+import pytest
+import pytest_asyncio
+from ormar.queryset import LRUCacheStore, cache
+from ormar.queryset.cache import invalidate_tables
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="cache_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="cache_products")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def rename_outside_of_ormar(model, pk: int, name: str) -> None:
+    table = model.ormar_config.table
+    expr = table.update().where(table.c.id == pk).values(name=name)
+    await base_ormar_config.database.execute(expr)
+
+
+def names(models: List[ormar.Model]) -> List[str]:
+    return [model.name for model in models]
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def cleanup():
+    yield
+    async with base_ormar_config.database:
+        await Product.objects.delete(each=True)
+        await Category.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_until_invalidated_or_expired():
+    async with base_ormar_config.database:
+        category = await Category.objects.create(name="Toys")
+        queryset = Category.objects.cache()
+        for _ in range(2):
+            assert names(await queryset.all()) == ["Toys"]
+            assert (await queryset.get()).name == "Toys"
+            assert await queryset.values_list("name", flatten=True) == ["Toys"]
+            assert await queryset.filter(name="Games").exists() is False
+            await rename_outside_of_ormar(Category, category.id, "Games")
+        assert names(await Category.objects.all()) == ["Games"]
+
+        invalidate_tables(["cache_categories"])
+        assert names(await queryset.all()) == ["Games"]
+
+        queryset = Category.objects.cache(ttl=0.05)
+        assert await queryset.count() == 1
+        await base_ormar_config.database.execute(
+            Category.ormar_config.table.insert().values(name="Books")
+        )
+        assert await queryset.count() == 1
+        await asyncio.sleep(0.06)
+        assert await queryset.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_with_ormar_invalidate_cached_results():
+    async with base_ormar_config.database:
+        category = await Category.objects.create(name="Toys")
+        await Product.objects.create(name="Ball", category=category)
+        queryset = Product.objects.select_related("category").cache()
+        assert (await queryset.get()).category.name == "Toys"
+
+        await category.update(name="Games")
+        assert (await queryset.get()).category.name == "Games"
+
+        await Product.objects.bulk_create([Product(name="Doll", category=category)])
+        assert names(await queryset.all()) == ["Ball", "Doll"]
+
+        await Product.objects.filter(name="Doll").update(name="Kite")
+        assert names(await queryset.all()) == ["Ball", "Kite"]
+
+        products = await Product.objects.all()
+        for product in products:
+            product.name = product.name.upper()
+        await Product.objects.bulk_update(products)
+        assert names(await queryset.all()) == ["BALL", "KITE"]
+
+        await products[1].delete()
+        assert names(await queryset.all()) == ["BALL"]
+
+        await Product.objects.delete(each=True)
+        assert await queryset.all() == []
+
+
+@pytest.mark.asyncio
+async def test_prefetch_queries_are_cached():
+    async with base_ormar_config.database:
+        category = await Category.objects.create(name="Toys")
+        product = await Product.objects.create(name="Ball", category=category)
+        queryset = Category.objects.prefetch_related("products").cache()
+        assert names((await queryset.get()).products) == ["Ball"]
+
+        await rename_outside_of_ormar(Product, product.id, "Kite")
+        assert names((await queryset.get()).products) == ["Ball"]
+
+        invalidate_tables(["cache_products"])
+        assert names((await queryset.get()).products) == ["Kite"]
+
+        assert names(await category.products.cache().all()) == ["Kite"]
+        await rename_outside_of_ormar(Product, product.id, "Doll")
+        assert names(await category.products.cache().all()) == ["Kite"]
+
+
+@pytest.mark.asyncio
+async def test_custom_store_and_transactions():
+    async with base_ormar_config.database:
+        store = LRUCacheStore(maxsize=1)
+        category = await Category.objects.create(name="Toys")
+
+        assert names(await Category.objects.cache(store=store).all()) == ["Toys"]
+        assert len(store) == 1
+        await Category.objects.cache(store=store).count()
+        assert len(store) == 1
+
+        await rename_outside_of_ormar(Category, category.id, "Games")
+        assert names(await Category.objects.cache(store=store).all()) == ["Games"]
+
+        async with base_ormar_config.database.transaction():
+            await rename_outside_of_ormar(Category, category.id, "Books")
+            assert names(await Category.objects.cache(store=store).all()) == ["Books"]
+            await rename_outside_of_ormar(Category, category.id, "Music")
+            assert names(await Category.objects.cache(store=store).all()) == ["Music"]
+
+        store.clear()
+        assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_results_cached_by_other_connection_during_transaction():
+    async with base_ormar_config.database:
+        written = asyncio.Event()
+        read = asyncio.Event()
+
+        async def setup() -> None:
+            await Category.objects.create(name="old")
+
+        async def write_in_transaction() -> None:
+            async with base_ormar_config.database.transaction():
+                await Category.objects.filter(name="old").update(name="new")
+                written.set()
+                await read.wait()
+
+        async def read_before_commit() -> None:
+            await written.wait()
+            assert (await Category.objects.cache().get()).name == "old"
+            read.set()
+
+        async def read_after_commit() -> None:
+            assert (await Category.objects.cache().get()).name == "new"
+            assert (await Category.objects.get()).name == "new"
+
+        # each task runs its queries on a separate connection
+        await asyncio.create_task(setup())
+        await asyncio.gather(write_in_transaction(), read_before_commit())
+        await asyncio.create_task(read_after_commit())
+
+
+@pytest.mark.asyncio
+async def test_finished_transactions_are_not_kept():
+    async with base_ormar_config.database:
+        for i in range(20):
+            async with base_ormar_config.database.transaction():
+                await Category(name=f"category {i}").save()
+        assert len(cache._pending) == 0
+
+        store = LRUCacheStore()
+        transaction = base_ormar_config.database.transaction()
+        async with transaction:
+            await Category(name="kept").save()
+        assert len(cache._pending) == 1
+        await Category.objects.cache(store=store).count()
+        assert len(cache._pending) == 0
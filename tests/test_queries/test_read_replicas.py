@@ -0,0 +1,171 @@
+import asyncio
+import os
+from typing import List, Optional
+
+import databases
+import ormar
+import pytest
+import sqlalchemy
+from ormar import ReplicaPolicy
+from ormar.queryset.replicas import LATENCY_PROBE_INTERVAL
+
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL.startswith("sqlite"),
+    reason="Replicas are emulated with separate sqlite files",
+)
+
+URLS = {
+    "primary": "sqlite:///test_replicas_primary.db",
+    "replica1": "sqlite:///test_replicas_replica1.db",
+    "replica2": "sqlite:///test_replicas_replica2.db",
+}
+primary = databases.Database(URLS["primary"])
+replicas = [databases.Database(URLS["replica1"]), databases.Database(URLS["replica2"])]
+metadata = sqlalchemy.MetaData()
+
+base_ormar_config = ormar.OrmarConfig(
+    metadata=metadata, database=primary, read_replicas=replicas
+)
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="replicas_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Item(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="replicas_items")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+class StickyItem(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="replicas_sticky_items",
+        replica_policy=ReplicaPolicy.sticky_after_write,
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class FastItem(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="replicas_fast_items", replica_policy=ReplicaPolicy.least_latency
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def create_databases():
+    engines = {name: sqlalchemy.create_engine(url) for name, url in URLS.items()}
+    for name, engine in engines.items():
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                Category.ormar_config.table.insert().values(id=1, name=name)
+            )
+            connection.execute(
+                Item.ormar_config.table.insert().values(id=1, name=name, category=1)
+            )
+            for table in [
+                StickyItem.ormar_config.table,
+                FastItem.ormar_config.table,
+            ]:
+                connection.execute(table.insert().values(id=1, name=name))
+    yield
+    for url, engine in zip(URLS.values(), engines.values()):
+        metadata.drop_all(engine)
+        engine.dispose()
+        os.remove(url.replace("sqlite:///", ""))
+
+
+async def names(queryset: ormar.QuerySet) -> List[str]:
+    return [item.name for item in await queryset.all()]
+
+
+@pytest.mark.asyncio
+async def test_reads_are_spread_between_replicas_and_writes_go_to_primary():
+    async with primary, replicas[0], replicas[1]:
+        results = [(await Item.objects.get()).name for _ in range(4)]
+        assert results == ["replica1", "replica2", "replica1", "replica2"]
+        assert await Item.objects.values_list("name", flatten=True) == ["replica1"]
+        assert [x.name async for x in Item.objects.iterate()] == ["replica2"]
+
+        await Item.objects.create(name="new")
+        assert await Item.objects.count() == 1
+        assert await Item.objects.filter(name="new").exists() is False
+
+        async with primary.transaction():
+            assert await names(Item.objects) == ["primary", "new"]
+            assert await Item.objects.filter(name="new").exists() is True
+
+        await Item.objects.filter(name="new").delete()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_queries_are_run_on_replicas():
+    async with primary, replicas[0], replicas[1]:
+        category = await Category.objects.prefetch_related("items").get()
+        items_replica = "replica2" if category.name == "replica1" else "replica1"
+        assert [item.name for item in category.items] == [items_replica]
+
+
+@pytest.mark.asyncio
+async def test_reads_after_write_go_to_primary_in_the_same_context():
+    async with primary, replicas[0], replicas[1]:
+
+        async def write_and_read() -> List[str]:
+            await StickyItem.objects.filter(id=1).update(name="updated")
+            return await names(StickyItem.objects)
+
+        assert await names(StickyItem.objects) == ["replica1"]
+        assert await asyncio.create_task(write_and_read()) == ["updated"]
+        assert await names(StickyItem.objects) == ["replica2"]
+
+        await StickyItem(id=2, name="saved").save()
+        assert await names(StickyItem.objects) == ["updated", "saved"]
+        await StickyItem.objects.filter(id=2).delete()
+        await StickyItem.objects.filter(id=1).update(name="primary")
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_with_lowest_latency():
+    async with primary, replicas[0], replicas[1]:
+        router = FastItem.ormar_config.replica_router
+        router.latencies.clear()
+
+        assert await names(FastItem.objects) == ["replica1"]
+        assert await names(FastItem.objects) == ["replica2"]
+        assert set(router.latencies) == set(replicas)
+
+        router.latencies[replicas[0]] = 10.0
+        assert await names(FastItem.objects) == ["replica2"]
+        assert await names(FastItem.objects) == ["replica2"]
+        router.record_latency(replicas[1], 100.0)
+        assert await names(FastItem.objects) == ["replica1"]
+
+
+@pytest.mark.asyncio
+async def test_slow_replica_is_probed_again():
+    async with primary, replicas[0], replicas[1]:
+        router = FastItem.ormar_config.replica_router
+        router.latencies.clear()
+        router.record_latency(replicas[0], 100.0)
+        router.record_latency(replicas[1], 0.0)
+
+        results = [
+            name
+            for _ in range(LATENCY_PROBE_INTERVAL)
+            for name in await names(FastItem.objects)
+        ]
+        assert results.count("replica1") == 1
+        assert router.latencies[replicas[0]] < 100.0
@@ -0,0 +1,118 @@
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.models.model_row import ModelRow
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Publisher(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="row_plan_publishers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, nullable=True)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="row_plan_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    label: str = ormar.String(max_length=100)
+
+
+class Article(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="row_plan_articles")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    body: str = ormar.Text(nullable=True)
+    publisher: Optional[Publisher] = ormar.ForeignKey(Publisher)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def plan_counter(monkeypatch):
+    calls = []
+    original = ModelRow.build_row_plan.__func__
+
+    def counting_build_row_plan(cls, *args, **kwargs):
+        if not kwargs.get("related_field"):
+            calls.append(cls)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ModelRow, "build_row_plan", classmethod(counting_build_row_plan)
+    )
+    yield calls
+
+
+async def create_sample_data():
+    publisher = await Publisher.objects.create(name="Penguin")
+    news = await Tag.objects.create(label="news")
+    tech = await Tag.objects.create(label="tech")
+    for num in range(3):
+        article = await Article.objects.create(
+            title=f"Article {num}", body="Lorem", publisher=publisher
+        )
+        await article.tags.add(news)
+        await article.tags.add(tech)
+
+
+@pytest.mark.asyncio
+async def test_row_plan_is_resolved_once_per_query(plan_counter):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            plan_counter.clear()
+
+            articles = (
+                await Article.objects.select_related(["publisher", "tags"])
+                .order_by(["id", "tags__id"])
+                .all()
+            )
+            assert plan_counter == [Article]
+            assert len(articles) == 3
+            for article in articles:
+                assert article.publisher.name == "Penguin"
+                assert [tag.label for tag in article.tags] == ["news", "tech"]
+                assert article.tags[0].articletag is not None
+
+
+@pytest.mark.asyncio
+async def test_row_plan_respects_excluded_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            articles = (
+                await Article.objects.select_related("publisher")
+                .exclude_fields(["body", "publisher__name"])
+                .all()
+            )
+            assert len(articles) == 3
+            for article in articles:
+                assert article.body is None
+                assert article.publisher.pk is not None
+                assert article.publisher.name is None
+
+
+@pytest.mark.asyncio
+async def test_row_plan_is_reused_when_iterating(plan_counter):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            plan_counter.clear()
+
+            titles = []
+            async for article in Article.objects.select_related("tags").iterate():
+                assert len(article.tags) == 2
+                titles.append(article.title)
+            assert titles == ["Article 0", "Article 1", "Article 2"]
+            assert plan_counter == [Article]
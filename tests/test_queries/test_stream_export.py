@@ -0,0 +1,199 @@
+import csv
+import datetime
+import decimal
+import io
+import json
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.exceptions import QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="export_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="export_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="export_products")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    price: decimal.Decimal = ormar.Decimal(max_digits=10, decimal_places=2)
+    created: datetime.datetime = ormar.DateTime(
+        default=datetime.datetime(2024, 1, 1, 12, 30)
+    )
+    category: Optional[Category] = ormar.ForeignKey(Category)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag)
+
+
+class Attachment(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="export_attachments")
+
+    id: int = ormar.Integer(primary_key=True)
+    content: str = ormar.LargeBinary(max_length=100, represent_as_base64_str=True)
+    meta: Optional[dict] = ormar.JSON(nullable=True)
+    product: Optional[Product] = ormar.ForeignKey(Product)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def collect(generator) -> List[bytes]:
+    return [chunk async for chunk in generator]
+
+
+def parse_ndjson(chunks: List[bytes]) -> List[dict]:
+    return [json.loads(line) for line in b"".join(chunks).splitlines()]
+
+
+def parse_csv(chunks: List[bytes]) -> List[List[str]]:
+    return list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_follows_fields_and_relations():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            toys = await Category.objects.create(name="Toys")
+            red = await Tag.objects.create(name="red")
+            for i in range(5):
+                product = await Product.objects.create(
+                    name=f"Product {i}", price=decimal.Decimal("1.5"), category=toys
+                )
+            await product.tags.add(red)
+
+            chunks = await collect(
+                Product.objects.order_by("id").stream_export(batch_size=2)
+            )
+            assert len(chunks) == 3
+            rows = parse_ndjson(chunks)
+            assert len(rows) == 5
+            assert rows[0] == {
+                "id": 1,
+                "name": "Product 0",
+                "price": "1.50",
+                "created": "2024-01-01T12:30:00",
+                "category": 1,
+            }
+            assert rows == json.loads(
+                json.dumps(await Product.objects.order_by("id").values(), default=str)
+                .replace(" 12:30", "T12:30")
+                .replace('"1.5"', '"1.50"')
+            )
+
+            queryset = (
+                Product.objects.select_related(["category", "tags"])
+                .exclude_fields(["price", "created", "category__id"])
+                .filter(tags__name="red")
+            )
+            rows = parse_ndjson(await collect(queryset.stream_export()))
+            assert rows == [
+                {
+                    "id": 5,
+                    "name": "Product 4",
+                    "category": 1,
+                    "category__name": "Toys",
+                    "producttag__id": 1,
+                    "producttag__tag": 1,
+                    "producttag__product": 5,
+                    "tags__id": 1,
+                    "tags__name": "red",
+                }
+            ]
+            rows = parse_ndjson(
+                await collect(
+                    queryset.stream_export(
+                        fields=["name", "tags__name"], exclude_through=True
+                    )
+                )
+            )
+            assert rows == [
+                {"name": "Product 4", "category__name": "Toys", "tags__name": "red"}
+            ]
+
+            rows = parse_ndjson(
+                await collect(toys.products.stream_export(fields=["name"]))
+            )
+            assert [row["name"] for row in rows] == [f"Product {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_and_empty_results():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Product.objects.create(name='Ball, "red"', price=9)
+            await Product.objects.create(
+                name="Kite", price=decimal.Decimal("20.25"), created=None
+            )
+
+            chunks = await collect(
+                Product.objects.order_by("id").stream_export(format="csv")
+            )
+            assert parse_csv(chunks) == [
+                ["id", "name", "price", "created", "category"],
+                ["1", 'Ball, "red"', "9.00", "2024-01-01T12:30:00", ""],
+                ["2", "Kite", "20.25", "", ""],
+            ]
+
+            queryset = Product.objects.filter(name="Unknown")
+            assert await collect(queryset.stream_export()) == []
+            chunks = await collect(
+                queryset.stream_export(format=ormar.ExportFormat.csv, fields="name")
+            )
+            assert parse_csv(chunks) == [["name"]]
+
+            with pytest.raises(QueryDefinitionError):
+                await collect(Product.objects.stream_export(format="xml"))
+
+
+@pytest.mark.asyncio
+async def test_export_of_binary_and_json_columns():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            product = await Product.objects.create(name="Ball", price=9)
+            await Attachment.objects.create(
+                content=b"\xff\x00", meta={"size": [1, 2]}, product=product
+            )
+            await Attachment.objects.create(content=b"", product=product)
+
+            queryset = Attachment.objects.order_by("id").fields(
+                ["id", "content", "meta"]
+            )
+            assert parse_ndjson(await collect(queryset.stream_export())) == [
+                {"id": 1, "content": "/wA=", "meta": {"size": [1, 2]}},
+                {"id": 2, "content": "", "meta": None},
+            ]
+            chunks = await collect(queryset.stream_export(format="csv"))
+            assert parse_csv(chunks) == [
+                ["id", "content", "meta"],
+                ["1", "/wA=", '{"size":[1,2]}'],
+                ["2", "", ""],
+            ]
+
+            chunks = await collect(
+                Product.objects.select_related("attachments")
+                .fields(["name", "attachments__content"])
+                .order_by("attachments__id")
+                .stream_export(format="csv")
+            )
+            assert parse_csv(chunks) == [
+                ["name", "attachments__content"],
+                ["Ball", "/wA="],
+                ["Ball", ""],
+            ]
@@ -0,0 +1,152 @@
+import datetime
+import decimal
+import enum
+import uuid
+from typing import List, Optional
+
+import ormar
+import pydantic
+import pytest
+from pydantic import ValidationError, field_validator
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Size(enum.Enum):
+    SMALL = "SMALL"
+    LARGE = "LARGE"
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="trusted_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Label(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="trusted_labels")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="trusted_tags", trusted_load=True)
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+    @field_validator("name")
+    def validate_name(cls, v):
+        if " " in v:
+            raise ValueError("must not contain a space")
+        return v
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="trusted_products")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    price: decimal.Decimal = ormar.Decimal(max_digits=10, decimal_places=2)
+    size: Size = ormar.Enum(enum_class=Size)
+    uid: uuid.UUID = ormar.UUID(default=uuid.uuid4)
+    created: datetime.datetime = ormar.DateTime(default=datetime.datetime.now)
+    specs: pydantic.Json = ormar.JSON(nullable=True)
+    thumbnail: str = ormar.LargeBinary(
+        max_length=100, represent_as_base64_str=True, nullable=True
+    )
+    rating: int = ormar.Integer(default=5)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+    labels: Optional[List[Label]] = ormar.ManyToMany(Label)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    category = await Category.objects.create(name="Tools")
+    sale = await Label.objects.create(name="sale")
+    new = await Label.objects.create(name="new")
+    for num in range(3):
+        product = await Product.objects.create(
+            name=f"Hammer {num}",
+            price=decimal.Decimal("10.50"),
+            size=Size.LARGE,
+            specs={"weight": num, "tags": ["a", "b"]},
+            thumbnail=b"\x89PNG",
+            category=category,
+        )
+        await product.labels.add(sale)
+        await product.labels.add(new)
+
+
+@pytest.mark.asyncio
+async def test_trusted_load_matches_validated_load():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            queryset = Product.objects.select_related(["category", "labels"]).order_by(
+                ["id", "labels__id"]
+            )
+            validated = await queryset.trusted_load(False).all()
+            trusted = await queryset.trusted_load().all()
+
+            assert len(trusted) == 3
+            assert [product.model_dump() for product in trusted] == [
+                product.model_dump() for product in validated
+            ]
+            product = trusted[0]
+            assert product.size == Size.LARGE
+            assert product.specs == {"weight": 0, "tags": ["a", "b"]}
+            assert product.thumbnail == validated[0].thumbnail
+            assert product.category.products[0] == product
+            assert product.labels[0].productlabel.id is not None
+            assert product.saved
+
+
+@pytest.mark.asyncio
+async def test_trusted_load_with_excluded_fields_and_prefetch():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            product = (
+                await Product.objects.trusted_load()
+                .prefetch_related(["category", "labels"])
+                .exclude_fields(["specs", "rating", "category__name"])
+                .order_by("id")
+                .first()
+            )
+            assert product.specs is None
+            assert product.rating is None
+            assert product.category.name is None
+            assert [label.name for label in product.labels] == ["sale", "new"]
+
+            product.name = "Mallet"
+            assert not product.saved
+            await product.update(_columns=["name"])
+            await product.load()
+            assert product.name == "Mallet"
+
+
+@pytest.mark.asyncio
+async def test_trusted_load_set_in_config_skips_validators():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            with pytest.raises(ValidationError):
+                Tag(name="on sale")
+            await Tag.ormar_config.database.execute(
+                Tag.ormar_config.table.insert().values(name="on sale")
+            )
+
+            tag = await Tag.objects.get()
+            assert tag.name == "on sale"
+
+            with pytest.raises(ValidationError):
+                await Tag.objects.trusted_load(False).get()
@@ -0,0 +1,168 @@
+from typing import List, Optional
+
+import databases
+import ormar
+import pytest
+from ormar.exceptions import ModelPersistenceError, NoMatch
+from ormar.instrumentation import add_instrument, remove_instrument
+from ormar.relations import querysetproxy
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="many_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class DocumentTag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="many_documents_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    weight: int = ormar.Integer(default=1)
+
+
+class Document(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="many_documents")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag, through=DocumentTag)
+
+
+class Page(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="many_pages")
+
+    id: int = ormar.Integer(primary_key=True)
+    number: int = ormar.Integer()
+    document: Optional[Document] = ormar.ForeignKey(Document)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    executed = []
+    for method in ["execute", "fetch_all", "fetch_one"]:
+        original = getattr(databases.Database, method)
+
+        def counting(self, query, values=None, _original=original):
+            executed.append(query)
+            return _original(self, query, values)
+
+        monkeypatch.setattr(databases.Database, method, counting)
+    return executed
+
+
+@pytest.mark.asyncio
+async def test_add_many_and_remove_many_in_m2m_relation(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            document = await Document.objects.create(title="Report")
+            tags = [Tag(name=f"tag {num}") for num in range(2000)]
+            await Tag.objects.bulk_create(tags)
+            statements.clear()
+
+            await document.tags.add_many(tags, weight=5)
+            # rows are inserted in batches limited by sqlite bound parameters
+            assert len(statements) < 20
+            assert len(document.tags) == 2000
+            assert tags[0].documents[0] == document
+            assert await DocumentTag.objects.filter(weight=5).count() == 2000
+
+            statements.clear()
+            await document.tags.remove_many(tags[:1500])
+            assert len(statements) < 5
+            assert [tag.name for tag in document.tags] == [
+                f"tag {num}" for num in range(1500, 2000)
+            ]
+            assert document.tags[0] == tags[1500]
+            assert tags[1500] in document.tags and tags[0] not in document.tags
+            assert not tags[0].documents
+
+            document = await Document.objects.select_related("tags").get()
+            assert len(document.tags) == 500
+            assert document.tags[0].documenttag.weight == 5
+
+            with pytest.raises(NoMatch):
+                await document.tags.remove_many([tags[0]])
+            with pytest.raises(ModelPersistenceError):
+                await document.tags.add_many([Tag(name="new")])
+
+
+@pytest.mark.asyncio
+async def test_add_many_and_remove_many_in_reverse_relation():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            document = await Document.objects.create(title="Report")
+            saved = await Page.objects.create(number=0)
+            pages = [saved] + [Page(number=num) for num in range(1, 5)]
+            added = []
+
+            @ormar.post_relation_add(Document)
+            async def after_add(sender, instance, child, **kwargs):
+                added.append(child.number)
+
+            try:
+                await document.pages.add_many(pages)
+            finally:
+                Document.ormar_config.signals.post_relation_add.disconnect(after_add)
+
+            assert added == [0, 1, 2, 3, 4]
+            assert all(page.pk and page.document == document for page in pages)
+            assert await Page.objects.filter(document=document).count() == 5
+
+            await document.pages.remove_many(pages[:2])
+            assert [page.number for page in document.pages] == [2, 3, 4]
+            assert pages[0].document is None
+            assert await Page.objects.filter(document__isnull=True).count() == 2
+
+            await document.pages.remove_many(pages[2:4], keep_reversed=False)
+            assert [page.number for page in document.pages] == [4]
+            assert await Page.objects.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_remove_many_in_m2m_relation_is_atomic_and_tracked(monkeypatch):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            document = await Document.objects.create(title="Report")
+            tags = [await Tag.objects.create(name=f"tag {num}") for num in range(3)]
+            await document.tags.add_many(tags)
+
+            events = []
+            add_instrument(events.append)
+            original_track = querysetproxy.track
+            calls = []
+
+            async def failing_track(awaitable, expression):
+                calls.append(expression)
+                result = await original_track(awaitable, expression)
+                if len(calls) == 2:
+                    raise RuntimeError("Connection lost")
+                return result
+
+            monkeypatch.setattr(
+                querysetproxy, "get_bulk_batch_size", lambda **kwargs: 1
+            )
+            try:
+                await document.tags.remove_many(tags[:2])
+                assert events[-1].operation == "delete"
+                assert events[-1].model is DocumentTag
+                assert events[-1].relation == "Document.tags"
+                assert len(events[-1].expressions) == 2
+
+                monkeypatch.setattr(querysetproxy, "track", failing_track)
+                await document.tags.add_many(tags[:2])
+                with pytest.raises(RuntimeError):
+                    await document.tags.remove_many(tags)
+            finally:
+                remove_instrument(events.append)
+            assert len(calls) == 2
+            assert await DocumentTag.objects.count() == 3
@@ -0,0 +1,179 @@
+import asyncio
+from typing import List, Optional
+
+import databases
+import ormar
+import pytest
+from ormar.exceptions import NoMatch
+from ormar.instrumentation import add_instrument, remove_instrument
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="loader_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="loader_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class PostTag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="loader_posts_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    position: int = ormar.Integer(default=0)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="loader_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag, through=PostTag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    executed = []
+    for method in ["fetch_all", "fetch_one"]:
+        original = getattr(databases.Database, method)
+
+        def counting(self, query, values=None, _original=original):
+            executed.append(query)
+            return _original(self, query, values)
+
+        monkeypatch.setattr(databases.Database, method, counting)
+    return executed
+
+
+async def create_sample_data():
+    tags = [await Tag.objects.create(name=f"tag {num}") for num in range(3)]
+    for num in range(5):
+        author = await Author.objects.create(name=f"author {num}")
+        for post_num in range(num):
+            post = await author.posts.create(title=f"post {num}-{post_num}")
+            for position, tag in enumerate(tags[:post_num]):
+                await post.tags.add(tag, position=position)
+
+
+@pytest.mark.asyncio
+async def test_loads_reverse_relations_in_one_query(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            authors = await Author.objects.order_by("id").all()
+            statements.clear()
+
+            with ormar.BatchLoader():
+                results = await asyncio.gather(
+                    *[author.posts.all() for author in authors]
+                )
+
+            assert len(statements) == 1
+            assert [len(posts) for posts in results] == [0, 1, 2, 3, 4]
+            assert [post.title for post in authors[3].posts] == [
+                "post 3-0",
+                "post 3-1",
+                "post 3-2",
+            ]
+            assert all(
+                post.author.__repr__.__self__ is authors[3] for post in authors[3].posts
+            )
+
+            statements.clear()
+            await asyncio.gather(*[author.posts.all() for author in authors])
+            assert len(statements) == 5
+
+
+@pytest.mark.asyncio
+async def test_loads_many_to_many_relations_in_one_query(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            posts = await Post.objects.order_by("id").all()
+            statements.clear()
+
+            with ormar.BatchLoader():
+                results = await asyncio.gather(*[post.tags.all() for post in posts])
+                assert len(statements) == 1
+
+                filtered = await asyncio.gather(
+                    *[post.tags.filter(name="tag 0").all() for post in posts]
+                )
+                assert len(statements) == 1 + len(posts)
+
+            expected = await asyncio.gather(*[post.tags.all() for post in posts])
+            assert [[tag.name for tag in tags] for tags in results] == [
+                [tag.name for tag in tags] for tags in expected
+            ]
+            assert [len(tags) for tags in filtered] == [
+                min(len(tags), 1) for tags in expected
+            ]
+            assert [tag.posttag.position for tag in results[-1]] == [0, 1, 2]
+            assert posts[-1].tags[2].name == "tag 2"
+
+
+@pytest.mark.asyncio
+async def test_loads_models_in_one_query(statements):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            posts = await Post.objects.order_by("id").all()
+            assert posts[0].author.name is None
+            statements.clear()
+
+            with ormar.BatchLoader():
+                await asyncio.gather(*[post.author.load() for post in posts])
+
+                assert len(statements) == 1
+                assert [post.author.name for post in posts[:4]] == [
+                    "author 1",
+                    "author 2",
+                    "author 2",
+                    "author 3",
+                ]
+                assert all(post.author.saved for post in posts)
+
+                with pytest.raises(NoMatch):
+                    await Author(id=1000, name="missing").load()
+
+
+@pytest.mark.asyncio
+async def test_batched_queries_are_instrumented():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            authors = await Author.objects.order_by("id").all()
+            posts = await Post.objects.order_by("id").all()
+            events = []
+            add_instrument(events.append)
+            try:
+                with ormar.BatchLoader():
+                    await asyncio.gather(*[author.load() for author in authors])
+                    await asyncio.gather(*[author.posts.all() for author in authors])
+                    await asyncio.gather(*[post.tags.all() for post in posts])
+            finally:
+                remove_instrument(events.append)
+
+            assert [
+                (event.model, event.operation, event.relation, len(event.expressions))
+                for event in events
+            ] == [
+                (Author, "load", None, 1),
+                (Post, "all", "Author.posts", 1),
+                (PostTag, "all", "Post.tags", 1),
+            ]
@@ -0,0 +1,123 @@
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.queryset.queries.prefetch_query import RootNode, UniqueList
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="chunked_authors", prefetch_chunk_size=2, prefetch_concurrency=2
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Genre(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="chunked_genres")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="chunked_books", prefetch_chunk_size=3
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    genres: Optional[List[Genre]] = ormar.ManyToMany(Genre)
+
+
+class Shelf(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="chunked_shelves")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    executed = []
+    original = RootNode.fetch_rows
+
+    async def counting_fetch_rows(self, database, expr):
+        executed.append(expr)
+        return await original(self, database=database, expr=expr)
+
+    monkeypatch.setattr(RootNode, "fetch_rows", counting_fetch_rows)
+    return executed
+
+
+async def create_sample_data():
+    genres = [await Genre.objects.create(name=f"Genre {num}") for num in range(4)]
+    for num in range(7):
+        author = await Author.objects.create(name=f"Author {num}")
+        book = await Book.objects.create(title=f"Book {num}", author=author)
+        for genre in genres[: num % 4 + 1]:
+            await book.genres.add(genre)
+        await Shelf.objects.create(name=f"Shelf {num}", author=author)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_ids_are_split_into_chunks(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            queries.clear()
+
+            books = (
+                await Book.objects.prefetch_related(["author", "genres"])
+                .order_by("id")
+                .all()
+            )
+            # 7 authors and 7 books (for genres) in chunks of 3 ids
+            assert len(queries) == 6
+            assert [book.title for book in books] == [f"Book {num}" for num in range(7)]
+            for num, book in enumerate(books):
+                assert book.author.name == f"Author {num}"
+                assert [genre.name for genre in book.genres] == [
+                    f"Genre {genre}" for genre in range(num % 4 + 1)
+                ]
+
+
+@pytest.mark.asyncio
+async def test_chunked_prefetch_matches_select_related(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            queries.clear()
+
+            authors = (
+                await Author.objects.prefetch_related("shelfs")
+                .order_by(["id", "shelfs__name"])
+                .all()
+            )
+            assert len(queries) == 4
+            joined = (
+                await Author.objects.select_related("shelfs")
+                .order_by(["id", "shelfs__name"])
+                .all()
+            )
+            assert [author.model_dump() for author in authors] == [
+                author.model_dump() for author in joined
+            ]
+
+
+def test_unique_list_keeps_order_of_first_occurrence():
+    ids = UniqueList()
+    for item in [3, 1, 3, 2, 1]:
+        ids.append(item)
+    assert ids == [3, 1, 2]
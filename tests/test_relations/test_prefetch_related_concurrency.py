@@ -0,0 +1,147 @@
+import asyncio
+from typing import List, Optional
+
+import ormar
+import pytest
+from databases.core import Connection
+from ormar.queryset.queries import prefetch_query
+from ormar.queryset.queries.prefetch_query import RootNode
+from ormar.queryset.utils import new_connection
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Company(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="concurrent_companies")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Country(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="concurrent_countries")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="concurrent_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Car(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="concurrent_cars", prefetch_concurrency=3
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    company: Optional[Company] = ormar.ForeignKey(Company)
+    country: Optional[Country] = ormar.ForeignKey(Country)
+    tags: Optional[List[Tag]] = ormar.ManyToMany(Tag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture
+def in_flight(monkeypatch):
+    stats = {"current": 0, "max": 0, "queries": 0}
+    original = RootNode.fetch_rows
+
+    async def tracking_fetch_rows(self, database, expr):
+        stats["current"] += 1
+        stats["queries"] += 1
+        stats["max"] = max(stats["max"], stats["current"])
+        await asyncio.sleep(0.01)
+        try:
+            return await original(self, database=database, expr=expr)
+        finally:
+            stats["current"] -= 1
+
+    monkeypatch.setattr(RootNode, "fetch_rows", tracking_fetch_rows)
+    return stats
+
+
+async def create_sample_data():
+    toyota = await Company.objects.create(name="Toyota")
+    japan = await Country.objects.create(name="Japan")
+    hybrid = await Tag.objects.create(name="hybrid")
+    for name in ["Corolla", "Yaris"]:
+        car = await Car.objects.create(name=name, company=toyota, country=japan)
+        await car.tags.add(hybrid)
+
+
+def check_cars(cars):
+    assert [car.name for car in cars] == ["Corolla", "Yaris"]
+    for car in cars:
+        assert car.company.name == "Toyota"
+        assert car.country.name == "Japan"
+        assert [tag.name for tag in car.tags] == ["hybrid"]
+
+
+@pytest.mark.asyncio
+async def test_sibling_relations_are_prefetched_concurrently(in_flight):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            cars = (
+                await Car.objects.prefetch_related(["company", "country", "tags"])
+                .order_by("id")
+                .all()
+            )
+            check_cars(cars)
+            assert in_flight["queries"] == 3
+            assert in_flight["max"] == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_sequential_by_default(in_flight):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+
+            companies = await Company.objects.prefetch_related(
+                ["cars", "cars__country", "cars__tags"]
+            ).all()
+            assert [car.name for car in companies[0].cars] == ["Corolla", "Yaris"]
+            assert companies[0].cars[0].country.name == "Japan"
+            assert in_flight["max"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_prefetch_outside_transaction_uses_pool(monkeypatch):
+    connections = []
+
+    class TrackingConnection(Connection):
+        async def fetch_all(self, *args, **kwargs):
+            connections.append(self)
+            return await super().fetch_all(*args, **kwargs)
+
+    def tracking_connection(database):
+        connection = new_connection(database)
+        connection.__class__ = TrackingConnection
+        return connection
+
+    monkeypatch.setattr(prefetch_query, "new_connection", tracking_connection)
+    async with base_ormar_config.database:
+        await create_sample_data()
+        try:
+            cars = (
+                await Car.objects.prefetch_related(["company", "country", "tags"])
+                .order_by("id")
+                .all()
+            )
+            check_cars(cars)
+            assert len(connections) == 3
+        finally:
+            through = Car.ormar_config.model_fields["tags"].through
+            for model in [through, Car, Tag, Country, Company]:
+                await model.objects.delete(each=True)
@@ -0,0 +1,49 @@
+import pytest
+from ormar.exceptions import DatabasesVersionError
+from ormar.queryset import utils
+from ormar.queryset.utils import (
+    check_databases_internals,
+    get_transaction_stack,
+    is_in_transaction,
+    is_transaction_active,
+    new_connection,
+)
+
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+@pytest.mark.asyncio
+async def test_transaction_helpers():
+    database = base_ormar_config.database
+    async with database:
+        assert not is_in_transaction(database)
+        assert get_transaction_stack(database.connection()) == []
+
+        transaction = database.transaction()
+        async with transaction:
+            assert is_in_transaction(database)
+            assert get_transaction_stack(database.connection()) == [transaction]
+            assert is_transaction_active(transaction)
+        assert not is_transaction_active(transaction)
+        assert not is_in_transaction(database)
+
+
+@pytest.mark.asyncio
+async def test_new_connection_is_not_shared():
+    database = base_ormar_config.database
+    async with database:
+        async with new_connection(database) as connection:
+            assert connection is not database.connection()
+            assert await connection.fetch_val("SELECT 1") == 1
+
+
+def test_internals_checked_in_not_verified_versions(monkeypatch):
+    database = base_ormar_config.database
+    monkeypatch.setattr(utils, "VERIFIED_DATABASES_VERSIONS", set())
+
+    check_databases_internals(database, "_backend", "_global_connection")
+    with pytest.raises(DatabasesVersionError) as exc:
+        check_databases_internals(object(), "_backend")
+    assert "_backend of object" in str(exc.value)
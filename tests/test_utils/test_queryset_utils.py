@@ -20,6 +20,13 @@ def test_list_to_dict_translation():
     }
 
 
+def test_list_to_dict_translation_with_mutable_default():
+    tet_list = ["cars", "cars__country", "cars__tags"]
+    test = translate_list_to_dict(tet_list, default={})
+    assert test == {"cars": {"country": {}, "tags": {}}}
+    assert test["cars"]["country"] is not test["cars"]["tags"]
+
+
 def test_updating_dict_with_list():
     curr_dict = {
         "aa": Ellipsis,